@@ -1,14 +1,16 @@
 import asyncio
+import hashlib
+import json
 import logging
 import random
 import re
 import signal
-from collections.abc import Coroutine, Sequence
+from collections.abc import Awaitable, Coroutine, Sequence
 from contextlib import suppress
 from functools import partial, wraps
 from operator import itemgetter as get
 from pathlib import Path
-from typing import Any, Callable, Literal, cast, override
+from typing import TYPE_CHECKING, Any, Callable, Literal, cast, override
 
 from discord import (
     AllowedMentions,
@@ -21,14 +23,15 @@ from discord import (
     Member,
     Message,
     NotFound,
+    RawBulkMessageDeleteEvent,
+    RawMessageDeleteEvent,
     RawReactionActionEvent,
     TextChannel,
     Thread,
     VoiceChannel,
     Webhook,
 )
-from discord import utils as dutils
-from discord.abc import MISSING, Snowflake
+from discord.abc import MISSING, GuildChannel, Snowflake
 from discord.app_commands.errors import AppCommandError
 from discord.errors import IHateThe3SecondsTimeout
 from discord.ext import commands
@@ -47,9 +50,12 @@ from nanachan.discord.helpers import (
     WebhookMessage,
     get_multiplexing_level,
 )
+from nanachan.discord.listeners import ListenerRegistry
+from nanachan.discord.messages import MessageCache
 from nanachan.discord.reactions import ReactionListener, UnregisterListener
 from nanachan.extensions import load_extensions
 from nanachan.redis.base import get_valkey
+from nanachan.redis.commands import commands_hash
 from nanachan.settings import (
     ANAS_ID,
     BOT_ROOM_ID,
@@ -74,12 +80,21 @@ from nanachan.utils.misc import (
     not_none,
 )
 
+if TYPE_CHECKING:
+    from nanachan.extensions.easter_eggs import Bananas
+    from nanachan.extensions.quizz import Quizz
+
 log = logging.getLogger(__name__)
 console = get_console()
 
 PREFIX_REG = re.compile(f'{re.escape(PREFIX)}[a-zA-Z]')
 EMOJI_REG = re.compile(r':([^ :]+):')
 
+UNKNOWN_WEBHOOK = 10015
+
+# unchanged scopes still get synced once in a while, in case they were edited elsewhere
+COMMANDS_HASH_TTL = 7 * 24 * 3600
+
 
 def get_command_prefix(bot, message):
     if multiplexing_level := get_multiplexing_level(message):
@@ -99,9 +114,20 @@ class Bot(commands.AutoShardedBot):
         intents = Intents.default()
         intents.members = True
         intents.message_content = True
-        self.channel_listeners: dict[int, set[ChannelListener]] = {}
-        self.reaction_listeners: dict[int, ReactionListener] = {}
+        self.channel_listeners = ListenerRegistry[int, ChannelListener]('channel')
+        self.reaction_listeners = ListenerRegistry[int, ReactionListener]('reaction')
+        self.message_cache = MessageCache(self)
+        # {channel_id: webhook}, threads use the webhook of their parent
+        self.webhooks: dict[int, Webhook] = {}
+        self.webhook_fetches: dict[int, asyncio.Task[Webhook]] = {}
+        # built on first use, dropped whenever guilds or their emojis change
+        self._emoji_index: dict[str, Emoji] | None = None
         self._cogs: dict[str, commands.Cog] = {}
+        # {prefix: cog}, the cog with the first name in alphabetical order for each prefix
+        self._cog_prefixes: dict[str, commands.Cog] = {}
+        # cogs looked up on every message, set by the cogs themselves when (un)loaded
+        self.bananas_cog: Bananas | None = None
+        self.quizz_cog: Quizz | None = None
         self.commands_ready = asyncio.Event()
 
         super().__init__(
@@ -294,6 +320,7 @@ class Bot(commands.AutoShardedBot):
             await guild.system_channel.send(embed=embed)
 
     async def on_ready(self):
+        self.invalidate_emoji_index()
         await self.sync_commands()
         log.info('Ready')
 
@@ -336,12 +363,28 @@ class Bot(commands.AutoShardedBot):
                 await self.sync_commands()
                 log.info('Finished reloading application commands')
 
-    async def sync_commands(self):
-        log.info('syncing global commands')
-        await self.tree.sync()
-        async for guild in self.fetch_guilds():
-            log.info(f'syncing commands in {guild}')
+    def get_commands_hash(self, guild: Guild | None = None) -> str:
+        """Hash of the payload the tree would sync for the scope"""
+        payload = sorted(
+            (command.to_dict(self.tree) for command in self.tree.get_commands(guild=guild)),
+            key=lambda c: (c.get('type', 1), c['name']),
+        )
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    async def sync_commands(self, force: bool = False):
+        """Syncs the scopes whose commands changed since their last sync"""
+        for guild in (None, *self.guilds):
+            scope = 'global' if guild is None else str(guild.id)
+            payload_hash = self.get_commands_hash(guild)
+            if not force and await commands_hash.get(scope) == payload_hash:
+                log.debug(f'commands unchanged in {guild or "global scope"}')
+                continue
+
+            log.info(f'syncing commands in {guild or "global scope"}')
             await self.tree.sync(guild=guild)
+            await commands_hash.set(payload_hash, scope, expire=COMMANDS_HASH_TTL)
 
     async def invoke(self, ctx: MultiplexingContext):  # type: ignore # trust me bro
         try:
@@ -368,9 +411,11 @@ class Bot(commands.AutoShardedBot):
         if content is None:
             content = ctx.message.content
 
-        webhook = await ctx.get_user_webhook(**kwargs)
-        sent = await webhook.send(content=content)
+        async def send(webhook: Webhook):
+            proxy = ctx.wrap_user_webhook(webhook, **kwargs)
+            return proxy, await proxy.send(content=content)
 
+        webhook, sent = await self.with_webhook(ctx.webhook_channel, send)
         sent.author = ctx.author
         sent.channel = ctx.channel
         sent = WebhookMessage(sent, webhook)
@@ -393,17 +438,54 @@ class Bot(commands.AutoShardedBot):
     def get_anas(self, guild: Guild):
         return guild.get_member(ANAS_ID)
 
-    async def get_webhook(self, channel: TextChannel | ForumChannel | Thread):
+    async def get_webhook(self, channel: TextChannel | ForumChannel | Thread) -> Webhook:
         if isinstance(channel, Thread):
             assert channel.parent is not None
             channel = channel.parent
 
+        if (webhook := self.webhooks.get(channel.id)) is not None:
+            return webhook
+
+        # concurrent callers share the lookup, so a single 'bananas' webhook gets created
+        if (task := self.webhook_fetches.get(channel.id)) is None:
+            task = asyncio.create_task(self._fetch_webhook(channel))
+            self.webhook_fetches[channel.id] = task
+            task.add_done_callback(lambda _: self.webhook_fetches.pop(channel.id, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_webhook(self, channel: TextChannel | ForumChannel) -> Webhook:
         webhooks = await channel.webhooks()
-        for webhook in webhooks:
-            if webhook.token is not None:
-                return webhook
+        webhook = next((w for w in webhooks if w.token is not None), None)
+        if webhook is None:
+            webhook = await channel.create_webhook(name='bananas')
 
-        return await channel.create_webhook(name='bananas')
+        self.webhooks[channel.id] = webhook
+        return webhook
+
+    async def with_webhook[T](
+        self,
+        channel: TextChannel | ForumChannel | Thread,
+        func: Callable[[Webhook], Awaitable[T]],
+    ) -> T:
+        """Calls ``func`` with the channel webhook, again with a new one if it was deleted"""
+        webhook = await self.get_webhook(channel)
+        try:
+            return await func(webhook)
+        except NotFound as e:
+            if e.code != UNKNOWN_WEBHOOK:
+                raise
+            # deleted behind our back, get a new one
+            self.invalidate_webhook(channel)
+            return await func(await self.get_webhook(channel))
+
+    def invalidate_webhook(self, channel: Snowflake):
+        if isinstance(channel, Thread):
+            self.webhooks.pop(channel.parent_id, None)
+        else:
+            self.webhooks.pop(channel.id, None)
+
+    async def on_webhooks_update(self, channel: GuildChannel):
+        self.invalidate_webhook(channel)
 
     @override
     async def add_cog(
@@ -425,31 +507,68 @@ class Bot(commands.AutoShardedBot):
 
         await super().add_cog(cog, override=override, guild=guild, guilds=guilds)
         self._cogs[cog.qualified_name.casefold()] = cog
+        self._index_cogs()
+
+    @override
+    async def remove_cog(
+        self,
+        name: str,
+        /,
+        *,
+        guild: Snowflake | None = MISSING,
+        guilds: Sequence[Snowflake] = MISSING,
+    ) -> commands.Cog | None:
+        cog = await super().remove_cog(name, guild=guild, guilds=guilds)
+        if cog is not None:
+            self._cogs.pop(cog.qualified_name.casefold(), None)
+            self._index_cogs()
+        return cog
+
+    def _index_cogs(self):
+        self._cog_prefixes = {}
+        for key, cog in sorted(self._cogs.items(), key=get(0)):
+            for i in range(len(key) + 1):
+                self._cog_prefixes.setdefault(key[:i], cog)
 
     @override
     def get_cog(self, name: str) -> commands.Cog | None:
+        """Cog by name, or by a prefix of its name, or by a name extending its name"""
         name = name.casefold()
         if name in self._cogs:
             return self._cogs[name]
 
-        for key, cog in sorted(self._cogs.items(), key=get(0)):
-            if all(c1 == c2 for c1, c2 in zip(name, key)):
-                return cog
+        # cog names that are a prefix of name compete with the cogs prefixed by name
+        candidates = [(k, c) for i in range(1, len(name)) if (c := self._cogs.get(k := name[:i]))]
+        if (cog := self._cog_prefixes.get(name)) is not None:
+            candidates.append((cog.qualified_name.casefold(), cog))
+        if candidates:
+            return min(candidates, key=get(0))[1]
 
     async def register_reaction_listener(
         self, message_id: int, reaction_listener: ReactionListener
     ):
-        if old_listener := self.reaction_listeners.get(message_id):
+        if old_listener := self.reaction_listeners.first(message_id):
             reactions_old = list(old_listener.get_cls_handlers()['add'].keys())
             reactions_new = list(reaction_listener.get_cls_handlers()['add'].keys())
             if reactions_old != reactions_new:
-                await self.reaction_listeners[message_id].unregister()
-
-        self.reaction_listeners[message_id] = reaction_listener
+                await old_listener.unregister()
+            else:
+                self.reaction_listeners.remove(message_id, old_listener)
+
+        self.reaction_listeners.add(
+            message_id,
+            reaction_listener,
+            ttl=reaction_listener.timeout,
+            on_expire=lambda listener: listener.unregister(),
+        )
         await reaction_listener.add_reactions()
 
-    async def unregister_reaction_listener(self, message_id: int) -> None:
-        if listener := self.reaction_listeners.pop(message_id, None):
+    async def unregister_reaction_listener(
+        self, message_id: int, listener: ReactionListener | None = None
+    ) -> None:
+        if listener is None:
+            listener = self.reaction_listeners.first(message_id)
+        if listener is not None and self.reaction_listeners.remove(message_id, listener):
             if not listener.done_fut.done():
                 listener.unregister()
             await listener.clear_reactions()
@@ -457,7 +576,7 @@ class Bot(commands.AutoShardedBot):
     async def _on_raw_reaction(
         self, payload: RawReactionActionEvent, action: Literal['add', 'remove']
     ):
-        if reaction_listener := self.reaction_listeners.get(payload.message_id):
+        if reaction_listener := self.reaction_listeners.first(payload.message_id):
             await reaction_listener.on_reaction(payload, action)
 
     async def on_raw_reaction_add(self, payload: RawReactionActionEvent):
@@ -466,17 +585,53 @@ class Bot(commands.AutoShardedBot):
     async def on_raw_reaction_remove(self, payload: RawReactionActionEvent):
         await self._on_raw_reaction(payload, 'remove')
 
-    async def on_raw_message_delete(self, payload: RawReactionActionEvent):
-        if listener := self.reaction_listeners.get(payload.message_id, None):
+    async def on_raw_message_delete(self, payload: RawMessageDeleteEvent):
+        self.message_cache.invalidate(payload.message_id)
+        if listener := self.reaction_listeners.first(payload.message_id):
             listener.unregister()
 
+    async def on_raw_bulk_message_delete(self, payload: RawBulkMessageDeleteEvent):
+        for message_id in payload.message_ids:
+            self.message_cache.invalidate(message_id)
+            if listener := self.reaction_listeners.first(message_id):
+                listener.unregister()
+
+    @property
+    def emoji_index(self) -> dict[str, Emoji]:
+        """Custom emojis by name, the first guild having a name wins"""
+        if self._emoji_index is None:
+            index: dict[str, Emoji] = {}
+            for guild in self.guilds:
+                for emoji in guild.emojis:
+                    index.setdefault(emoji.name, emoji)
+            self._emoji_index = index
+        return self._emoji_index
+
+    def invalidate_emoji_index(self):
+        self._emoji_index = None
+
+    async def on_guild_emojis_update(
+        self, guild: Guild, before: Sequence[Emoji], after: Sequence[Emoji]
+    ):
+        self.invalidate_emoji_index()
+
+    async def on_guild_join(self, guild: Guild):
+        self.invalidate_emoji_index()
+
+    async def on_guild_remove(self, guild: Guild):
+        self.invalidate_emoji_index()
+
+    async def on_guild_available(self, guild: Guild):
+        self.invalidate_emoji_index()
+
+    async def on_guild_unavailable(self, guild: Guild):
+        self.invalidate_emoji_index()
+
     def get_nana_emoji(self, name: str) -> Emoji | None:
         if name == 'saladedefruits' and random.random() <= 0.05:
             name = 'slddfrts'
 
-        for guild in self.guilds:
-            if emoji := dutils.get(guild.emojis, name=name):
-                return emoji
+        return self.emoji_index.get(name)
 
     def get_emoji_str(self, name: str) -> str:
         if emoji := self.get_nana_emoji(name):
@@ -498,18 +653,16 @@ class Bot(commands.AutoShardedBot):
 
     @override
     async def on_message(self, message: Message):
-        if listeners := self.channel_listeners.get(message.channel.id):
-            for listener in listeners.copy():
-                try:
-                    await listener.on_message(message)
-                except UnregisterListener:
-                    self.unregister_channel_listener(listener)
+        for listener in self.channel_listeners.get(message.channel.id):
+            try:
+                await listener.on_message(message)
+            except UnregisterListener:
+                self.unregister_channel_listener(listener)
 
         await super().on_message(message)
 
     def register_channel_listener(self, channel_id: int, listener: ChannelListener):
-        self.channel_listeners.setdefault(channel_id, set())
-        self.channel_listeners[channel_id].add(listener)
+        self.channel_listeners.add(channel_id, listener)
 
     def unregister_channel_listener(self, listener: ChannelListener):
-        self.channel_listeners[listener.channel.id].remove(listener)
+        self.channel_listeners.remove(listener.channel.id, listener)
@@ -51,7 +51,6 @@ from nanachan.utils.misc import default_backoff, run_coro, truncate_at
 
 if TYPE_CHECKING:
     from nanachan.discord.bot import Bot
-    from nanachan.extensions.easter_eggs import Bananas
 
 
 __all__ = (
@@ -245,19 +244,24 @@ class MultiplexingContext(commands.Context['Bot']):
         tuple[Callable[[MultiplexingContext], bool], asyncio.Future[MultiplexingContext]]
     ] = []
 
-    async def get_user_webhook(
+    @property
+    def webhook_channel(self) -> TextChannel | ForumChannel | Thread:
+        if self.guild is None:
+            raise RuntimeError('Webhook cannot be created outside of a guild')
+        assert isinstance(self.channel, (TextChannel, ForumChannel, Thread))
+        return self.channel
+
+    def wrap_user_webhook(
         self,
+        base: Webhook,
         app_cmd_context: bool = False,
         user: User | None = None,
     ) -> 'WebhookProxy':
+        """Wraps the webhook of webhook_channel to send as the user"""
         if user is None:
             user = cast(User, self.author)
 
-        if self.guild is None:
-            raise RuntimeError('Webhook cannot be created outside of a guild')
-        assert isinstance(self.channel, (TextChannel, ForumChannel, Thread))
-        webhook = await self.bot.get_webhook(self.channel)
-        webhook = CheckEmptyWebhook(webhook)
+        webhook = CheckEmptyWebhook(base)
         webhook = UserWebhook(webhook, user)
 
         if not app_cmd_context:
@@ -279,7 +283,7 @@ class MultiplexingContext(commands.Context['Bot']):
 
     @cached_property
     def bananased(self) -> bool:
-        bananas_cog = cast('Bananas | None', self.bot.get_cog('Bananas'))
+        bananas_cog = self.bot.bananas_cog
         if bananas_cog is not None:
             if perms := getattr(self.author, 'guild_permissions', None):
                 bananas_cmd = getattr(self, 'command', None) in (
@@ -312,7 +316,7 @@ class MultiplexingContext(commands.Context['Bot']):
         self.amqed: bool = getattr(message, 'amqed', False)
         super().__init__(message=message, **attrs)
 
-        if quizz_cog := self.bot.get_cog('Quizz'):
+        if quizz_cog := self.bot.quizz_cog:
             imaaaage = re.match(rf'{re.escape(PREFIX)}ima+ge', self.message.stripped_content)
             if imaaaage is not None:
                 self.command = cast(Command, quizz_cog.image)  # type: ignore # I don't even get it
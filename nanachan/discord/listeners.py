@@ -0,0 +1,109 @@
+import logging
+from collections.abc import Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from nanachan.utils.scheduler import get_scheduler
+
+logger = logging.getLogger(__name__)
+
+__all__ = ('LISTENER_METRICS_INTERVAL', 'ListenerRegistry', 'ListenerStats')
+
+LISTENER_METRICS_INTERVAL = 3600
+
+
+@dataclass
+class ListenerStats:
+    registered: int = 0
+    unregistered: int = 0
+    expired: int = 0
+
+
+class ListenerRegistry[K: Hashable, L]:
+    """Listeners indexed by key (channel id, message id…).
+
+    Every key maps to an immutable tuple, replaced on (un)registration, so dispatch is a
+    dict lookup and iterates without copying. A listener can be given a deadline, kept in
+    the shared scheduler heap.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.listeners: dict[K, tuple[L, ...]] = {}
+        self.stats = ListenerStats()
+        self.live = 0
+
+    def __len__(self) -> int:
+        return self.live
+
+    def __contains__(self, key: K) -> bool:
+        return key in self.listeners
+
+    def get(self, key: K) -> tuple[L, ...]:
+        return self.listeners.get(key, ())
+
+    def first(self, key: K) -> L | None:
+        listeners = self.listeners.get(key)
+        return listeners[0] if listeners else None
+
+    def add(
+        self,
+        key: K,
+        listener: L,
+        *,
+        ttl: float | None = None,
+        on_expire: Callable[[L], Any] | None = None,
+    ):
+        """Registers ``listener`` under ``key``.
+
+        After ``ttl`` seconds, ``on_expire`` is called with the listener if given, else the
+        listener is simply removed.
+        """
+        self.listeners[key] = self.get(key) + (listener,)
+        self.live += 1
+        self.stats.registered += 1
+
+        if ttl is not None:
+            get_scheduler().schedule_in(
+                ttl, lambda: self._expire(key, listener, on_expire), key=self._job_key(listener)
+            )
+
+        metrics_key = ('listener_metrics', self.name)
+        if metrics_key not in get_scheduler():
+            get_scheduler().schedule_in(LISTENER_METRICS_INTERVAL, self.log_metrics, metrics_key)
+
+    def remove(self, key: K, listener: L) -> bool:
+        listeners = self.listeners.get(key, ())
+        if listener not in listeners:
+            return False
+
+        if remaining := tuple(li for li in listeners if li is not listener):
+            self.listeners[key] = remaining
+        else:
+            del self.listeners[key]
+        self.live -= 1
+        self.stats.unregistered += 1
+
+        get_scheduler().cancel(self._job_key(listener))
+        return True
+
+    def _job_key(self, listener: L) -> Hashable:
+        return ('listener', self.name, id(listener))
+
+    def _expire(self, key: K, listener: L, on_expire: Callable[[L], Any] | None):
+        if listener not in self.get(key):
+            return
+
+        self.stats.expired += 1
+        if on_expire is not None:
+            return on_expire(listener)
+        self.remove(key, listener)
+
+    def log_metrics(self):
+        get_scheduler().schedule_in(
+            LISTENER_METRICS_INTERVAL, self.log_metrics, ('listener_metrics', self.name)
+        )
+        logger.info(
+            f'{self.name} listeners: {self.live} live on {len(self.listeners)} keys '
+            f'{asdict(self.stats)}'
+        )
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from nanachan.discord.bot import Bot
+
+__all__ = ('MESSAGE_CACHE_SIZE', 'MessageCache')
+
+MESSAGE_CACHE_SIZE = 1024
+
+PARTIAL_MESSAGE_CHANNELS = (
+    discord.TextChannel,
+    discord.Thread,
+    discord.VoiceChannel,
+    discord.StageChannel,
+    discord.DMChannel,
+)
+
+
+class MessageCache:
+    """LRU of message handles, shared by the cogs that edit messages they did not just send.
+
+    Only partial messages (channel and message ids) are kept: they are enough to edit,
+    delete, pin or reply without fetching, and they cannot go stale. Handles are dropped
+    when their message is deleted.
+    """
+
+    def __init__(self, bot: Bot, size: int = MESSAGE_CACHE_SIZE):
+        self.bot = bot
+        self.size = size
+        self.handles: OrderedDict[int, discord.PartialMessage] = OrderedDict()
+        self.fetching: dict[int, asyncio.Task[discord.Message]] = {}
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def __contains__(self, message_id: int) -> bool:
+        return message_id in self.handles
+
+    def get(self, channel_id: int, message_id: int) -> discord.PartialMessage:
+        if (handle := self.handles.get(message_id)) is not None:
+            self.handles.move_to_end(message_id)
+            return handle
+
+        channel = self.bot.get_channel(channel_id)
+        if not isinstance(channel, PARTIAL_MESSAGE_CHANNELS):
+            channel = self.bot.get_partial_messageable(channel_id)
+
+        handle = self.handles[message_id] = channel.get_partial_message(message_id)
+        if len(self.handles) > self.size:
+            self.handles.popitem(last=False)
+        return handle
+
+    async def fetch(self, channel_id: int, message_id: int) -> discord.Message:
+        """Full message, for callers that need its content or reactions.
+
+        The message itself is not cached, concurrent fetches of the same message share
+        a single request.
+        """
+        if (task := self.fetching.get(message_id)) is None:
+            task = asyncio.create_task(self.get(channel_id, message_id).fetch())
+            self.fetching[message_id] = task
+            task.add_done_callback(lambda _: self.fetching.pop(message_id, None))
+        return await asyncio.shield(task)
+
+    def invalidate(self, message_id: int):
+        self.handles.pop(message_id, None)
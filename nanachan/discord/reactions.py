@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections import OrderedDict
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable
 from contextlib import suppress
-from functools import partial
+from functools import cache, partial
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
 import discord
@@ -19,7 +20,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-__all__ = ('UnregisterListener', 'ReactionHandler', 'ReactionListener')
+__all__ = (
+    'UnregisterListener',
+    'ReactionHandler',
+    'ReactionListener',
+    'ReactionScheduler',
+    'get_reaction_scheduler',
+)
 
 
 T = TypeVar('T')
@@ -29,6 +36,38 @@ class UnregisterListener(Exception):
     pass
 
 
+class ReactionScheduler:
+    """Runs reaction I/O one operation at a time per message, messages in parallel.
+
+    Rate limits are left to discord.py, which holds requests back on the bucket of their
+    route: reactions of a channel share a bucket, other channels are not slowed down.
+    """
+
+    def __init__(self):
+        self.locks: dict[int, asyncio.Lock] = {}
+        self.pending: Counter[int] = Counter()
+
+    async def run(self, message_id: int, aw: Awaitable[T]) -> T:
+        lock = self.locks.setdefault(message_id, asyncio.Lock())
+        self.pending[message_id] += 1
+        try:
+            async with lock:
+                return await aw
+        finally:
+            self.pending[message_id] -= 1
+            if self.pending[message_id] == 0:
+                del self.pending[message_id]
+                del self.locks[message_id]
+
+    def submit(self, message_id: int, aw: Awaitable[T]) -> asyncio.Task[T]:
+        return asyncio.create_task(self.run(message_id, aw))
+
+
+@cache
+def get_reaction_scheduler() -> ReactionScheduler:
+    return ReactionScheduler()
+
+
 class ReactionHandler:
     def __init__(
         self,
@@ -47,8 +86,8 @@ class ReactionHandler:
     def __call__(self, listener, user, remove_reaction=True):
         message = listener.message
         if remove_reaction and self.remove_reaction and message.guild is not None:
-            asyncio.create_task(
-                ignore(discord.NotFound, message.remove_reaction(self.reaction, user))
+            get_reaction_scheduler().submit(
+                message.id, ignore(discord.NotFound, message.remove_reaction(self.reaction, user))
             )
 
         func = fake_method(listener, self.func)
@@ -104,8 +143,8 @@ class HandlerException(Exception):
 class ReactionListener(metaclass=MetaReactionListener):
     _cls_reaction_handlers: dict[str, dict[str, ReactionHandler]]
 
-    prefetch_lock = asyncio.Lock()
-    PREFETCH_DELAY = 5
+    # seconds before the listener unregisters itself, None to keep it until unregistered
+    timeout: float | None = None
 
     def __init__(
         self,
@@ -150,20 +189,14 @@ class ReactionListener(metaclass=MetaReactionListener):
             asyncio.create_task(self.check_reactions())
 
     async def prefetch_message(self):
-        async with ReactionListener.prefetch_lock:
-            if self.channel_id is None:
-                return
-
-            if self.message is None:
-                return
-
-            if channel := self.bot.get_channel(self.channel_id):
-                try:
-                    await self.get_message(channel)
-                except discord.NotFound:
-                    logger.info(f'could not find message {self.message_id}')
+        if self.channel_id is None or self.message is None:
+            return
 
-                await asyncio.sleep(ReactionListener.PREFETCH_DELAY)
+        if channel := self.bot.get_channel(self.channel_id):
+            try:
+                await self.get_message(channel)
+            except discord.NotFound:
+                logger.info(f'could not find message {self.message_id}')
 
     def get_cls_handlers(self) -> dict[str, dict[str, ReactionHandler]]:
         return self.__class__._cls_reaction_handlers
@@ -193,7 +226,7 @@ class ReactionListener(metaclass=MetaReactionListener):
         for reaction in self.message.reactions:
             handler = self.get_handler('add', reaction.emoji)
             if handler is None:
-                asyncio.create_task(reaction.clear())
+                get_reaction_scheduler().submit(self.message_id, reaction.clear())
             elif reaction.count > 1 and handler.remove_reaction:
                 async for user in reaction.users():
                     if not user.bot and user != self.bot.user:
@@ -202,18 +235,27 @@ class ReactionListener(metaclass=MetaReactionListener):
     async def clear_reactions(self):
         if self.message is not None:
             with suppress(discord.NotFound):
-                await self.message.clear_reactions()
+                await get_reaction_scheduler().run(self.message_id, self.message.clear_reactions())
 
     async def add_reactions(self):
         if self.message is None:
             return
 
-        for handler in self._reaction_handlers_order:
-            await self.message.add_reaction(self.get_reaction(handler.reaction))
+        # one job for the whole set, in order, skipping the ones already there
+        message = self.message
+        present = {str(r.emoji) for r in getattr(message, 'reactions', ()) if r.me}
+        emojis = [self.get_reaction(h.reaction) for h in self._reaction_handlers_order]
+        emojis = [e for e in dict.fromkeys(emojis) if str(e) not in present]
+
+        async def add_all():
+            for emoji in emojis:
+                await message.add_reaction(emoji)
+
+        await get_reaction_scheduler().run(self.message_id, add_all())
 
     async def get_message(self, channel):
         if self.message is None or isinstance(self.message, discord.WebhookMessage):
-            self.message = cast(discord.Message, await channel.fetch_message(self.message_id))
+            self.message = await self.bot.message_cache.fetch(channel.id, self.message_id)
             asyncio.create_task(self.check_reactions())
 
         return self.message
@@ -247,8 +289,9 @@ class ReactionListener(metaclass=MetaReactionListener):
                 raise HandlerException(self) from e
 
     def unregister(self):
-        self.done_fut.set_result(None)
-        return asyncio.create_task(self.bot.unregister_reaction_listener(self.message_id))
+        if not self.done_fut.done():
+            self.done_fut.set_result(None)
+        return asyncio.create_task(self.bot.unregister_reaction_listener(self.message_id, self))
 
     async def done(self):
         await self.done_fut
@@ -372,7 +372,7 @@ class AutoNavigatorView(NavigatorView):
             yield None
 
     @classmethod
-    def _create_pages(
+    def create_pages(
         cls,
         title: str | None = None,
         description: str | None = None,
@@ -444,7 +444,7 @@ class AutoNavigatorView(NavigatorView):
         attachments: list[discord.File] | None = None,
         **kwargs,
     ):
-        pages = cls._create_pages(
+        pages = cls.create_pages(
             title=title,
             description=description,
             colour=colour,
@@ -4,6 +4,7 @@ import logging
 import textwrap
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any
 
 import discord
 from discord import AllowedMentions, app_commands
@@ -204,8 +205,16 @@ class AI(Cog, required_settings=RequiresAI):
             if user_id := config.get('impersonate'):
                 impersonated_user = ctx.bot.get_user(user_id)
                 assert impersonated_user
-                webhook = await ctx.get_user_webhook(user=impersonated_user)
-                send = webhook.send
+
+                async def send_as_user(**kwargs: Any):
+                    return await ctx.bot.with_webhook(
+                        ctx.webhook_channel,
+                        lambda webhook: ctx.wrap_user_webhook(
+                            webhook, user=impersonated_user
+                        ).send(**kwargs),
+                    )
+
+                send = send_as_user
             else:
                 send = (
                     ctx.message.reply
@@ -1172,19 +1172,26 @@ class AMQ(Cog, required_settings=RequiresAMQ):
     async def on_amq_message(self, data, private=False):
         amq_room = self.bot.get_text_channel(AMQ_ROOM)
         assert amq_room is not None
-        webhook = await self.bot.get_webhook(amq_room)
 
         d_user = await self._amq_to_discord(data['sender'])
         content = self.bot.get_emojied_str(data['message'])
 
         if d_user:
-            webhook = AMQWebhook(webhook, private=private, user=d_user)
-            msg = await webhook.send(content=content)
+            msg = await self.bot.with_webhook(
+                amq_room,
+                lambda webhook: AMQWebhook(webhook, private=private, user=d_user).send(
+                    content=content
+                ),
+            )
             await self.bot.on_message(msg)
         else:
             username = data['sender']
-            webhook = AMQWebhook(webhook, private=private, display_name=username)
-            await webhook.send(content=content)
+            await self.bot.with_webhook(
+                amq_room,
+                lambda webhook: AMQWebhook(webhook, private=private, display_name=username).send(
+                    content=content
+                ),
+            )
 
     @Cog.listener()
     async def on_user_message(self, ctx: MultiplexingContext):
@@ -1,14 +1,14 @@
 import asyncio
-import bisect
 import json
 import logging
 import re
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import timedelta
+from functools import partial
 from importlib import resources
-from operator import attrgetter
 from random import choice
-from typing import MutableSequence, Optional, Union
+from typing import Optional, Union
+from uuid import UUID
 
 import discord
 from discord import (
@@ -26,6 +26,7 @@ from discord import (
     Thread,
     User,
     VoiceChannel,
+    Webhook,
     app_commands,
 )
 from discord.abc import Messageable
@@ -57,9 +58,10 @@ from nanachan.nanapi.model import (
     ReminderInsertSelectResult,
     ReminderSelectAllResult,
 )
-from nanachan.settings import SLASH_PREFIX, TZ, RequiresAI
+from nanachan.settings import SLASH_PREFIX, RequiresAI
 from nanachan.utils.ai import get_model_config
 from nanachan.utils.misc import get_session, saucenao_lookup, tldr_get_page
+from nanachan.utils.scheduler import get_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -80,9 +82,7 @@ class BasicCommands(Cog, name='Basic Commands'):
     def __init__(self, bot: Bot):
         super().__init__(bot)
         self.to_be_quoted_messages: dict[int, Message] = {}  # {user_id: (channel_id, message_id)}
-        self.reminders_processor_task = None
-        self.reminders_processor_task_sleep = None
-        self.reminders: MutableSequence[ReminderSelectAllResult | ReminderInsertSelectResult] = []
+        self.reminder_ids: set[UUID] = set()
         self.agent = Agent()
 
     @Cog.listener()
@@ -91,55 +91,39 @@ class BasicCommands(Cog, name='Basic Commands'):
         resp = resp.raise_exc()
         reminders = resp.result
         logger.info(f'reminders:{len(reminders)} reminders enqueued')
-        self.reminders = sorted(reminders, key=attrgetter('timestamp'))
 
-        if not self.reminders_processor_task:
-            self.reminders_processor_task_done = False
-            self.reminders_processor_task = asyncio.create_task(self.reminders_processor())
+        # nanapi is the source of truth, undelivered reminders are still there after a restart
+        for reminder_id in self.reminder_ids - {r.id for r in reminders}:
+            get_scheduler().cancel(('reminder', reminder_id))
+        self.reminder_ids.clear()
+        for reminder in reminders:
+            self.schedule_reminder(reminder)
 
     async def cog_unload(self):
-        self.reminders_processor_task_done = True
-        if self.reminders_processor_task_sleep:
-            self.reminders_processor_task_sleep.cancel()
-
-    async def _reminders_processor(self):
-        now = datetime.now(tz=TZ)
-        sleep_time = 7200
-
-        if not self.reminders:
-            logger.info('no reminders to process')
-
-        elif self.reminders[0].timestamp <= now:
-            past_reminder = self.reminders.pop(0)
-            channel = self.bot.get_channel_type(int(past_reminder.channel_id), Messageable)
-            if channel is None:
-                channel = self.bot.get_bot_room()
-
-            reminder_message = f'<@{past_reminder.user.discord_id}>! Just a reminder!'
-            if past_reminder.message:
-                reminder_message += f' {past_reminder.message}!'
-            await channel.send(reminder_message)
-            resp = await get_nanapi().reminder.reminder_delete_reminder(past_reminder.id)
-            resp = resp.raise_exc()
-            sleep_time = 0
-
-        else:
-            time_to_reminder = (self.reminders[0].timestamp - now).total_seconds()
-            sleep_time = min(time_to_reminder, sleep_time)
-
-        logger.info(f'reminder:wait for {sleep_time}s')
-        self.reminders_processor_task_sleep = asyncio.create_task(asyncio.sleep(sleep_time))
-        try:
-            await self.reminders_processor_task_sleep
-        except asyncio.CancelledError:
-            pass
+        for reminder_id in self.reminder_ids:
+            get_scheduler().cancel(('reminder', reminder_id))
+        self.reminder_ids.clear()
+
+    def schedule_reminder(self, reminder: ReminderSelectAllResult | ReminderInsertSelectResult):
+        self.reminder_ids.add(reminder.id)
+        get_scheduler().schedule(
+            reminder.timestamp,
+            partial(self.send_reminder, reminder),
+            key=('reminder', reminder.id),
+        )
 
-    async def reminders_processor(self):
-        while not self.reminders_processor_task_done:
-            try:
-                await self._reminders_processor()
-            except Exception as e:
-                logger.exception(e)
+    async def send_reminder(self, reminder: ReminderSelectAllResult | ReminderInsertSelectResult):
+        self.reminder_ids.discard(reminder.id)
+        channel = self.bot.get_channel_type(int(reminder.channel_id), Messageable)
+        if channel is None:
+            channel = self.bot.get_bot_room()
+
+        reminder_message = f'<@{reminder.user.discord_id}>! Just a reminder!'
+        if reminder.message:
+            reminder_message += f' {reminder.message}!'
+        await channel.send(reminder_message)
+        resp = await get_nanapi().reminder.reminder_delete_reminder(reminder.id)
+        resp = resp.raise_exc()
 
     async def _get_embed_for_quote(self, ctx):
         pinned_message = MultiplexingMessage(self.to_be_quoted_messages[ctx.author.id])
@@ -219,7 +203,6 @@ class BasicCommands(Cog, name='Basic Commands'):
             raise commands.CommandError("You can't move messages to the same channel.")
 
         async with ctx.channel.typing():
-            webhook = await self.bot.get_webhook(destination)
             start_id = discord.Object(start_msg.id - 1)
             if end_msg is not None:
                 end_id = discord.Object(end_msg.id + 1)
@@ -227,6 +210,28 @@ class BasicCommands(Cog, name='Basic Commands'):
                 end_id = ctx.message
 
             mentions = ctx.message.mentions
+            thread = destination if isinstance(destination, Thread) else MISSING
+
+            async def send(webhook: Webhook, message: Message):
+                try:
+                    content = message.content
+                except Exception:
+                    content = MISSING
+                # sent files are closed, so each attempt gets its own
+                try:
+                    file = await message.attachments[0].to_file()
+                except Exception:
+                    file = MISSING
+
+                await webhook.send(
+                    content=content,
+                    embeds=message.embeds,
+                    file=file,
+                    username=message.author.display_name,
+                    avatar_url=message.author.display_avatar.url,
+                    wait=True,
+                    thread=thread,
+                )
 
             async with ctx.channel.typing():
                 async with destination.typing():
@@ -235,30 +240,10 @@ class BasicCommands(Cog, name='Basic Commands'):
                             limit=None, after=start_id, before=end_id, oldest_first=True
                         ):
                             if not mentions or (message.author in mentions):
-                                try:
-                                    content = message.content
-                                except Exception:
-                                    content = MISSING
-                                try:
-                                    file = await message.attachments[0].to_file()
-                                except Exception:
-                                    file = MISSING
-
-                                if isinstance(destination, Thread):
-                                    thread = destination
-                                else:
-                                    thread = MISSING
-
-                                self.bot.loop.create_task(message.delete())
-                                await webhook.send(
-                                    content=content,
-                                    embeds=message.embeds,
-                                    file=file,
-                                    username=message.author.display_name,
-                                    avatar_url=message.author.display_avatar.url,
-                                    wait=True,
-                                    thread=thread,
+                                await self.bot.with_webhook(
+                                    destination, partial(send, message=message)
                                 )
+                                self.bot.loop.create_task(message.delete())
 
                 await ctx.message.delete()
 
@@ -386,9 +371,7 @@ class BasicCommands(Cog, name='Basic Commands'):
         )
         resp = resp.raise_exc()
         reminder = resp.result
-        bisect.insort(self.reminders, reminder, key=attrgetter('timestamp'))
-        if self.reminders_processor_task_sleep:
-            self.reminders_processor_task_sleep.cancel()
+        self.schedule_reminder(reminder)
 
         await interaction.response.send_message(
             f'Reminder "{message}" set for <t:{int(dt.timestamp())}:f>', ephemeral=True
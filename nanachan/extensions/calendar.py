@@ -1,6 +1,8 @@
 import asyncio
 import logging
+from collections import defaultdict
 from contextlib import suppress
+from dataclasses import dataclass, field
 from datetime import datetime
 
 import discord
@@ -22,18 +24,41 @@ from nanachan.discord.bot import Bot
 from nanachan.discord.cog import Cog
 from nanachan.discord.helpers import Members, MultiplexingContext
 from nanachan.extensions.projection import ProjectionCog
-from nanachan.nanapi.client import get_nanapi
-from nanachan.nanapi.model import ParticipantAddBody, UpsertUserCalendarBody
+from nanachan.nanapi.client import batch, get_nanapi
+from nanachan.nanapi.model import UpsertUserCalendarBody
 from nanachan.settings import NANALOOK_URL, NANAPI_CLIENT_USERNAME, NANAPI_PUBLIC_URL, TZ
-from nanachan.utils.calendar import reconcile_participants, upsert_event
-from nanachan.utils.projection import get_active_projo
+from nanachan.utils.calendar import (
+    add_participant,
+    forget_event,
+    remove_participant,
+    sync_event,
+    upsert_event,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PendingUpsert:
+    event: ScheduledEvent
+    # user id -> user to add, or None to remove
+    participants: dict[int, User | None] = field(default_factory=dict)
+    refresh_embed: bool = False
+
+
 class Calendar_Generator(Cog, name='Calendar'):
     emoji = '📅'
 
+    SYNC_CONCURRENCY = 4
+    UPSERT_DELAY = 5
+
+    def __init__(self, bot: Bot):
+        super().__init__(bot)
+        self.sync_task: asyncio.Task[None] | None = None
+        self.pending_upserts: dict[int, PendingUpsert] = {}
+        self.flush_tasks: dict[int, asyncio.Task[None]] = {}
+        self.flush_locks: dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
     @Cog.listener()
     async def on_ready(self):
         from .profiles import Profiles
@@ -42,7 +67,9 @@ class Calendar_Generator(Cog, name='Calendar'):
         if profiles_cog is not None:
             profiles_cog.registrars['Calendar'] = self.register
 
-        asyncio.create_task(self.sync_all_events())
+        # reconnects trigger on_ready again, let an ongoing sync finish instead
+        if self.sync_task is None or self.sync_task.done():
+            self.sync_task = asyncio.create_task(self.sync_all_events())
 
     async def register(self, interaction: discord.Interaction):
         """Register or change a member calendar"""
@@ -77,13 +104,28 @@ class Calendar_Generator(Cog, name='Calendar'):
 
         db_events = {int(e.discord_id): e for e in resp.result}
         all_events = {e.id: e for guild in self.bot.guilds for e in guild.scheduled_events}
-        for discord_id, event in db_events.items():
-            if discord_id not in all_events:
-                logger.debug(f'Deleting event {event.name} ({discord_id})')
-                await get_nanapi().calendar.calendar_delete_guild_event(str(discord_id))
-        for discord_id, event in all_events.items():
-            await upsert_event(self.bot, event)
-            await reconcile_participants(event, db_events.get(discord_id))
+        async with batch() as b:
+            for discord_id, event in db_events.items():
+                if discord_id not in all_events:
+                    logger.debug(f'Deleting event {event.name} ({discord_id})')
+                    b.submit(get_nanapi().calendar.calendar_delete_guild_event(str(discord_id)))
+                    b.submit(forget_event(discord_id))
+
+        semaphore = asyncio.Semaphore(self.SYNC_CONCURRENCY)
+
+        async def sync_guild(guild: discord.Guild):
+            synced = 0
+            async with semaphore:
+                for event in guild.scheduled_events:
+                    try:
+                        synced += await sync_event(self.bot, event, db_events.get(event.id))
+                    except Exception as e:
+                        logger.exception(e)
+            logger.info(f'Synced {synced}/{len(guild.scheduled_events)} events in {guild}')
+
+        async with asyncio.TaskGroup() as tg:
+            for guild in self.bot.guilds:
+                tg.create_task(sync_guild(guild))
         logger.info('Done syncing all events')
 
     @nana_command(description='Get my calendar ics link')
@@ -99,7 +141,12 @@ class Calendar_Generator(Cog, name='Calendar'):
             mention = ', '.join(u.mention for u in users)
         else:
             if isinstance(interaction.channel, discord.Thread):
-                projo = await get_active_projo(interaction.channel.id)
+                projo_cog = ProjectionCog.get_cog(self.bot)
+                projo = (
+                    projo_cog.state.active_projos.get(interaction.channel.id)
+                    if projo_cog is not None
+                    else None
+                )
                 if projo:
                     url = URL(NANALOOK_URL) / str(projo.id)
                     await interaction.response.send_message(
@@ -133,38 +180,84 @@ class Calendar_Generator(Cog, name='Calendar'):
 
     @Cog.listener()
     async def on_scheduled_event_delete(self, event: ScheduledEvent):
-        logger.debug(f'Deleting event {event.name} ({event.id})')
-        resp = await get_nanapi().calendar.calendar_delete_guild_event(str(event.id))
-        resp = resp.raise_exc()
+        # a late flush would recreate the event
+        self.pending_upserts.pop(event.id, None)
+        if (task := self.flush_tasks.pop(event.id, None)) is not None:
+            task.cancel()
+
+        # and so would a flush already running, let it finish first
+        async with self.flush_locks[event.id]:
+            logger.debug(f'Deleting event {event.name} ({event.id})')
+            try:
+                resp = await get_nanapi().calendar.calendar_delete_guild_event(str(event.id))
+                resp = resp.raise_exc()
+                await forget_event(event.id)
+            finally:
+                if event.id not in self.flush_tasks:
+                    self.flush_locks.pop(event.id, None)
         db_event = resp.result
         if db_event.projection:
             projo_cog = ProjectionCog.get_cog(self.bot)
             if projo_cog is not None:
-                asyncio.create_task(projo_cog.update_projo_embed(db_event.projection))
+                thread_id = int(db_event.projection.channel_id)
+                projo_cog.state.schedule_render(thread_id, refresh=True)
 
     @Cog.listener()
     async def on_scheduled_event_update(self, before: ScheduledEvent, after: ScheduledEvent):
-        db_event = await upsert_event(self.bot, after)
-        if db_event.projection:
-            projo_cog = ProjectionCog.get_cog(self.bot)
-            if projo_cog is not None:
-                asyncio.create_task(projo_cog.update_projo_embed(db_event.projection))
+        self.schedule_upsert(after).refresh_embed = True
 
     @Cog.listener()
     async def on_scheduled_event_user_add(self, event: ScheduledEvent, user: User):
-        await upsert_event(self.bot, event)
-        body = ParticipantAddBody(participant_username=str(user))
-        resp = await get_nanapi().calendar.calendar_add_guild_event_participant(
-            str(event.id), str(user.id), body
-        )
-        resp = resp.raise_exc()
+        self.schedule_upsert(event).participants[user.id] = user
 
     @Cog.listener()
     async def on_scheduled_event_user_remove(self, event: ScheduledEvent, user: User):
-        resp = await get_nanapi().calendar.calendar_remove_guild_event_participant(
-            str(event.id), str(user.id)
-        )
-        resp = resp.raise_exc()
+        self.schedule_upsert(event).participants[user.id] = None
+
+    def schedule_upsert(self, event: ScheduledEvent) -> PendingUpsert:
+        """Coalesces gateway bursts into a single upsert per event every UPSERT_DELAY"""
+        pending = self.pending_upserts.get(event.id)
+        if pending is None:
+            pending = self.pending_upserts[event.id] = PendingUpsert(event)
+        else:
+            # last state wins
+            pending.event = event
+
+        if event.id not in self.flush_tasks:
+            self.flush_tasks[event.id] = asyncio.create_task(self.flush_upsert(event.id))
+
+        return pending
+
+    async def flush_upsert(self, event_id: int):
+        await asyncio.sleep(self.UPSERT_DELAY)
+
+        # flushes of the same event run one after the other
+        async with self.flush_locks[event_id]:
+            # changes from now on go to the next flush
+            del self.flush_tasks[event_id]
+            pending = self.pending_upserts.pop(event_id)
+
+            try:
+                # also forgets the fingerprint, before any participant is written
+                db_event = await upsert_event(self.bot, pending.event)
+                async with batch() as b:
+                    for user_id, user in pending.participants.items():
+                        if user is not None:
+                            b.submit(add_participant(event_id, user))
+                        else:
+                            b.submit(remove_participant(event_id, user_id))
+            except Exception as e:
+                logger.exception(e)
+                return
+            finally:
+                if event_id not in self.flush_tasks:
+                    del self.flush_locks[event_id]
+
+        if pending.refresh_embed and db_event.projection:
+            projo_cog = ProjectionCog.get_cog(self.bot)
+            if projo_cog is not None:
+                thread_id = int(db_event.projection.channel_id)
+                projo_cog.state.schedule_render(thread_id, refresh=True)
 
     @Cog.listener()
     async def on_voice_state_update(self, member: Member, before: VoiceState, after: VoiceState):
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import re
+from functools import partial
 from random import Random
 from typing import Optional, cast
 
@@ -13,6 +14,7 @@ from nanachan.discord.helpers import MultiplexingContext
 from nanachan.extensions.waicolle import WaifuCollection
 from nanachan.redis.wasabi import wasabi_count
 from nanachan.settings import DEBUG, WASABI_FREQUENCY, WASABI_RANGE
+from nanachan.utils.scheduler import get_scheduler
 
 log = logging.getLogger(__name__)
 
@@ -101,7 +103,7 @@ class Wasabi(Cog):
 class Ignored(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
-        self.ignored_member_ids = {}  # {member_id: unignore_timer}
+        self.ignored_member_ids: set[int] = set()
 
         # Monkey patch bot.dispatch
         self.bot_dispatch = bot.dispatch
@@ -133,8 +135,10 @@ class Ignored(Cog):
         if period > 60 * 24:
             raise CommandError('Ignoring for more than one day is harsh')
 
-        timer = self.bot.loop.call_later(period * 60, self._unignore, anas)
-        self.ignored_member_ids[anas.id] = timer
+        self.ignored_member_ids.add(anas.id)
+        get_scheduler().schedule_in(
+            period * 60, partial(self._unignore, anas), key=('ignored', anas.id)
+        )
 
         await ctx.send(':ok_hand:')
 
@@ -146,14 +150,14 @@ class Ignored(Cog):
             assert anas is not None
 
         if anas.id in self.ignored_member_ids:
-            self.ignored_member_ids[anas.id].cancel()
+            get_scheduler().cancel(('ignored', anas.id))
             self._unignore(anas)
             await ctx.send(':ok_hand:')
         else:
             await ctx.send(f'{anas.mention} is not ignored')
 
     def _unignore(self, anas: Member):
-        del self.ignored_member_ids[anas.id]
+        self.ignored_member_ids.discard(anas.id)
 
     def _dispatch(self, event_name, *args, **kwargs):
         if event_name == 'message':
@@ -171,7 +175,14 @@ class Ignored(Cog):
 class Bananas(Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.bananased_member_ids = {}  # {member_id: timer}
+        self.bananased_member_ids: set[int] = set()
+
+    async def cog_load(self):
+        self.bot.bananas_cog = self
+
+    async def cog_unload(self):
+        if self.bot.bananas_cog is self:
+            self.bot.bananas_cog = None
 
     async def bananas_perm(self, ctx, anas: Member, period: int):
         if anas.id in self.bananased_member_ids:
@@ -198,8 +209,10 @@ class Bananas(Cog):
             assert anas is not None
 
         if await self.bananas_perm(ctx, anas, period):
-            timer = self.bot.loop.call_later(period * 60, self._unbananas, anas)
-            self.bananased_member_ids[anas.id] = timer
+            self.bananased_member_ids.add(anas.id)
+            get_scheduler().schedule_in(
+                period * 60, partial(self._unbananas, anas), key=('bananas', anas.id)
+            )
 
             await ctx.send(':ok_hand:')
 
@@ -211,14 +224,14 @@ class Bananas(Cog):
             assert anas is not None
 
         if anas.id in self.bananased_member_ids:
-            self.bananased_member_ids[anas.id].cancel()
+            get_scheduler().cancel(('bananas', anas.id))
             self._unbananas(anas)
             await ctx.send(':ok_hand:')
         else:
             await ctx.send(f'{anas.mention} is not :banana:')
 
     def _unbananas(self, anas: Member):
-        del self.bananased_member_ids[anas.id]
+        self.bananased_member_ids.discard(anas.id)
 
     def _bananas(self, message: str):
         new_message = ':banana:'
@@ -1,6 +1,9 @@
+import logging
 import re
-from random import choice
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import time
+from collections import OrderedDict
+from random import randrange
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from discord import Message
@@ -9,37 +12,67 @@ from discord.ext import commands
 from nanachan.discord.bot import Bot
 from nanachan.discord.cog import Cog
 from nanachan.discord.helpers import MultiplexingContext, UserType
-from nanachan.discord.views import AutoNavigatorView
+from nanachan.discord.views import AutoNavigatorView, NavigatorView
 from nanachan.nanapi.client import Error, get_nanapi
-from nanachan.nanapi.model import NewHistoireBody
+from nanachan.nanapi.model import HistoireGetByIdResult, NewHistoireBody
+from nanachan.redis.histoire import draft_parts, draft_titles
 
 if TYPE_CHECKING:
     from discord.abc import MessageableChannel
 
+logger = logging.getLogger(__name__)
+
+STORY_INDEX_TTL = 3600
+STORY_PAGES_CACHE_SIZE = 16
+
 
 class StoryBuilder:
-    def __init__(self, title: str) -> None:
-        self._title: str = self.format_title(title)
-        self._parts: List[str] = []
+    """Story being recorded, its draft is kept in Valkey to survive restarts"""
 
-    def set_title(self, title: str):
+    def __init__(self, title: str, draft_key: str, parts: List[str] | None = None) -> None:
+        self._title: str = self.format_title(title)
+        self._draft_key = draft_key
+        self._parts: List[str] = [] if parts is None else parts
+
+    @classmethod
+    async def create(cls, title: str, draft_key: str) -> 'StoryBuilder':
+        builder = cls(title, draft_key)
+        await draft_parts.delete(draft_key)
+        await draft_titles.set(builder._title, draft_key)
+        return builder
+
+    @classmethod
+    async def restore(cls, draft_key: str) -> Optional['StoryBuilder']:
+        title = await draft_titles.get(draft_key)
+        if title is None:
+            return None
+        return cls(title, draft_key, await draft_parts.get(draft_key))
+
+    async def set_title(self, title: str):
         self._title = self.format_title(title)
+        await draft_titles.set(self._title, self._draft_key)
 
     @staticmethod
     def format_title(title: str) -> str:
         return re.sub(r'\s+', ' ', title).capitalize()
 
-    def store(self, text: str) -> int:
+    async def store(self, text: str) -> int:
         self._parts.append(text)
+        await draft_parts.append(text, self._draft_key)
 
         return self.get_parts_len()
 
-    def undo(self) -> int:
+    async def undo(self) -> int:
         if len(self._parts) > 0:
             self._parts.pop()
+            await draft_parts.pop(self._draft_key)
 
         return self.get_parts_len()
 
+    async def discard(self):
+        await draft_titles.delete(self._draft_key)
+        await draft_parts.delete(self._draft_key)
+
     def get_parts_len(self) -> int:
         return len(self._parts)
 
@@ -48,6 +81,51 @@ class StoryBuilder:
         return dict(title=self._title, text=text)
 
 
+class StoryIndex:
+    """Ids and titles of the stored stories, with O(1) random sampling"""
+
+    def __init__(self) -> None:
+        self.titles: Dict[UUID, str] = {}
+        self.ids: List[UUID] = []
+        self.positions: Dict[UUID, int] = {}
+        self.loaded_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def is_stale(self) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > STORY_INDEX_TTL
+
+    async def load(self):
+        resp = await get_nanapi().histoire.histoire_histoire_index()
+        resp = resp.raise_exc()
+        self.titles.clear()
+        self.ids.clear()
+        self.positions.clear()
+        for story in resp.result:
+            self.add(story.id, story.title)
+        self.loaded_at = time.monotonic()
+
+    def add(self, story_id: UUID, title: str):
+        if story_id not in self.positions:
+            self.positions[story_id] = len(self.ids)
+            self.ids.append(story_id)
+        self.titles[story_id] = title
+
+    def remove(self, story_id: UUID):
+        if (position := self.positions.pop(story_id, None)) is None:
+            return
+        # swap with the last id so removal is O(1) too
+        last = self.ids.pop()
+        if last != story_id:
+            self.ids[position] = last
+            self.positions[last] = position
+        del self.titles[story_id]
+
+    def sample(self) -> UUID:
+        return self.ids[randrange(len(self.ids))]
+
+
 class Histoire(Cog):
     """Tell your story or that of the greatest heroes of our times"""
 
@@ -59,6 +137,43 @@ class Histoire(Cog):
     def __init__(self, bot: Bot):
         super().__init__(bot)
         self.story_builders_by_channel_user: Dict[Tuple[int, int], StoryBuilder] = {}
+        self.story_index = StoryIndex()
+        # {story_id: pages}, most recently read last
+        self.story_pages: OrderedDict[UUID, List[Dict[str, Any]]] = OrderedDict()
+        self.drafts_restored = False
+
+    @staticmethod
+    def draft_key(channel_id: int, user_id: int) -> str:
+        return f'{channel_id}-{user_id}'
+
+    @Cog.listener()
+    async def on_ready(self):
+        if self.drafts_restored:
+            return
+        self.drafts_restored = True
+
+        async for draft_key, _ in draft_titles.get_all():
+            channel_id, user_id = map(int, draft_key.split('-'))
+            if (builder := await StoryBuilder.restore(draft_key)) is not None:
+                self.story_builders_by_channel_user[(channel_id, user_id)] = builder
+        logger.info(f'{len(self.story_builders_by_channel_user)} story drafts restored')
+
+    async def get_story_index(self) -> StoryIndex:
+        if self.story_index.is_stale():
+            await self.story_index.load()
+        return self.story_index
+
+    def get_story_pages(self, story: HistoireGetByIdResult) -> List[Dict[str, Any]]:
+        if (pages := self.story_pages.get(story.id)) is None:
+            pages = AutoNavigatorView.create_pages(title=story.title, description=story.text)
+            self.story_pages[story.id] = pages
+            if len(self.story_pages) > STORY_PAGES_CACHE_SIZE:
+                self.story_pages.popitem(last=False)
+        else:
+            self.story_pages.move_to_end(story.id)
+
+        # page dicts get their page number added when displayed
+        return [dict(page) for page in pages]
 
     @Cog.listener()
     async def on_user_message(self, ctx: MultiplexingContext) -> None:
@@ -68,7 +183,7 @@ class Histoire(Cog):
         builder = self.story_builders_by_channel_user.get((channel.id, user.id))
         conditions = [builder is not None, ctx.command is None]
         if builder is not None and all(conditions):
-            parts_count = builder.store(message.content)
+            parts_count = await builder.store(message.content)
             await ctx.send(f'{parts_count} parts cached')
 
     @commands.group(invoke_without_command=True, help='Tell you a story (in french)')
@@ -81,17 +196,12 @@ class Histoire(Cog):
             except ValueError:
                 raise commands.BadArgument(f'Invalid subcommand `{story_id}`')
 
-        # Check if database contains at least one story
-        resp = await get_nanapi().histoire.histoire_histoire_index()
-        resp = resp.raise_exc()
-        stories = resp.result
-        story_ids = [story.id for story in stories]
-        if len(story_ids) == 0:
-            raise commands.CommandError('No story has been added yet')
-
         # Select a random story if id not specified
         if not _story_id:
-            _story_id = choice(story_ids)
+            story_index = await self.get_story_index()
+            if len(story_index) == 0:
+                raise commands.CommandError('No story has been added yet')
+            _story_id = story_index.sample()
 
         # Fetch the story
         resp = await get_nanapi().histoire.histoire_get_histoire(_story_id)
@@ -103,9 +213,7 @@ class Histoire(Cog):
 
         story = resp.result
 
-        await AutoNavigatorView.create(
-            self.bot, ctx.reply, title=story.title, description=story.text
-        )
+        await NavigatorView.create(self.bot, ctx.reply, pages=self.get_story_pages(story))
 
     @histoire.command(help='Start the creation of a story')
     async def start(self, ctx: commands.Context, *, title: str) -> None:
@@ -116,11 +224,12 @@ class Histoire(Cog):
         # Check a story is not already recording
         channel: 'MessageableChannel' = ctx.channel
         user = ctx.author
-        if (channel, user) in self.story_builders_by_channel_user:
+        if (channel.id, user.id) in self.story_builders_by_channel_user:
             raise commands.CommandError('A story is already being recorded in this channel')
 
         # Start the recording
-        self.story_builders_by_channel_user[(channel.id, user.id)] = StoryBuilder(title)
+        builder = await StoryBuilder.create(title, self.draft_key(channel.id, user.id))
+        self.story_builders_by_channel_user[(channel.id, user.id)] = builder
 
         # Tells the user everything is ok
         message: Message = ctx.message
@@ -136,7 +245,7 @@ class Histoire(Cog):
             raise commands.CommandError('Nothing to save')
 
         # Remove last part
-        parts_count = builder.undo()
+        parts_count = await builder.undo()
 
         # Tells the user everything is ok
         await ctx.send(f'{parts_count} parts cached')
@@ -156,15 +265,17 @@ class Histoire(Cog):
 
         # Change story title if needed
         if title is not None:
-            builder.set_title(title)
+            await builder.set_title(title)
 
         # Create the new story in database
         story = builder.to_story()
         resp = await get_nanapi().histoire.histoire_new_histoire(NewHistoireBody(**story))
         resp = resp.raise_exc()
+        self.story_index.add(resp.result.id, story['title'])
 
         # Stop recording
         del self.story_builders_by_channel_user[(channel.id, user.id)]
+        await builder.discard()
 
         # Tells the user the cancellation has been done
         await ctx.message.add_reaction(self.ok_hand)
@@ -174,11 +285,12 @@ class Histoire(Cog):
         # Check a story is recording
         channel: 'MessageableChannel' = ctx.channel
         user: UserType = ctx.author
-        if (channel.id, user.id) not in self.story_builders_by_channel_user:
+        builder = self.story_builders_by_channel_user.pop((channel.id, user.id), None)
+        if builder is None:
             raise commands.CommandError('Nothing to cancel')
 
         # Cancel story creation
-        del self.story_builders_by_channel_user[(channel.id, user.id)]
+        await builder.discard()
 
         # Tells the user the cancellation has been done
         await ctx.message.add_reaction(self.ok_hand)
@@ -198,15 +310,15 @@ class Histoire(Cog):
         if deleted is None:
             raise commands.CommandError(f'Story with id {story_id} does not exist')
 
+        self.story_index.remove(deleted.id)
+        self.story_pages.pop(deleted.id, None)
+
         await ctx.send(f'{deleted.id} has been deleted')
 
     @histoire.command(help='List available stories')
     async def list(self, ctx: commands.Context) -> None:
-        resp = await get_nanapi().histoire.histoire_histoire_index()
-        resp = resp.raise_exc()
-        stories_resp = resp.result
-        # Fetch all stories from database
-        stories = [f'{story.id}: {story.title}' for story in stories_resp]
+        story_index = await self.get_story_index()
+        stories = [f'{story_id}: {title}' for story_id, title in story_index.titles.items()]
 
         # Show list
         if stories:
@@ -1,19 +1,14 @@
 import asyncio
-import bisect
-import os
 import re
-from collections import defaultdict
-from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from io import BytesIO
 from operator import attrgetter, itemgetter
+from typing import override
 
-import aiofiles
-import aiofiles.os
-import aiojobs
 from discord import FFmpegPCMAudio, File, app_commands
 from discord.ext.commands import BadArgument
-from matplotlib import dates, pyplot, ticker
 
 from nanachan.discord.application_commands import legacy_command
 from nanachan.discord.bot import Bot
@@ -23,18 +18,15 @@ from nanachan.extensions.audio import Audio, PlaylistEntry, TrackInfo
 from nanachan.settings import (
     IGNORED_TIMERS,
     KARA_BASE,
+    KARA_INDEX,
     RequiresKaraoke,
 )
+from nanachan.utils.karaoke import KaraIndex, KaraSong, render_timer_graph
 from nanachan.utils.misc import list_display
 
 MUGEN_DOMAIN = 'kara.moe'
 
-
-@dataclass
-class KaraSong:
-    name: str
-    path: str
-    lyrics: list[str]
+GRAPH_CACHE_SIZE = 32
 
 
 class CancellableMessage(ConfirmationView):
@@ -61,6 +53,23 @@ class Date(date):
 class Karaoke(NanaGroupCog, group_name='kara', required_settings=RequiresKaraoke):
     emoji = '🎤'
 
+    def __init__(self):
+        assert KARA_BASE is not None
+        self.index = KaraIndex(KARA_BASE, KARA_INDEX)
+        # one render at a time, matplotlib styles are process-wide
+        self.graph_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='karagraph')
+        # {(username, begin, end, index version): png}
+        self.graph_cache: OrderedDict[tuple[str, date | None, date, int], bytes] = OrderedDict()
+
+    @override
+    async def cog_load(self):
+        self.index.start()
+
+    @override
+    async def cog_unload(self):
+        await self.index.stop()
+        self.graph_executor.shutdown(wait=False)
+
     @app_commands.command(description='Play a karaoke (with lyrics!)')
     @legacy_command()
     async def play(self, ctx, *, search_tags: str):
@@ -79,9 +88,7 @@ class Karaoke(NanaGroupCog, group_name='kara', required_settings=RequiresKaraoke
             await audio.add_to_playlist(PlaylistEntry(kara, send_karaoke, kara.name))
 
         async with ctx.typing():
-            karaokes = list(
-                sorted(await self._find_karaokes(regex=search_tags), key=attrgetter('name'))
-            )
+            karaokes = await self._find_karaokes(search_tags)
             if not karaokes:
                 await ctx.send(f'Cannot find karaoke with tags "{search_tags}"')
             elif len(karaokes) == 1:
@@ -107,19 +114,19 @@ class Karaoke(NanaGroupCog, group_name='kara', required_settings=RequiresKaraoke
     async def graph(
         self, ctx, username: str, begin_str: str | None = None, end_str: str | None = None
     ):
-        begin: datetime | None = None
-        end: datetime | None = None
+        begin: date | None = None
+        end: date | None = None
 
         if begin_str is not None:
             try:
-                begin = datetime.fromisoformat(begin_str)
+                begin = date.fromisoformat(begin_str)
             except ValueError:
                 await ctx.send('begin format should be YYYY-MM-DD')
                 return
 
         if end_str is not None:
             try:
-                end = datetime.fromisoformat(end_str)
+                end = date.fromisoformat(end_str)
             except ValueError:
                 await ctx.send('end format should be YYYY-MM-DD')
                 return
@@ -131,49 +138,10 @@ class Karaoke(NanaGroupCog, group_name='kara', required_settings=RequiresKaraoke
         async with ctx.typing():
             await self._send_karagraph(ctx, username, begin, end)
 
-    timing_reg = re.compile(r'^(?:Original Timing|Script Updated By): ([^,\n]*)(?:,.*)?$', re.M)
-
-    async def _get_timer(self, file_path: str, fut: asyncio.Future[tuple[str, set[str]]]):
-        try:
-            async with aiofiles.open(file_path) as file:
-                timer_matches = self.timing_reg.findall(await file.read(1024))
-                sub_timers = set(timer_matches)
-
-                fut.set_result((file_path, sub_timers))
-        except Exception as e:
-            fut.set_exception(e)
-
     async def _get_karas_by_timers(self):
-        assert KARA_BASE is not None
-        path = KARA_BASE
-
-        file_name_reg = re.compile(r'.*\.(ass|ssa)$')
-        file_paths: list[str] = []
-        for root, _, file_names in os.walk(path):
-            for file_name in file_names:
-                if file_name_reg.match(file_name):
-                    file_paths.append(os.path.join(root, file_name))
-
-        sched = aiojobs.Scheduler()
-        jobs: list[asyncio.Future[tuple[str, set[str]]]] = []
-
-        for file_path in file_paths:
-            fut = asyncio.get_running_loop().create_future()
-            await sched.spawn(self._get_timer(file_path, fut))
-            jobs.append(fut)
-
-        timers: dict[str, list[str]] = defaultdict(list)
-        errors: list[str] = []
-        for job in jobs:
-            file, file_timers = await job
-
-            if len(file_timers) > 0:
-                for timer in file_timers:
-                    timers[timer].append(file)
-            else:
-                errors.append(re.sub('/', ' / ', re.sub(f'^{path}/', '', file)))
-
-        return timers, errors
+        await self.index.ready.wait()
+        timers, errors = await self.index.run(self.index.karas_by_timers)
+        return timers, [re.sub('/', ' / ', error) for error in errors]
 
     async def _get_leaderboard(self):
         timers, errors = await self._get_karas_by_timers()
@@ -206,153 +174,43 @@ class Karaoke(NanaGroupCog, group_name='kara', required_settings=RequiresKaraoke
     async def _send_karagraph(
         self, ctx, username: str, begin: date | None = None, end: date | None = None
     ):
-        timers, _ = await self._get_karas_by_timers()
+        await self.index.ready.wait()
+        mtimes = [
+            date.fromtimestamp(mtime)
+            for mtime in await self.index.run(self.index.timer_mtimes, username)
+        ]
 
-        if username not in timers:
+        if not mtimes:
             await ctx.send(f'No user named {username} found :confounded:')
             return
 
-        stats_fut: list[asyncio.Future[os.stat_result]] = []
-
-        async def stat(file: str, fut: asyncio.Future):
-            file_stat = await aiofiles.os.stat(file)
-            fut.set_result(file_stat)
-
-        sched = aiojobs.Scheduler()
-        for kara_file in timers[username]:
-            fut = asyncio.get_running_loop().create_future()
-            await sched.spawn(stat(kara_file, fut))
-            stats_fut.append(fut)
-
-        mtimes = []
-
-        for stat_fut in stats_fut:
-            kara_stat = await stat_fut
-            bisect.insort(mtimes, date.fromtimestamp(kara_stat.st_mtime))
-
-        score = 0
-        first = mtimes[0] - timedelta(weeks=1)
         end = end or date.today()
-        karas_over_time = {first: score}
-        for mtime in mtimes:
-            if mtime > end:
-                break
-            score += 1
-            karas_over_time[mtime] = score
-        karas_over_time[end] = score
-
-        if begin and begin > first:
-            last = 0
-            for mtime, score in karas_over_time.copy().items():
-                if mtime < begin:
-                    last = score
-                    del karas_over_time[mtime]
-            if begin not in karas_over_time:
-                karas_over_time[begin] = last
-        else:
-            begin = first
-
-        assert begin
-        delta = end - begin
-        if delta < timedelta(weeks=5):
-            major = dates.MonthLocator()
-            major_fmt = dates.DateFormatter('\n%b')
-            minor = dates.DayLocator()
-            minor_fmt = dates.DateFormatter('%d')
-        elif delta < timedelta(weeks=10):
-            major = dates.MonthLocator()
-            major_fmt = dates.DateFormatter('\n%b')
-            minor = dates.DayLocator(bymonthday=range(1, 31, 5))
-            minor_fmt = dates.DateFormatter('%d')
-        elif delta < timedelta(weeks=104):
-            major = dates.YearLocator()
-            major_fmt = dates.DateFormatter('\n\n%Y')
-            minor = dates.MonthLocator()
-            minor_fmt = dates.DateFormatter('%b')
-        elif delta < timedelta(weeks=312):
-            major = dates.YearLocator()
-            major_fmt = dates.DateFormatter('%Y')
-            minor = dates.MonthLocator(bymonth=range(1, 13, 3))
-            minor_fmt = dates.DateFormatter('')
+        key = (username, begin, end, self.index.version)
+        png = self.graph_cache.get(key)
+        if png is None:
+            png = await asyncio.get_running_loop().run_in_executor(
+                self.graph_executor, render_timer_graph, mtimes, begin, end
+            )
+            self.graph_cache[key] = png
+            if len(self.graph_cache) > GRAPH_CACHE_SIZE:
+                self.graph_cache.popitem(last=False)
         else:
-            major = dates.YearLocator()
-            major_fmt = dates.DateFormatter('%Y')
-            minor = None
-            minor_fmt = None
+            self.graph_cache.move_to_end(key)
 
-        pyplot.style.use('dark_background')
-        _, ax = pyplot.subplots()
-        score_date, scores = zip(*sorted(karas_over_time.items()))
-        ax.step(score_date, scores, where='post')
-
-        ax.xaxis.set_major_locator(major)
-        ax.xaxis.set_major_formatter(major_fmt)
-        if minor is not None:
-            ax.xaxis.set_minor_locator(minor)
-            assert minor_fmt is not None
-            ax.xaxis.set_minor_formatter(minor_fmt)
-
-        ax.yaxis.set_major_locator(ticker.MaxNLocator(integer=True, min_n_ticks=1))
-
-        pyplot.setp(ax.xaxis.get_minorticklabels(), rotation=270)
-        ax.autoscale_view()
+        filename = f'{username}_karastats.png'
+        await ctx.send(f'Stats of {username}:', file=File(BytesIO(png), filename=filename))
 
-        ax.grid(True, which='both', linestyle=':')
+    async def _find_karaokes(self, search_tags: str) -> list[KaraSong]:
+        """Ranked title and lyrics search, falling back to a file name regex"""
+        await self.index.ready.wait()
+        if karaokes := await self.index.run(self.index.search, search_tags):
+            return karaokes
 
-        file = BytesIO()
-        filename = f'{username}_karastats.png'
-        pyplot.savefig(file, transparent=True, bbox_inches='tight', format='png')
-        file.seek(0)
-
-        await ctx.send(f'Stats of {username}:', file=File(file, filename=filename))
-
-    async def _find_karaokes(self, path=None, regex=''):
-        if path is None:
-            assert KARA_BASE is not None
-            path = KARA_BASE
-
-        regex = re.sub(' ', '.*', regex)
-        file_name_reg = re.compile(rf'.*(?i:{regex}).*\.(ass|ssa)$')
-
-        file_paths = []
-        for root, _, file_names in os.walk(path):
-            for file_name in file_names:
-                if file_name_reg.match(file_name):
-                    file_path = os.path.join(root, file_name)
-                    file_paths.append(file_path)
-
-        lyrics_reg = re.compile(r'[^;].*{\\[kK].*}')
-        karas_found = []
-        for file_path in file_paths:
-            lyrics = []
-            cache = []
-            async with aiofiles.open(file_path) as file:
-                async for line in file:
-                    if lyrics_reg.match(line):
-                        fields = line.split(',')
-                        line = ','.join(fields[9:])
-                        line = re.sub(r'{[^}]*}', '', line)
-                        line_id = (fields[1], fields[2], line.strip())
-                        if line_id not in cache:
-                            lyrics.append(line.strip())
-                            cache.append(line_id)
-
-            kara_name = os.path.splitext(os.path.basename(file_path))[0]
-            file_name_reg = re.compile(rf'(?i:{re.escape(kara_name)})\.(?!ass|ssa)[^.]*$')
-            file_path = None
-            for root, _, file_names in os.walk(path):
-                for file_name in file_names:
-                    if file_name_reg.match(file_name):
-                        file_path = os.path.join(root, file_name)
-                        break
-                if file_path is not None:
-                    break
-
-            assert file_path is not None
-
-            karas_found.append(KaraSong(kara_name, file_path, lyrics))
-
-        return karas_found
+        try:
+            karaokes = await self.index.run(self.index.find, search_tags)
+        except re.error:
+            return []
+        return sorted(karaokes, key=attrgetter('name'))
 
 
 async def setup(bot: Bot):
@@ -16,7 +16,6 @@ from nanachan.discord.bot import Bot
 from nanachan.discord.cog import Cog
 from nanachan.discord.helpers import Embed, MultiplexingContext
 from nanachan.discord.views import AutoNavigatorView, BaseView, LockedView, NavigatorView
-from nanachan.nanapi._client import Error, Success
 from nanachan.nanapi.client import get_nanapi
 from nanachan.nanapi.model import (
     ProfileSearchResult,
@@ -25,6 +24,8 @@ from nanachan.nanapi.model import (
 )
 from nanachan.settings import YEAR_ROLES
 from nanachan.utils.misc import to_producer
+from nanachan.utils.profiles import get_profile, get_profiles, search_profiles, upsert_profile
+from nanachan.utils.roles import RoleChange, diff_roles, sync_roles
 
 if TYPE_CHECKING:
     from discord.types.interactions import SelectMessageComponentInteractionData
@@ -81,16 +82,30 @@ class Profiles(Cog):
         user_profile = UpsertProfileBody(
             discord_username=after.name, graduation_year=graduation_year
         )
-        await get_nanapi().user.user_upsert_profile(discord_id=str(after.id), body=user_profile)
+        await upsert_profile(after.id, user_profile)
 
-    async def _update_year_roles(
-        self, members: list[Member], year_roles: list[Role], target_roles: list[Role]
-    ):
-        for member, target_role in zip(members, target_roles):
-            await member.remove_roles(*year_roles)
-            await member.add_roles(target_role)
+    async def _update_year_roles(self, interaction: Interaction, changes: list[RoleChange]):
+        message = await interaction.followup.send(
+            f'Syncing promo roles… 0/{len(changes)}', wait=True
+        )
+
+        async def edit(content: str):
+            # the interaction token expires after 15 minutes, long before a big promo is done
+            try:
+                await message.edit(content=content)
+            except discord.HTTPException as e:
+                logger.warning(f'cannot report promo roles sync progress: {e}')
+
+        async def report(done: int):
+            await edit(f'Syncing promo roles… {done}/{len(changes)}')
 
-        logger.info('done syncing member year roles')
+        failed = await sync_roles(changes, reason='promo roles', on_progress=report)
+        content = f'Promo roles synced for {len(changes) - len(failed)} member(s)'
+        if failed:
+            content += f', failed for {", ".join(str(c.member) for c in failed)}'
+        await edit(content)
+
+        logger.info(f'done syncing member year roles: {content}')
 
     @staticmethod
     def next_birthday(birthdate: datetime):
@@ -106,12 +121,7 @@ class Profiles(Cog):
         await interaction.response.defer()
         guild = interaction.guild
         assert guild is not None
-        resp = await get_nanapi().user.user_profile_search(
-            ','.join(str(m.id) for m in guild.members)
-        )
-        resp = resp.raise_exc()
-
-        profiles = resp.result
+        profiles = (await get_profiles(m.id for m in guild.members)).values()
         birthdays = [
             (
                 self.next_birthday(p.birthday),
@@ -134,40 +144,36 @@ class Profiles(Cog):
 
     @nana_command(description='refresh promo roles')
     @app_commands.guild_only()
-    async def promo(self, interaction: Interaction, year_filter: int | None = None):
+    @app_commands.describe(dry_run='Only show the role changes')
+    async def promo(
+        self, interaction: Interaction, year_filter: int | None = None, dry_run: bool = False
+    ):
         """Refresh promo roles"""
         await interaction.response.defer()
 
         guild = interaction.guild
         assert guild is not None
 
-        resp = await get_nanapi().user.user_profile_search(
-            ','.join(str(m.id) for m in guild.members)
-        )
-        resp = resp.raise_exc()
-        profiles = resp.result
+        profiles = await get_profiles(m.id for m in guild.members)
         now = datetime.now()
         last_promo = now.year if now.month >= 7 else now.year - 1
         year_roles = [
             role for role in (guild.get_role(id) for id in YEAR_ROLES) if role is not None
         ]
-        new_roles = []
-        members = []
-        for profile in profiles:
+        promo: list[tuple[Member, ProfileSearchResult, Role]] = []
+        for discord_id, profile in profiles.items():
             if profile.graduation_year is None:
                 continue
-            member = guild.get_member(int(profile.user.discord_id))
+            member = guild.get_member(discord_id)
             if member is None:
                 continue
             role_index = max(profile.graduation_year - last_promo, 0)
-            new_roles.append(year_roles[role_index])
-            members.append(member)
+            promo.append((member, profile, year_roles[role_index]))
 
         if not year_filter:
-            asyncio.create_task(self._update_year_roles(members, year_roles, new_roles))
             text = [
                 f'**{member}** • *({profile.graduation_year})* [**{role}**] {profile.full_name}'
-                for member, profile, role in zip(members, profiles, new_roles)
+                for member, profile, role in promo
             ]
             text.sort(key=str.casefold)
 
@@ -181,8 +187,24 @@ class Profiles(Cog):
                 author_icon_url=icon_url,
                 footer_text=f'{len(text)} members',
             )
+
+            changes = diff_roles({member: [role] for member, _, role in promo}, year_roles)
+            if dry_run:
+                summary = (
+                    f'{len(changes)} member(s) to update, '
+                    f'{len(promo) - len(changes)} already up to date'
+                )
+                await AutoNavigatorView.create(
+                    self.bot,
+                    interaction.followup.send,
+                    title='Promo roles (dry run)',
+                    description='\n'.join(sorted(map(str, changes), key=str.casefold)) or None,
+                    footer_text=summary,
+                )
+            elif changes:
+                asyncio.create_task(self._update_year_roles(interaction, changes))
         else:
-            pages = [{'embed': self.create_embed(m, p)} for m, p in zip(members, profiles)]
+            pages = [{'embed': self.create_embed(m, p)} for m, p, _ in promo]
             if len(pages) > 0:
                 await NavigatorView.create(
                     self.bot,
@@ -194,10 +216,7 @@ class Profiles(Cog):
 
     @staticmethod
     async def create_or_update_profile(member: Member | discord.User, payload: UpsertProfileBody):
-        resp = await get_nanapi().user.user_upsert_profile(str(member.id), payload)
-        resp = resp.raise_exc()
-        profile = resp.result
-        return profile
+        return await upsert_profile(member.id, payload)
 
     @staticmethod
     def create_embed(member: Member | User, profile: ProfileSearchResult | UpsertProfileBody):
@@ -253,16 +272,11 @@ class Profiles(Cog):
     @nana_command(description='Edit your own profile.')
     async def iam(self, interaction: Interaction[Bot]):
         _ = asyncio.create_task(interaction.response.defer())
-        profile_resp = await get_nanapi().user.user_get_profile(str(interaction.user.id))
-        match profile_resp:
-            case Success():
-                profile = profile_upsert_body_from_search_result(
-                    interaction.user.name, profile_resp.result
-                )
-            case Error(code=404):
-                profile = UpsertProfileBody(discord_username=interaction.user.name)
-            case _:
-                profile_resp = profile_resp.raise_exc()
+        search_result = await get_profile(interaction.user.id)
+        if search_result is not None:
+            profile = profile_upsert_body_from_search_result(interaction.user.name, search_result)
+        else:
+            profile = UpsertProfileBody(discord_username=interaction.user.name)
 
         embed = self.create_embed(interaction.user, profile)
         await interaction.followup.send(
@@ -272,17 +286,11 @@ class Profiles(Cog):
     @nana_command(description="Display other user's profile.")
     async def whois(self, interaction: Interaction[Bot], other: discord.User):
         _ = asyncio.create_task(interaction.response.defer())
-        profile_resp = await get_nanapi().user.user_get_profile(str(other.id))
-        match profile_resp:
-            case Success():
-                pass
-            case Error(code=404):
-                await interaction.followup.send('User has no registered profile.')
-                return
-            case _:
-                profile_resp = profile_resp.raise_exc()
+        profile = await get_profile(other.id)
+        if profile is None:
+            await interaction.followup.send('User has no registered profile.')
+            return
 
-        profile = profile_resp.result
         _ = await interaction.followup.send(embed=self.create_embed(other, profile))
 
     @nana_command(description='Display information about someone')
@@ -294,31 +302,21 @@ class Profiles(Cog):
         assert guild
 
         # search in the discord names
-        for member in guild.members:
-            magic_string = '\0'.join(
-                {
-                    member.name,
-                    member.nick or member.name,
-                    str(member.id),
-                    member.mention,
-                }
+        search_reg = re.compile(re.escape(search_tags), re.IGNORECASE)
+        matching_members = {
+            member.id: member
+            for member in guild.members
+            if search_reg.search(
+                '\0'.join(
+                    {member.name, member.nick or member.name, str(member.id), member.mention}
+                )
             )
-            if re.search(re.escape(search_tags), magic_string, re.IGNORECASE):
-                resp = await get_nanapi().user.user_get_profile(str(member.id))
-                match resp:
-                    case Error(code=404):
-                        continue
-                    case _:
-                        resp = resp.raise_exc()
-
-                profile = resp.result
-                members_and_profiles[member.id] = (member, profile)
+        }
+        for discord_id, profile in (await get_profiles(matching_members)).items():
+            members_and_profiles[discord_id] = (matching_members[discord_id], profile)
 
         # search in the cards information
-        search = f'%{search_tags}%'
-        resp = await get_nanapi().user.user_profile_search(pattern=search)
-        resp = resp.raise_exc()
-        profiles = resp.result
+        profiles = await search_profiles(f'%{search_tags}%')
 
         for profile in profiles:
             member = guild.get_member(int(profile.user.discord_id))
@@ -542,19 +540,13 @@ class ProfileCreateOrChangeView(BaseView):
 
 @app_commands.context_menu(name='Who is')
 async def user_who_is(interaction: Interaction, member: Member):
-    resp = await get_nanapi().user.user_get_profile(str(member.id))
-    match resp:
-        case Success():
-            pass
-        case Error(code=404):
-            await interaction.response.send_message(
-                f'No informations found about **{member}**', ephemeral=True
-            )
-            return
-        case _:
-            resp = resp.raise_exc()
+    profile = await get_profile(member.id)
+    if profile is None:
+        await interaction.response.send_message(
+            f'No informations found about **{member}**', ephemeral=True
+        )
+        return
 
-    profile = resp.result
     send = partial(interaction.response.send_message, ephemeral=True)
     await send(embed=Profiles.create_embed(member, profile))
 
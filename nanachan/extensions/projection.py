@@ -20,7 +20,7 @@ from discord import (
 from discord.abc import GuildChannel
 from discord.channel import TextChannel
 from discord.errors import NotFound
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from nanachan.discord.application_commands import LegacyCommandContext, legacy_command
 from nanachan.discord.bot import Bot
@@ -29,13 +29,9 @@ from nanachan.discord.helpers import get_option, parse_timestamp, timestamp_auto
 from nanachan.discord.views import AutoNavigatorView
 from nanachan.nanapi.client import Error, get_nanapi
 from nanachan.nanapi.model import (
-    GuildEventDeleteResultProjection,
-    GuildEventMergeResultProjection,
     NewProjectionBody,
-    ParticipantAddBody,
     ProjectionStatus,
     ProjoAddExternalMediaBody,
-    ProjoInsertResult,
     ProjoSelectResult,
     ProjoSelectResultMedias,
     SetProjectionMessageIdBody,
@@ -54,7 +50,12 @@ from nanachan.settings import (
 from nanachan.utils.anilist import MediaType, media_autocomplete
 from nanachan.utils.calendar import upsert_event
 from nanachan.utils.misc import autocomplete_truncate, get_session
-from nanachan.utils.projection import ProjectionView, get_active_projo, get_projo_embed_view
+from nanachan.utils.projection import (
+    ProjectionState,
+    ProjectionView,
+    render_projo_embed_view,
+)
+from nanachan.utils.scheduler import get_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -66,32 +67,58 @@ class ProjectionCog(
 
     emoji = '📽'
 
+    REMIND_TIME = time(hour=14, minute=0, tzinfo=TZ)
+    RECONCILE_INTERVAL = 600
+
     def __init__(self, bot: Bot):
         self.bot = bot
-        self.message_cache: dict[int, discord.Message] = {}
+        self.state = ProjectionState(bot)
 
     @Cog.listener()
     async def on_ready(self):
-        resp = await get_nanapi().projection.projection_get_projections(
-            ProjectionStatus.ONGOING.value
-        )
-        resp = resp.raise_exc()
-        projos = resp.result
+        projos = await self.reconcile_projos()
 
         for projo in projos:
             self.bot.add_view(ProjectionView(self.bot, projo.id))
 
-        asyncio.create_task(self.sync_participants(projos))
+        asyncio.create_task(self.state.sync_all_participants())
 
-        if not self.remind_projo.is_running():
-            self.remind_projo.start()
+        if 'remind_projo' not in get_scheduler():
+            self.schedule_remind_projo()
 
     @override
     async def cog_unload(self):
-        self.remind_projo.cancel()
+        get_scheduler().cancel('remind_projo')
+        get_scheduler().cancel('projo_reconcile')
+
+    async def reconcile_projos(self) -> list[ProjoSelectResult]:
+        """Reloads the registry of active projections from nanapi"""
+        get_scheduler().schedule_in(
+            self.RECONCILE_INTERVAL, self.reconcile_projos, key='projo_reconcile'
+        )
+
+        resp = await get_nanapi().projection.projection_get_projections(
+            ProjectionStatus.ONGOING.value
+        )
+        resp = resp.raise_exc()
+        projos = resp.result
+        self.state.load(projos)
+        return projos
+
+    async def fetch_active_projo(self, channel_id: int) -> ProjoSelectResult | None:
+        return await self.state.refresh(channel_id)
+
+    def schedule_remind_projo(self):
+        now = datetime.now(tz=TZ)
+        remind_at = datetime.combine(now.date(), self.REMIND_TIME)
+        if remind_at <= now:
+            remind_at += timedelta(days=1)
+        get_scheduler().schedule(remind_at, self.remind_projo, key='remind_projo')
 
-    @tasks.loop(time=time(hour=14, minute=0, tzinfo=TZ))
     async def remind_projo(self):
+        # rearm first, a failing reminder must not stop the next ones
+        self.schedule_remind_projo()
+
         now = datetime.now(tz=TZ)
         resp = await get_nanapi().projection.projection_get_projections(status='ONGOING')
         resp = resp.raise_exc()
@@ -109,43 +136,6 @@ class ProjectionCog(
                     )
                     break
 
-    async def sync_participants(self, projos: list[ProjoSelectResult]):
-        logger.info('Start syncing projo participants')
-        for projo in projos:
-            projo_chan = self.bot.get_channel(int(projo.channel_id))
-            if not isinstance(projo_chan, Thread):
-                continue
-            await self.sync_projo_participants(projo, projo_chan)
-        logger.info('Done syncing projo participants')
-
-    async def sync_projo_participants(
-        self, projo: ProjoSelectResult | ProjoInsertResult, projo_chan: Thread
-    ):
-        db_participants = (
-            {int(p.discord_id) for p in projo.participants}
-            if isinstance(projo, ProjoSelectResult)
-            else set[int]()
-        )
-
-        members = await projo_chan.fetch_members()
-        discord_participants = {m.id: self.bot.get_user(m.id) for m in members}
-
-        for discord_id, user in discord_participants.items():
-            if discord_id not in db_participants:
-                body = ParticipantAddBody(participant_username=str(user))
-                resp = await get_nanapi().projection.projection_add_projection_participant(
-                    projo.id, str(discord_id), body
-                )
-                resp = resp.raise_exc()
-            else:
-                db_participants.remove(discord_id)
-
-        for discord_id in db_participants:
-            resp = await get_nanapi().projection.projection_remove_projection_participant(
-                projo.id, str(discord_id)
-            )
-            resp = resp.raise_exc()
-
     async def add_projo_leader_role(
         self, user: discord.Member | discord.User, reason: str = 'Created a projection'
     ):
@@ -183,11 +173,14 @@ class ProjectionCog(
             NewProjectionBody(name=name, channel_id=str(ctx.channel.id))
         )
         resp = resp.raise_exc()
-        projo = resp.result
+        projo = await self.fetch_active_projo(ctx.channel.id)
+        assert projo is not None
 
-        await self.sync_projo_participants(projo, ctx.channel)
+        await self.state.sync_participants(projo, ctx.channel)
 
-        embed, view = await get_projo_embed_view(self.bot, projo.id)
+        embed, view = await render_projo_embed_view(
+            self.bot, projo, self.state.members[ctx.channel.id]
+        )
         vote_chan = self.bot.get_text_channel(PROJO_THREADS_ROOM)
         assert vote_chan
         info_msg = await vote_chan.send(embed=embed, view=view)
@@ -196,6 +189,9 @@ class ProjectionCog(
             projo.id, SetProjectionMessageIdBody(message_id=str(info_msg.id))
         )
         resp1 = resp1.raise_exc()
+        self.state.active_projos[ctx.channel.id] = projo.model_copy(
+            update=dict(message_id=str(info_msg.id))
+        )
 
         await ctx.reply(
             f'New **{name}** [projection]({info_msg.jump_url}) started. '
@@ -208,7 +204,7 @@ class ProjectionCog(
     async def rename(self, ctx: LegacyCommandContext, name: str):
         """Rename the projection"""
         await ctx.defer()
-        projo = await get_active_projo(ctx.channel.id)
+        projo = await self.fetch_active_projo(ctx.channel.id)
         if projo is None:
             raise commands.CommandError(
                 'This command should be used inside an active projection thread'
@@ -233,16 +229,17 @@ class ProjectionCog(
     async def cancel(self, ctx: LegacyCommandContext):
         """Cancel the projection"""
         await ctx.defer()
-        projo = await get_active_projo(ctx.channel.id)
+        projo = await self.fetch_active_projo(ctx.channel.id)
         if projo is None:
             raise commands.CommandError(
                 'This command should be used inside an active projection thread'
             )
         resp = await get_nanapi().projection.projection_delete_projection(projo.id)
         resp = resp.raise_exc()
+        self.state.discard(ctx.channel.id)
 
         assert projo.message_id is not None
-        info_msg = await self.fetch_message(int(projo.message_id))
+        info_msg = self.state.get_message(int(projo.message_id))
         await info_msg.delete()
         await ctx.reply(f'The projection was cancelled. {self.bot.get_emoji_str("FubukiGO")}')
 
@@ -269,7 +266,7 @@ class ProjectionCog(
         """Add something to the projection"""
         await ctx.defer()
 
-        projo = await get_active_projo(ctx.channel.id)
+        projo = await self.fetch_active_projo(ctx.channel.id)
         if projo is None:
             raise commands.CommandError(
                 'This command should be used inside an active projection thread'
@@ -309,7 +306,7 @@ class ProjectionCog(
         if not isinstance(interaction.channel, discord.Thread):
             raise commands.CommandError('This command should be used inside a thread.')
 
-        projo = await get_active_projo(interaction.channel.id)
+        projo = await self.fetch_active_projo(interaction.channel.id)
         if projo is None:
             raise commands.CommandError(
                 'This command should be used inside an active projection thread'
@@ -337,7 +334,7 @@ class ProjectionCog(
 
     async def remove_autocomplete(self, interaction: Interaction, current: str):
         assert interaction.channel is not None
-        projo = await get_active_projo(interaction.channel.id)
+        projo = await self.fetch_active_projo(interaction.channel.id)
         if projo is None:
             return []
 
@@ -365,7 +362,7 @@ class ProjectionCog(
     async def remove(self, ctx: LegacyCommandContext, media_type: MediaChoice, item: str):
         """Remove something from the projection"""
         await ctx.defer()
-        projo = await get_active_projo(ctx.channel.id)
+        projo = await self.fetch_active_projo(ctx.channel.id)
         if projo is None:
             raise commands.CommandError(
                 'This command should be used inside an active projection thread'
@@ -396,7 +393,7 @@ class ProjectionCog(
     async def completed(self, ctx: LegacyCommandContext):
         """Mark current projection as completed"""
         await ctx.defer()
-        projo = await get_active_projo(ctx.channel.id)
+        projo = await self.fetch_active_projo(ctx.channel.id)
         if projo is None:
             raise commands.CommandError(
                 'This command should be used inside an active projection thread'
@@ -405,9 +402,10 @@ class ProjectionCog(
             projo.id, SetProjectionStatusBody(status=ProjectionStatus.COMPLETED.value)
         )
         resp = resp.raise_exc()
+        self.state.discard(ctx.channel.id)
 
         assert projo.message_id is not None
-        info_msg = await self.fetch_message(int(projo.message_id))
+        info_msg = self.state.get_message(int(projo.message_id))
         await info_msg.delete()
         await ctx.reply(
             f'The projection was marked as completed. {self.bot.get_emoji_str("FubukiGO")}'
@@ -442,7 +440,7 @@ class ProjectionCog(
             eilene_ded = self.bot.get_emoji_str('EileneDed')
             raise commands.CommandError(f'Event date is in the past {eilene_ded}')
 
-        projection = await get_active_projo(ctx.channel.id)
+        projection = await self.fetch_active_projo(ctx.channel.id)
         if projection is None:
             raise commands.CommandError(
                 'This command should be used inside an active projection thread'
@@ -530,7 +528,7 @@ class ProjectionCog(
     async def event_clear(self, ctx: LegacyCommandContext):
         """Clear all upcoming events"""
         await ctx.defer()
-        projection = await get_active_projo(ctx.channel.id)
+        projection = await self.fetch_active_projo(ctx.channel.id)
         if projection is None:
             raise commands.CommandError(
                 'This command should be used inside an active projection thread'
@@ -622,69 +620,44 @@ class ProjectionCog(
             color=0x9966CC,
         )
 
-    async def update_projo_embed(
-        self,
-        projection: ProjoSelectResult
-        | GuildEventMergeResultProjection
-        | GuildEventDeleteResultProjection,
-    ):
-        embed, view = await get_projo_embed_view(self.bot, projection.id)
-        assert projection.message_id
-        message = await self.fetch_message(int(projection.message_id))
-        await message.edit(embed=embed, view=view)
+    async def update_projo_embed(self, projection: ProjoSelectResult) -> discord.Embed:
+        """Re-renders the info embed right away, after the projection was modified"""
+        thread_id = int(projection.channel_id)
+        self.state.stale.add(thread_id)
+        embed = await self.state.render(thread_id)
+        if embed is None:
+            # not ongoing anymore (just ended or removed), there is no message to update
+            participants = (int(p.discord_id) for p in projection.participants)
+            embed, _ = await render_projo_embed_view(self.bot, projection, participants)
         return embed
 
     #############
     # Listeners #
     #############
 
-    async def fetch_message(self, message_id: int):
-        if message_id not in self.message_cache:
-            try:
-                channel = self.bot.get_channel(PROJO_THREADS_ROOM)
-                assert isinstance(channel, TextChannel)
-                self.message_cache[message_id] = await channel.fetch_message(message_id)
-            except discord.NotFound:
-                print('message not found:', message_id)
-                raise
-        return self.message_cache[message_id]
-
     @Cog.listener()
     async def on_thread_update(self, before: discord.Thread, after: discord.Thread):
-        if after.archived:
-            projo = await get_active_projo(after.id)
-            if projo is not None:
-                await after.edit(archived=False)
+        if after.archived and after.id in self.state.active_projos:
+            await after.edit(archived=False)
 
     @Cog.listener()
     async def on_thread_member_join(self, member: discord.ThreadMember):
-        user = self.bot.get_user(member.id)
-        if user is None or user.bot:
+        if member.thread_id not in self.state.active_projos:
             return
 
-        projo = await get_active_projo(member.thread_id)
-        if projo is not None:
-            await self.update_projo_embed(projo)
-            body = ParticipantAddBody(participant_username=str(user))
-            resp = await get_nanapi().projection.projection_add_projection_participant(
-                projo.id, str(user.id), body
-            )
-            resp = resp.raise_exc()
+        user = self.bot.get_user(member.id)
+        if user is not None and not user.bot:
+            await self.state.add_participant(member.thread_id, user)
 
     @Cog.listener()
     async def on_thread_member_remove(self, member: discord.ThreadMember):
-        user = self.bot.get_user(member.id)
-        assert user is not None
-        if user.bot:
+        if member.thread_id not in self.state.active_projos:
             return
 
-        projo = await get_active_projo(member.thread_id)
-        if projo is not None:
-            await self.update_projo_embed(projo)
-            resp = await get_nanapi().projection.projection_remove_projection_participant(
-                projo.id, str(user.id)
-            )
-            resp = resp.raise_exc()
+        user = self.bot.get_user(member.id)
+        assert user is not None
+        if not user.bot:
+            await self.state.remove_participant(member.thread_id, user)
 
 
 async def setup(bot: Bot):
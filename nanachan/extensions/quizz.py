@@ -3,6 +3,7 @@ import re
 from collections import defaultdict
 from contextlib import suppress
 from datetime import datetime
+from itertools import compress
 from uuid import UUID
 
 import discord
@@ -21,8 +22,13 @@ from nanachan.discord.helpers import (
     context_modifier,
 )
 from nanachan.discord.views import ConfirmationView
-from nanachan.nanapi.client import Error, Success, get_nanapi
-from nanachan.nanapi.model import EndGameBody, NewGameBody, SetQuizzAnswerBody
+from nanachan.nanapi.client import Error, Success, batch, get_nanapi
+from nanachan.nanapi.model import (
+    EndGameBody,
+    GameGetCurrentResult,
+    NewGameBody,
+    SetQuizzAnswerBody,
+)
 from nanachan.settings import (
     ANIME_QUIZZ_CHANNEL,
     LOUIS_QUIZZ_CHANNEL,
@@ -31,7 +37,14 @@ from nanachan.settings import (
     RequiresQuizz,
 )
 from nanachan.utils.misc import get_session
-from nanachan.utils.quizz import COLOR_BANANA, AnimeMangaQuizz, LouisQuizz, QuizzBase
+from nanachan.utils.quizz import (
+    COLOR_BANANA,
+    AnimeMangaQuizz,
+    AnswerMatcher,
+    LouisQuizz,
+    QuizzBase,
+)
+from nanachan.utils.scheduler import get_scheduler
 
 
 class Quizz(Cog, required_settings=RequiresQuizz):
@@ -57,6 +70,8 @@ class Quizz(Cog, required_settings=RequiresQuizz):
 
     image_prog = re.compile(rf'{re.escape(PREFIX)}ima+ge')
 
+    RECONCILE_INTERVAL = 600
+
     def __init__(self, bot: Bot):
         super().__init__(bot)
         self.quizz_cls: dict[int, QuizzBase] = {
@@ -65,8 +80,73 @@ class Quizz(Cog, required_settings=RequiresQuizz):
             LOUIS_QUIZZ_CHANNEL: LouisQuizz(self.bot, LOUIS_QUIZZ_CHANNEL),
         }
         self.locks = defaultdict[int, asyncio.Lock](asyncio.Lock)
+        # {channel_id: current game}, None when there is no game running
+        self.current_games: dict[int, GameGetCurrentResult | None] = {}
+        # {channel_id: matcher of the current game answer}
+        self.matchers: dict[int, AnswerMatcher] = {}
+        # {channel_id: guesses sent while the game was busy}
+        self.pending_guesses: dict[int, list[MultiplexingMessage]] = {}
         context_modifier(self.image_ctx)
 
+    @Cog.listener()
+    async def on_ready(self):
+        await self.reconcile_games()
+
+    async def cog_load(self):
+        self.bot.quizz_cog = self
+
+    async def cog_unload(self):
+        get_scheduler().cancel('quizz_reconcile')
+        if self.bot.quizz_cog is self:
+            self.bot.quizz_cog = None
+
+    async def reconcile_games(self):
+        """Reloads the current games from nanapi, in case they changed behind our back"""
+        get_scheduler().schedule_in(
+            self.RECONCILE_INTERVAL, self.reconcile_games, key='quizz_reconcile'
+        )
+
+        async def reconcile(channel_id: int):
+            async with self.locks[channel_id]:
+                await self.fetch_current_game(channel_id)
+
+        async with batch() as b:
+            for channel_id in self.quizz_cls:
+                b.submit(reconcile(channel_id))
+
+    async def fetch_current_game(self, channel_id: int) -> GameGetCurrentResult | None:
+        resp = await get_nanapi().quizz.quizz_get_current_game(str(channel_id))
+        match resp:
+            case Error(code=404):
+                game = None
+            case _:
+                game = resp.raise_exc().result
+
+        self.current_games[channel_id] = game
+
+        answer = game.quizz.answer if game is not None else None
+        if answer is None:
+            self.matchers.pop(channel_id, None)
+        elif (matcher := self.matchers.get(channel_id)) is None or matcher.answer != answer:
+            self.matchers[channel_id] = await self.quizz_cls[channel_id].compile_matcher(answer)
+
+        return game
+
+    def clear_current_game(self, channel_id: int):
+        self.current_games[channel_id] = None
+        self.matchers.pop(channel_id, None)
+
+    async def get_current_game(self, channel_id: int) -> GameGetCurrentResult | None:
+        if channel_id in self.current_games:
+            return self.current_games[channel_id]
+        return await self.fetch_current_game(channel_id)
+
+    async def require_current_game(self, channel_id: int) -> GameGetCurrentResult:
+        game = await self.get_current_game(channel_id)
+        if game is None:
+            raise commands.CommandError('No quiz started')
+        return game
+
     async def image_ctx(self, ctx):
         if self.image_prog.match(ctx.message.stripped_content) is not None:
             ctx.command = self.image
@@ -94,14 +174,8 @@ class Quizz(Cog, required_settings=RequiresQuizz):
         quizz = resp.result
         channel_id = quizz.channel_id
         async with self.locks[int(channel_id)]:
-            resp = await get_nanapi().quizz.quizz_get_current_game(channel_id)
-            match resp:
-                case Success():
-                    raise commands.CommandError('There is a pending quizz')
-                case Error(code=404):
-                    pass
-                case _:
-                    resp = resp.raise_exc()
+            if await self.get_current_game(int(channel_id)) is not None:
+                raise commands.CommandError('There is a pending quizz')
 
             channel = self.bot.get_text_channel(int(channel_id))
             assert channel is not None
@@ -116,16 +190,21 @@ class Quizz(Cog, required_settings=RequiresQuizz):
                     case Error():
                         resp = resp.raise_exc()
                     case Success():
-                        last_game_res = resp.result
-                        m_id = last_game_res.message_id
-                        last_game = await channel.fetch_message(int(m_id))
-                        await last_game.unpin()
+                        m_id = int(resp.result.message_id)
+                        message = self.bot.message_cache.get(channel.id, m_id)
+                        try:
+                            await message.unpin()
+                        except discord.NotFound:
+                            # the handle is not fetched, this is how we learn it is gone
+                            self.bot.message_cache.invalidate(m_id)
+                            raise
+                        last_game = message
 
             author = self.bot.get_user(int(quizz.author.discord_id))
 
             kwargs = {}
             if last_game is not None:
-                kwargs['reference'] = last_game
+                kwargs['reference'] = last_game.to_reference(fail_if_not_exists=False)
 
             new_game_msg = await channel.send(
                 content='unknown' if author is None else author.mention,
@@ -142,16 +221,15 @@ class Quizz(Cog, required_settings=RequiresQuizz):
             game = resp.result
 
             await new_game_msg.edit(embed=await cls.get_embed(game.id))
+            await self.fetch_current_game(channel.id)
 
     async def end_game(self, message: discord.Message | MultiplexingMessage):
         channel = message.channel
         async with self.locks[channel.id]:
-            resp = await get_nanapi().quizz.quizz_get_current_game(str(channel.id))
-            resp = resp.raise_exc()
-            game = resp.result
+            current_game = await self.require_current_game(channel.id)
 
             resp = await get_nanapi().quizz.quizz_end_game(
-                game.id,
+                current_game.id,
                 EndGameBody(
                     winner_discord_id=str(message.author.id),
                     winner_discord_username=str(message.author),
@@ -159,11 +237,12 @@ class Quizz(Cog, required_settings=RequiresQuizz):
             )
             resp = resp.raise_exc()
             game = resp.result
+            self.clear_current_game(channel.id)
 
             cls = self.quizz_cls[channel.id]
             embed = await cls.get_embed(game.id)
 
-            game_msg = await channel.fetch_message(int(game.message_id))
+            game_msg = self.bot.message_cache.get(channel.id, int(game.message_id))
             await game_msg.edit(embed=embed)
 
             with suppress(Exception):
@@ -177,14 +256,7 @@ class Quizz(Cog, required_settings=RequiresQuizz):
     @legacy_command()
     async def hint(self, ctx: LegacyCommandContext):
         """Turn quizz into hangman game"""
-        resp = await get_nanapi().quizz.quizz_get_current_game(str(ctx.channel.id))
-        match resp:
-            case Error(code=404):
-                raise commands.CommandError('No quiz started')
-            case _:
-                resp = resp.raise_exc()
-
-        game = resp.result
+        game = await self.require_current_game(ctx.channel.id)
         hints = game.quizz.hints
 
         if hints is None:
@@ -209,14 +281,7 @@ class Quizz(Cog, required_settings=RequiresQuizz):
     @legacy_command(ephemeral=True)
     async def get_answer(self, ctx: LegacyCommandContext):
         """Get current quizz answer (author only)"""
-        resp = await get_nanapi().quizz.quizz_get_current_game(str(ctx.channel.id))
-        match resp:
-            case Error(code=404):
-                raise commands.CommandError('No quiz started')
-            case _:
-                resp = resp.raise_exc()
-
-        game = resp.result
+        game = await self.require_current_game(ctx.channel.id)
 
         assert isinstance(ctx.author, Member)
         if not (
@@ -232,14 +297,7 @@ class Quizz(Cog, required_settings=RequiresQuizz):
     @legacy_command(ephemeral=True)
     async def set_answer(self, ctx: LegacyCommandContext, answer: str | None):
         """Set (or remove) current quizz answer (author only)"""
-        resp = await get_nanapi().quizz.quizz_get_current_game(str(ctx.channel.id))
-        match resp:
-            case Error(code=404):
-                raise commands.CommandError('No quiz started')
-            case _:
-                resp = resp.raise_exc()
-
-        game = resp.result
+        game = await self.require_current_game(ctx.channel.id)
 
         assert isinstance(ctx.author, Member)
         if not (
@@ -264,8 +322,10 @@ class Quizz(Cog, required_settings=RequiresQuizz):
 
         resp = await get_nanapi().quizz.quizz_set_quizz_answer(game.quizz.id, body)
         resp = resp.raise_exc()
+        async with self.locks[cls.channel_id]:
+            await self.fetch_current_game(cls.channel_id)
 
-        game_msg = await ctx.fetch_message(int(game.message_id))
+        game_msg = self.bot.message_cache.get(ctx.channel.id, int(game.message_id))
         embed = await cls.get_embed(game.id)
         await game_msg.edit(embed=embed)
 
@@ -326,26 +386,36 @@ class Quizz(Cog, required_settings=RequiresQuizz):
         if ctx.channel.id not in self.quizz_cls:
             return
 
-        resp = await get_nanapi().quizz.quizz_get_current_game(str(ctx.channel.id))
-        match resp:
-            case Error(code=404):
+        channel_id = ctx.channel.id
+        lock = self.locks[channel_id]
+        if lock.locked() or channel_id in self.pending_guesses:
+            # the game is starting or ending, the guesses sent meanwhile are checked at once
+            guesses = self.pending_guesses.setdefault(channel_id, [])
+            guesses.append(ctx.message)
+            if len(guesses) > 1:
                 return
-            case _:
-                resp = resp.raise_exc()
+            async with lock:
+                pass
+            guesses = self.pending_guesses.pop(channel_id)
+        else:
+            guesses = [ctx.message]
 
-        game = resp.result
-        question = game.quizz.question
-        answer = game.quizz.answer
-        casefolded = ctx.message.clean_content.casefold()
-        cls = self.quizz_cls[int(game.quizz.channel_id)]
-        if (answer is not None and (casefolded == answer.casefold())) or (
-            await cls.try_validate(question, answer, casefolded)
-        ):
-            await self.end_game(ctx.message)
+        if await self.get_current_game(channel_id) is None:
+            return
+
+        matcher = self.matchers.get(channel_id)
+        if matcher is None:
+            return
+        matches = matcher.match_many(guess.clean_content for guess in guesses)
+        if (winner := next(compress(guesses, matches), None)) is not None:
+            await self.end_game(winner)
 
     @Cog.listener()
     async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
         if payload.channel_id in self.quizz_cls:
+            game = self.current_games.get(payload.channel_id)
+            if game is not None and int(game.message_id) == payload.message_id:
+                self.clear_current_game(payload.channel_id)
             resp = await get_nanapi().quizz.quizz_delete_game(str(payload.message_id))
             resp = resp.raise_exc()
 
@@ -358,12 +428,8 @@ class Quizz(Cog, required_settings=RequiresQuizz):
             return
 
         if payload.emoji.name == 'FubukiGO':
-            resp = await get_nanapi().quizz.quizz_get_current_game(str(payload.channel_id))
-            match resp:
-                case Error(code=404):
-                    return
-                case _:
-                    resp = resp.raise_exc()
+            if await self.get_current_game(payload.channel_id) is None:
+                return
 
             channel = self.bot.get_text_channel(payload.channel_id)
             assert channel is not None
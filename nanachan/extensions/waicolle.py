@@ -41,7 +41,7 @@ from nanachan.discord.helpers import (
     get_option,
 )
 from nanachan.discord.views import AutoNavigatorView, LockedView, NavigatorView, StringSelectorView
-from nanachan.nanapi.client import Error, Success, get_nanapi
+from nanachan.nanapi.client import Error, Success, batch, get_nanapi
 from nanachan.nanapi.model import (
     AddPlayerCoinsBody,
     BulkUpdateWaifusBody,
@@ -654,15 +654,13 @@ class WaifuCollection(Cog, name='WaiColle ~Waifu Collection~', required_settings
 
         if len(waifus) > 0:
             edges = {}
-            async with asyncio.TaskGroup() as tg:
+            async with batch(concurrency=None) as b:
                 chara_ids = [w.character.id_al for w in waifus]
-                resp_task = tg.create_task(
+                resp_task = b.submit(
                     get_nanapi().anilist.anilist_get_charas(ids_al=','.join(map(str, chara_ids)))
                 )
 
-                edge_tasks = [
-                    (cid, tg.create_task(WaifuHelper.get_edges(cid))) for cid in chara_ids
-                ]
+                edge_tasks = [(cid, b.submit(WaifuHelper.get_edges(cid))) for cid in chara_ids]
 
             resp = await resp_task
             resp = resp.raise_exc()
@@ -1848,34 +1846,34 @@ class WaifuCollection(Cog, name='WaiColle ~Waifu Collection~', required_settings
             ]
         ] = []
 
-        for media in tracks.tracked_medias:
-            stats_tasks.append(
-                asyncio.create_task(
-                    get_nanapi().waicolle.waicolle_get_player_media_stats(
-                        str(member.id), media.id_al
+        async with batch(concurrency=None) as b:
+            for media in tracks.tracked_medias:
+                stats_tasks.append(
+                    b.submit(
+                        get_nanapi().waicolle.waicolle_get_player_media_stats(
+                            str(member.id), media.id_al
+                        )
                     )
                 )
-            )
-        for staff in tracks.tracked_staffs:
-            stats_tasks.append(
-                asyncio.create_task(
-                    get_nanapi().waicolle.waicolle_get_player_staff_stats(
-                        str(member.id), staff.id_al
+            for staff in tracks.tracked_staffs:
+                stats_tasks.append(
+                    b.submit(
+                        get_nanapi().waicolle.waicolle_get_player_staff_stats(
+                            str(member.id), staff.id_al
+                        )
                     )
                 )
-            )
-        for collection in tracks.tracked_collections:
-            stats_tasks.append(
-                asyncio.create_task(
-                    get_nanapi().waicolle.waicolle_get_player_collection_stats(
-                        str(member.id), collection.id
+            for collection in tracks.tracked_collections:
+                stats_tasks.append(
+                    b.submit(
+                        get_nanapi().waicolle.waicolle_get_player_collection_stats(
+                            str(member.id), collection.id
+                        )
                     )
                 )
-            )
-        resps = (await t for t in stats_tasks)
 
         elems: list[tuple[float, str]] = []
-        async for resp in resps:
+        for resp in (t.result() for t in stats_tasks):
             sub_lines: list[str] = []
             match resp:
                 case Success(200, PlayerMediaStatsResult()):
@@ -0,0 +1,178 @@
+from typing import TYPE_CHECKING, Literal
+from uuid import UUID
+
+import aiohttp
+
+from ._client import Error, Success, prep_serialization
+from .model import (
+    AccountMergeResult,
+    AccountSelectResult,
+    HTTPExceptionModel,
+    HTTPValidationError,
+    SettingsMergeResult,
+    SettingsSelectAllResult,
+    UpsertAMQAccountBody,
+)
+
+if TYPE_CHECKING:
+    from ._client import ClientSession
+
+
+class AmqModule:
+    def __init__(self, session: 'ClientSession', server_url: str):
+        self.session: ClientSession = session
+        self.server_url: str = server_url
+
+    async def amq_get_accounts(
+        self, username: str | None = None
+    ) -> (
+        Success[Literal[200], list[AccountSelectResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Retrieve AMQ accounts, optionally filtered by username."""
+        url = f'{self.server_url}/amq/accounts'
+        params = {
+            'username': username,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[AccountSelectResult]](
+                    code=200, result=[AccountSelectResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def amq_upsert_account(
+        self, discord_id: str, body: UpsertAMQAccountBody
+    ) -> (
+        Success[Literal[200], AccountMergeResult]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Create or update an AMQ account by Discord ID."""
+        url = f'{self.server_url}/amq/accounts/{discord_id}'
+
+        async with self.session.patch(
+            url,
+            json=body,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], AccountMergeResult](
+                    code=200, result=AccountMergeResult(**(await resp.json()))
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def amq_get_settings(
+        self, client_id: UUID | None = None
+    ) -> (
+        Success[Literal[200], list[SettingsSelectAllResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Retrieve all AMQ settings."""
+        url = f'{self.server_url}/amq/settings'
+        params = {
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[SettingsSelectAllResult]](
+                    code=200, result=[SettingsSelectAllResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def amq_update_settings(
+        self, body: str, client_id: UUID | None = None
+    ) -> (
+        Success[Literal[200], list[SettingsMergeResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[403], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Update AMQ settings."""
+        url = f'{self.server_url}/amq/settings'
+        params = {
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.patch(
+            url,
+            params=params,
+            json=body,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[SettingsMergeResult]](
+                    code=200, result=[SettingsMergeResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 403:
+                return Error[Literal[403], HTTPExceptionModel](
+                    code=403, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
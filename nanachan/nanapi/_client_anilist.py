@@ -0,0 +1,870 @@
+from typing import TYPE_CHECKING, Literal
+
+import aiohttp
+
+from ._client import Error, Success, prep_serialization
+from .model import (
+    AccountMergeResult,
+    AccountSelectAllResult,
+    CEdgeSelectFilterCharaResult,
+    CEdgeSelectFilterMediaResult,
+    CEdgeSelectFilterStaffResult,
+    CharaNameAutocompleteResult,
+    CharaSelectResult,
+    EntrySelectAllResult,
+    EntrySelectFilterMediaResult,
+    HTTPExceptionModel,
+    HTTPValidationError,
+    MediaSelectResult,
+    MediaTitleAutocompleteResult,
+    SearchIdsALBody,
+    StaffNameAutocompleteResult,
+    StaffSelectResult,
+    UpsertAnilistAccountBody,
+)
+
+if TYPE_CHECKING:
+    from ._client import ClientSession
+
+
+class AnilistModule:
+    def __init__(self, session: 'ClientSession', server_url: str):
+        self.session: ClientSession = session
+        self.server_url: str = server_url
+
+    async def anilist_get_accounts(
+        self,
+    ) -> (
+        Success[Literal[200], list[AccountSelectAllResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+    ):
+        """Get all AniList accounts."""
+        url = f'{self.server_url}/anilist/accounts'
+
+        async with self.session.get(
+            url,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[AccountSelectAllResult]](
+                    code=200, result=[AccountSelectAllResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_upsert_account(
+        self, discord_id: str, body: UpsertAnilistAccountBody
+    ) -> (
+        Success[Literal[200], AccountMergeResult]
+        | Error[Literal[409], HTTPExceptionModel]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Upsert AniList account for a Discord user."""
+        url = f'{self.server_url}/anilist/accounts/{discord_id}'
+
+        async with self.session.patch(
+            url,
+            json=body,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], AccountMergeResult](
+                    code=200, result=AccountMergeResult(**(await resp.json()))
+                )
+            if resp.status == 409:
+                return Error[Literal[409], HTTPExceptionModel](
+                    code=409, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_all_entries(
+        self, type: Literal['ANIME', 'MANGA'] | None = None
+    ) -> (
+        Success[Literal[200], list[EntrySelectAllResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get all AniList entries for all accounts."""
+        url = f'{self.server_url}/anilist/accounts/all/entries'
+        params = {
+            'type': type,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[EntrySelectAllResult]](
+                    code=200, result=[EntrySelectAllResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_account_entries(
+        self, discord_id: str, type: Literal['ANIME', 'MANGA'] | None = None
+    ) -> (
+        Success[Literal[200], list[EntrySelectAllResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get AniList entries for a specific Discord user."""
+        url = f'{self.server_url}/anilist/accounts/{discord_id}/entries'
+        params = {
+            'type': type,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[EntrySelectAllResult]](
+                    code=200, result=[EntrySelectAllResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_medias(
+        self, ids_al: str
+    ) -> (
+        Success[Literal[200], list[MediaSelectResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get AniList media objects by IDs."""
+        url = f'{self.server_url}/anilist/medias'
+        params = {
+            'ids_al': ids_al,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[MediaSelectResult]](
+                    code=200, result=[MediaSelectResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_medias_post(
+        self, body: SearchIdsALBody
+    ) -> (
+        Success[Literal[200], list[MediaSelectResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get AniList media objects by IDs in request body."""
+        url = f'{self.server_url}/anilist/medias/search'
+
+        async with self.session.post(
+            url,
+            json=body,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[MediaSelectResult]](
+                    code=200, result=[MediaSelectResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_media_search(
+        self, search: str, type: Literal['ANIME', 'MANGA'] | None = None
+    ) -> (
+        Success[Literal[200], list[MediaSelectResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Search for AniList media by title."""
+        url = f'{self.server_url}/anilist/medias/search'
+        params = {
+            'search': search,
+            'type': type,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[MediaSelectResult]](
+                    code=200, result=[MediaSelectResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_media_title_autocomplete(
+        self, search: str, type: Literal['ANIME', 'MANGA'] | None = None
+    ) -> (
+        Success[Literal[200], list[MediaTitleAutocompleteResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Autocomplete AniList media titles."""
+        url = f'{self.server_url}/anilist/medias/autocomplete'
+        params = {
+            'search': search,
+            'type': type,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[MediaTitleAutocompleteResult]](
+                    code=200,
+                    result=[MediaTitleAutocompleteResult(**e) for e in (await resp.json())],
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_medias_collage(
+        self, ids_al: str
+    ) -> (
+        Success[Literal[200], None]
+        | Error[Literal[400], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get a collage image of AniList media covers."""
+        url = f'{self.server_url}/anilist/medias/collages'
+        params = {
+            'ids_al': ids_al,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], None](code=200, result=None)
+            if resp.status == 400:
+                return Error[Literal[400], HTTPExceptionModel](
+                    code=400, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_media_list_entries(
+        self, id_al: int
+    ) -> (
+        Success[Literal[200], list[EntrySelectFilterMediaResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get AniList entries for a specific media."""
+        url = f'{self.server_url}/anilist/medias/{id_al}/entries'
+
+        async with self.session.get(
+            url,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[EntrySelectFilterMediaResult]](
+                    code=200,
+                    result=[EntrySelectFilterMediaResult(**e) for e in (await resp.json())],
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_media_chara_edges(
+        self, id_al: int
+    ) -> (
+        Success[Literal[200], list[CEdgeSelectFilterMediaResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get character edges for a specific media."""
+        url = f'{self.server_url}/anilist/medias/{id_al}/edges/charas'
+
+        async with self.session.get(
+            url,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[CEdgeSelectFilterMediaResult]](
+                    code=200,
+                    result=[CEdgeSelectFilterMediaResult(**e) for e in (await resp.json())],
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_charas(
+        self, ids_al: str
+    ) -> (
+        Success[Literal[200], list[CharaSelectResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get AniList characters by IDs."""
+        url = f'{self.server_url}/anilist/charas'
+        params = {
+            'ids_al': ids_al,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[CharaSelectResult]](
+                    code=200, result=[CharaSelectResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_charas_post(
+        self, body: SearchIdsALBody
+    ) -> (
+        Success[Literal[200], list[CharaSelectResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get AniList characters by IDs in request body."""
+        url = f'{self.server_url}/anilist/charas/search'
+
+        async with self.session.post(
+            url,
+            json=body,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[CharaSelectResult]](
+                    code=200, result=[CharaSelectResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_chara_search(
+        self, search: str
+    ) -> (
+        Success[Literal[200], list[CharaSelectResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Search for AniList characters by name."""
+        url = f'{self.server_url}/anilist/charas/search'
+        params = {
+            'search': search,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[CharaSelectResult]](
+                    code=200, result=[CharaSelectResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_chara_name_autocomplete(
+        self, search: str
+    ) -> (
+        Success[Literal[200], list[CharaNameAutocompleteResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Autocomplete AniList character names."""
+        url = f'{self.server_url}/anilist/charas/autocomplete'
+        params = {
+            'search': search,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[CharaNameAutocompleteResult]](
+                    code=200,
+                    result=[CharaNameAutocompleteResult(**e) for e in (await resp.json())],
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_chara_birthdays(
+        self,
+    ) -> Success[Literal[200], list[CharaSelectResult]] | Error[Literal[401], HTTPExceptionModel]:
+        """Characters Birthdays"""
+        url = f'{self.server_url}/anilist/charas/birthdays'
+
+        async with self.session.get(
+            url,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[CharaSelectResult]](
+                    code=200, result=[CharaSelectResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_chara_collage(
+        self, ids_al: str, hide_no_images: int | None = None, blooded: int | None = None
+    ) -> (
+        Success[Literal[200], None]
+        | Error[Literal[400], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get a collage image of AniList character images."""
+        url = f'{self.server_url}/anilist/charas/collages'
+        params = {
+            'ids_al': ids_al,
+            'hide_no_images': hide_no_images,
+            'blooded': blooded,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], None](code=200, result=None)
+            if resp.status == 400:
+                return Error[Literal[400], HTTPExceptionModel](
+                    code=400, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_chara_chara_edges(
+        self, id_al: int
+    ) -> (
+        Success[Literal[200], list[CEdgeSelectFilterCharaResult]]
+        | Error[Literal[404], HTTPExceptionModel]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get character edges for a specific character."""
+        url = f'{self.server_url}/anilist/charas/{id_al}/edges/charas'
+
+        async with self.session.get(
+            url,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[CEdgeSelectFilterCharaResult]](
+                    code=200,
+                    result=[CEdgeSelectFilterCharaResult(**e) for e in (await resp.json())],
+                )
+            if resp.status == 404:
+                return Error[Literal[404], HTTPExceptionModel](
+                    code=404, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_staffs(
+        self, ids_al: str
+    ) -> (
+        Success[Literal[200], list[StaffSelectResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get AniList staff by IDs."""
+        url = f'{self.server_url}/anilist/staffs'
+        params = {
+            'ids_al': ids_al,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[StaffSelectResult]](
+                    code=200, result=[StaffSelectResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_staffs_post(
+        self, body: SearchIdsALBody
+    ) -> (
+        Success[Literal[200], list[StaffSelectResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get AniList staff by IDs in request body."""
+        url = f'{self.server_url}/anilist/staffs/search'
+
+        async with self.session.post(
+            url,
+            json=body,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[StaffSelectResult]](
+                    code=200, result=[StaffSelectResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_staff_search(
+        self, search: str
+    ) -> (
+        Success[Literal[200], list[StaffSelectResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Search for AniList staff by name."""
+        url = f'{self.server_url}/anilist/staffs/search'
+        params = {
+            'search': search,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[StaffSelectResult]](
+                    code=200, result=[StaffSelectResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_staff_name_autocomplete(
+        self, search: str
+    ) -> (
+        Success[Literal[200], list[StaffNameAutocompleteResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Autocomplete AniList staff names."""
+        url = f'{self.server_url}/anilist/staffs/autocomplete'
+        params = {
+            'search': search,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[StaffNameAutocompleteResult]](
+                    code=200,
+                    result=[StaffNameAutocompleteResult(**e) for e in (await resp.json())],
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def anilist_get_staff_chara_edges(
+        self, id_al: int
+    ) -> (
+        Success[Literal[200], list[CEdgeSelectFilterStaffResult]]
+        | Error[Literal[404], HTTPExceptionModel]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get character edges for a specific staff."""
+        url = f'{self.server_url}/anilist/staffs/{id_al}/edges/charas'
+
+        async with self.session.get(
+            url,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[CEdgeSelectFilterStaffResult]](
+                    code=200,
+                    result=[CEdgeSelectFilterStaffResult(**e) for e in (await resp.json())],
+                )
+            if resp.status == 404:
+                return Error[Literal[404], HTTPExceptionModel](
+                    code=404, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
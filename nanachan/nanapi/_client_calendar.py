@@ -0,0 +1,429 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, Literal
+from uuid import UUID
+
+import aiohttp
+
+from ._client import Error, Success, prep_serialization
+from .model import (
+    GuildEventDeleteResult,
+    GuildEventMergeResult,
+    GuildEventParticipantAddResult,
+    GuildEventParticipantRemoveResult,
+    GuildEventSelectResult,
+    HTTPExceptionModel,
+    HTTPValidationError,
+    ParticipantAddBody,
+    UpsertGuildEventBody,
+    UpsertUserCalendarBody,
+    UserCalendarDeleteResult,
+    UserCalendarMergeResult,
+    UserCalendarSelectAllResult,
+    UserCalendarSelectResult,
+)
+
+if TYPE_CHECKING:
+    from ._client import ClientSession
+
+
+class CalendarModule:
+    def __init__(self, session: 'ClientSession', server_url: str):
+        self.session: ClientSession = session
+        self.server_url: str = server_url
+
+    async def calendar_get_user_calendars(
+        self,
+    ) -> (
+        Success[Literal[200], list[UserCalendarSelectAllResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+    ):
+        """Get all user calendars."""
+        url = f'{self.server_url}/calendar/user_calendars'
+
+        async with self.session.get(
+            url,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[UserCalendarSelectAllResult]](
+                    code=200,
+                    result=[UserCalendarSelectAllResult(**e) for e in (await resp.json())],
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def calendar_get_user_calendar(
+        self, discord_id: str
+    ) -> (
+        Success[Literal[200], UserCalendarSelectResult]
+        | Error[Literal[404], None]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get a user calendar by Discord ID."""
+        url = f'{self.server_url}/calendar/user_calendars/{discord_id}'
+
+        async with self.session.get(
+            url,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], UserCalendarSelectResult](
+                    code=200, result=UserCalendarSelectResult(**(await resp.json()))
+                )
+            if resp.status == 404:
+                return Error[Literal[404], None](code=404, result=None)
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def calendar_upsert_user_calendar(
+        self, discord_id: str, body: UpsertUserCalendarBody
+    ) -> (
+        Success[Literal[200], UserCalendarMergeResult]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Upsert (update or insert) a user calendar."""
+        url = f'{self.server_url}/calendar/user_calendars/{discord_id}'
+
+        async with self.session.patch(
+            url,
+            json=body,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], UserCalendarMergeResult](
+                    code=200, result=UserCalendarMergeResult(**(await resp.json()))
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def calendar_delete_user_calendar(
+        self, discord_id: str
+    ) -> (
+        Success[Literal[200], UserCalendarDeleteResult]
+        | Error[Literal[404], None]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Delete a user calendar by Discord ID."""
+        url = f'{self.server_url}/calendar/user_calendars/{discord_id}'
+
+        async with self.session.delete(
+            url,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], UserCalendarDeleteResult](
+                    code=200, result=UserCalendarDeleteResult(**(await resp.json()))
+                )
+            if resp.status == 404:
+                return Error[Literal[404], None](code=404, result=None)
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def calendar_get_guild_events(
+        self, start_after: datetime | None = None, client_id: UUID | None = None
+    ) -> (
+        Success[Literal[200], list[GuildEventSelectResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get all guild events, optionally after a certain date."""
+        url = f'{self.server_url}/calendar/guild_events'
+        params = {
+            'start_after': start_after,
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[GuildEventSelectResult]](
+                    code=200, result=[GuildEventSelectResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def calendar_upsert_guild_event(
+        self, discord_id: str, body: UpsertGuildEventBody, client_id: UUID | None = None
+    ) -> (
+        Success[Literal[200], GuildEventMergeResult]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[403], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Upsert (update or insert) a guild event."""
+        url = f'{self.server_url}/calendar/guild_events/{discord_id}'
+        params = {
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.put(
+            url,
+            params=params,
+            json=body,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], GuildEventMergeResult](
+                    code=200, result=GuildEventMergeResult(**(await resp.json()))
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 403:
+                return Error[Literal[403], HTTPExceptionModel](
+                    code=403, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def calendar_delete_guild_event(
+        self, discord_id: str, client_id: UUID | None = None
+    ) -> (
+        Success[Literal[200], GuildEventDeleteResult]
+        | Error[Literal[404], None]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[403], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Delete a guild event by Discord ID."""
+        url = f'{self.server_url}/calendar/guild_events/{discord_id}'
+        params = {
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.delete(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], GuildEventDeleteResult](
+                    code=200, result=GuildEventDeleteResult(**(await resp.json()))
+                )
+            if resp.status == 404:
+                return Error[Literal[404], None](code=404, result=None)
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 403:
+                return Error[Literal[403], HTTPExceptionModel](
+                    code=403, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def calendar_add_guild_event_participant(
+        self,
+        discord_id: str,
+        participant_id: str,
+        body: ParticipantAddBody,
+        client_id: UUID | None = None,
+    ) -> (
+        Success[Literal[200], GuildEventParticipantAddResult]
+        | Error[Literal[404], None]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[403], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Add a participant to a guild event."""
+        url = f'{self.server_url}/calendar/guild_events/{discord_id}/participants/{participant_id}'
+        params = {
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.put(
+            url,
+            params=params,
+            json=body,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], GuildEventParticipantAddResult](
+                    code=200, result=GuildEventParticipantAddResult(**(await resp.json()))
+                )
+            if resp.status == 404:
+                return Error[Literal[404], None](code=404, result=None)
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 403:
+                return Error[Literal[403], HTTPExceptionModel](
+                    code=403, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def calendar_remove_guild_event_participant(
+        self, discord_id: str, participant_id: str, client_id: UUID | None = None
+    ) -> (
+        Success[Literal[200], GuildEventParticipantRemoveResult]
+        | Error[Literal[404], None]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[403], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Remove a participant from a guild event."""
+        url = f'{self.server_url}/calendar/guild_events/{discord_id}/participants/{participant_id}'
+        params = {
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.delete(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], GuildEventParticipantRemoveResult](
+                    code=200, result=GuildEventParticipantRemoveResult(**(await resp.json()))
+                )
+            if resp.status == 404:
+                return Error[Literal[404], None](code=404, result=None)
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 403:
+                return Error[Literal[403], HTTPExceptionModel](
+                    code=403, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def calendar_get_ics(
+        self, client: str, user: str | None = None, aggregate: bool | None = None
+    ) -> (
+        Success[Literal[200], None]
+        | Error[Literal[404], None]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get an iCalendar (ICS) file for a client and optionally a user."""
+        url = f'{self.server_url}/calendar/ics'
+        params = {
+            'client': client,
+            'user': user,
+            'aggregate': aggregate,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], None](code=200, result=None)
+            if resp.status == 404:
+                return Error[Literal[404], None](code=404, result=None)
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
@@ -0,0 +1,135 @@
+from typing import TYPE_CHECKING, Literal
+from uuid import UUID
+
+import aiohttp
+
+from ._client import Error, Success, prep_serialization
+from .model import (
+    Body_client_login,
+    ClientInsertResult,
+    HTTPExceptionModel,
+    HTTPValidationError,
+    LoginResponse,
+    NewClientBody,
+    WhoamiResponse,
+)
+
+if TYPE_CHECKING:
+    from ._client import ClientSession
+
+
+class ClientModule:
+    def __init__(self, session: 'ClientSession', server_url: str):
+        self.session: ClientSession = session
+        self.server_url: str = server_url
+
+    async def client_whoami(
+        self, client_id: UUID | None = None
+    ) -> (
+        Success[Literal[200], WhoamiResponse]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Get information about the currently authenticated client."""
+        url = f'{self.server_url}/clients/'
+        params = {
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], WhoamiResponse](
+                    code=200, result=WhoamiResponse(**(await resp.json()))
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def client_register(
+        self, body: NewClientBody
+    ) -> (
+        Success[Literal[201], ClientInsertResult]
+        | Error[Literal[409], HTTPExceptionModel]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Register a new client account."""
+        url = f'{self.server_url}/clients/'
+
+        async with self.session.post(
+            url,
+            json=body,
+        ) as resp:
+            if resp.status == 201:
+                return Success[Literal[201], ClientInsertResult](
+                    code=201, result=ClientInsertResult(**(await resp.json()))
+                )
+            if resp.status == 409:
+                return Error[Literal[409], HTTPExceptionModel](
+                    code=409, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def client_login(
+        self, body: Body_client_login
+    ) -> (
+        Success[Literal[201], LoginResponse]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Authenticate client and return JWT access token."""
+        url = f'{self.server_url}/clients/token'
+
+        async with self.session.post(
+            url,
+            data=aiohttp.FormData(body.model_dump(by_alias=True)),
+        ) as resp:
+            if resp.status == 201:
+                return Success[Literal[201], LoginResponse](
+                    code=201, result=LoginResponse(**(await resp.json()))
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
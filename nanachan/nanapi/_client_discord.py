@@ -0,0 +1,248 @@
+from typing import TYPE_CHECKING, Literal
+from uuid import UUID
+
+import aiohttp
+
+from ._client import Error, Success, prep_serialization
+from .model import (
+    BulkUpdateMessageNoindexBodyItem,
+    HTTPExceptionModel,
+    HTTPValidationError,
+    MessageBulkDeleteResult,
+    MessageBulkInsertResult,
+    MessageBulkUpdateNoindexResult,
+    MessageMergeResult,
+    MessagesRagResult,
+)
+
+if TYPE_CHECKING:
+    from ._client import ClientSession
+
+
+class DiscordModule:
+    def __init__(self, session: 'ClientSession', server_url: str):
+        self.session: ClientSession = session
+        self.server_url: str = server_url
+
+    async def discord_bulk_insert_messages(
+        self, body: list[str], client_id: UUID | None = None
+    ) -> (
+        Success[Literal[200], list[MessageBulkInsertResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[403], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Bulk create Discord messages."""
+        url = f'{self.server_url}/discord/messages'
+        params = {
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.post(
+            url,
+            params=params,
+            json=body,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[MessageBulkInsertResult]](
+                    code=200, result=[MessageBulkInsertResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 403:
+                return Error[Literal[403], HTTPExceptionModel](
+                    code=403, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def discord_delete_messages(
+        self, message_ids: str, client_id: UUID | None = None
+    ) -> (
+        Success[Literal[200], list[MessageBulkDeleteResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[403], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Delete Discord messages."""
+        url = f'{self.server_url}/discord/messages'
+        params = {
+            'message_ids': message_ids,
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.delete(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[MessageBulkDeleteResult]](
+                    code=200, result=[MessageBulkDeleteResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 403:
+                return Error[Literal[403], HTTPExceptionModel](
+                    code=403, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def discord_messages_rag(
+        self, search_query: str, limit: int | None = None, client_id: UUID | None = None
+    ) -> (
+        Success[Literal[200], list[MessagesRagResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Retrieve relevant chat sections based on a search query in French."""
+        url = f'{self.server_url}/discord/messages/rag'
+        params = {
+            'search_query': search_query,
+            'limit': limit,
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.get(
+            url,
+            params=params,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[MessagesRagResult]](
+                    code=200, result=[MessagesRagResult(**e) for e in (await resp.json())]
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def discord_upsert_message(
+        self, message_id: str, body: str, noindex: str | None = None, client_id: UUID | None = None
+    ) -> (
+        Success[Literal[200], MessageMergeResult]
+        | Error[Literal[400], HTTPExceptionModel]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[403], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Create or update a Discord message."""
+        url = f'{self.server_url}/discord/messages/{message_id}'
+        params = {
+            'noindex': noindex,
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.put(
+            url,
+            params=params,
+            json=body,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], MessageMergeResult](
+                    code=200, result=MessageMergeResult(**(await resp.json()))
+                )
+            if resp.status == 400:
+                return Error[Literal[400], HTTPExceptionModel](
+                    code=400, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 403:
+                return Error[Literal[403], HTTPExceptionModel](
+                    code=403, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
+
+    async def discord_bulk_update_message_noindex(
+        self, body: list[BulkUpdateMessageNoindexBodyItem], client_id: UUID | None = None
+    ) -> (
+        Success[Literal[200], list[MessageBulkUpdateNoindexResult]]
+        | Error[Literal[401], HTTPExceptionModel]
+        | Error[Literal[403], HTTPExceptionModel]
+        | Error[Literal[422], HTTPValidationError]
+    ):
+        """Update indexation instructions for multiple Discord messages."""
+        url = f'{self.server_url}/discord/noindex'
+        params = {
+            'client_id': client_id,
+        }
+        params = prep_serialization(params)
+
+        async with self.session.put(
+            url,
+            params=params,
+            json=body,
+        ) as resp:
+            if resp.status == 200:
+                return Success[Literal[200], list[MessageBulkUpdateNoindexResult]](
+                    code=200,
+                    result=[MessageBulkUpdateNoindexResult(**e) for e in (await resp.json())],
+                )
+            if resp.status == 401:
+                return Error[Literal[401], HTTPExceptionModel](
+                    code=401, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 403:
+                return Error[Literal[403], HTTPExceptionModel](
+                    code=403, result=HTTPExceptionModel(**(await resp.json()))
+                )
+            if resp.status == 422:
+                return Error[Literal[422], HTTPValidationError](
+                    code=422, result=HTTPValidationError(**(await resp.json()))
+                )
+            raise aiohttp.ClientResponseError(
+                resp.request_info,
+                resp.history,
+                status=resp.status,
+                message=str(resp.reason),
+                headers=resp.headers,
+            )
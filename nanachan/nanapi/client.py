@@ -1,11 +1,17 @@
 import asyncio
 import base64
+import json
+import logging
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from functools import cache
 from types import CoroutineType
-from typing import Any, Callable, cast
+from typing import Any, Callable, Coroutine, cast
 
 import backoff
-from aiohttp import ClientResponse
+from aiohttp import ClientError, ClientResponse
+from yarl import URL
 
 from nanachan.nanapi._client import Error as Error  # noqa: F401
 from nanachan.nanapi._client import Success as Success  # noqa: F401
@@ -13,10 +19,154 @@ from nanachan.nanapi._client import get_session
 from nanachan.nanapi._client import success as success
 from nanachan.nanapi.model import Body_client_login
 from nanachan.settings import NANAPI_CLIENT_PASSWORD, NANAPI_CLIENT_USERNAME, NANAPI_URL
+from nanachan.utils.scheduler import get_scheduler
+
+logger = logging.getLogger(__name__)
 
 bearer_token: str | None = None
-bearer_ready = asyncio.Event()
-load_lock = asyncio.Lock()
+refresh_task: asyncio.Task[str] | None = None
+
+# the token is renewed in the background this long before it expires
+TOKEN_REFRESH_MARGIN = 300
+TOKEN_REFRESH_RETRY = 10
+
+# retries are capped per call and drawn from a client-wide token bucket so that
+# a nanapi outage does not turn every pending coroutine into an endless retry loop
+RETRY_MAX_TIME = 120
+RETRY_MAX_WAIT = 30
+RETRY_BUDGET_CAPACITY = 30
+RETRY_BUDGET_REFILL_RATE = 1
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 30
+BATCH_CONCURRENCY = 8
+
+_fail_fast: ContextVar[bool] = ContextVar('nanapi_fail_fast', default=False)
+
+
+class NanapiUnavailable(ClientError):
+    """Raised when a request is refused because its endpoint group circuit is open."""
+
+    def __init__(self, group: str, retry_in: float):
+        self.group = group
+        self.retry_in = retry_in
+        super().__init__(f'nanapi {group!r} endpoints unavailable, retry in {retry_in:.0f}s')
+
+
+class RetryBudget:
+    """Token bucket shared by every nanapi call, one token per retry."""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+
+    def acquire(self) -> bool:
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.last_refill = now
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures and lets a probe through once cooled down."""
+
+    def __init__(self, group: str, threshold: int, cooldown: float):
+        self.group = group
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    @property
+    def retry_in(self) -> float:
+        if self.opened_at is None:
+            return 0
+        return max(0, self.opened_at + self.cooldown - time.monotonic())
+
+    def check(self):
+        if self.opened_at is not None and self.retry_in > 0:
+            raise NanapiUnavailable(self.group, self.retry_in)
+
+    def record(self, ok: bool):
+        if ok:
+            if self.opened_at is not None:
+                logger.info(f'nanapi {self.group!r} circuit closed')
+            self.failures = 0
+            self.opened_at = None
+            return
+
+        self.failures += 1
+        if self.failures >= self.threshold:
+            if self.opened_at is None:
+                logger.warning(f'nanapi {self.group!r} circuit opened')
+            self.opened_at = time.monotonic()
+
+
+retry_budget = RetryBudget(RETRY_BUDGET_CAPACITY, RETRY_BUDGET_REFILL_RATE)
+breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(url: str | URL) -> CircuitBreaker:
+    path = str(url).removeprefix(NANAPI_URL).lstrip('/')
+    group = path.split('/', 1)[0].split('?', 1)[0]
+    if group not in breakers:
+        breakers[group] = CircuitBreaker(group, BREAKER_THRESHOLD, BREAKER_COOLDOWN)
+    return breakers[group]
+
+
+@contextmanager
+def fail_fast():
+    """Disable retries for nanapi calls made in this context.
+
+    Meant for latency-sensitive callers such as autocompletes, which are better off
+    answering nothing than answering too late.
+    """
+    token = _fail_fast.set(True)
+    try:
+        yield
+    finally:
+        _fail_fast.reset(token)
+
+
+class Batch:
+    """Bounded task group for fanning out nanapi calls.
+
+    nanapi has no multiplexing endpoint: this is a bounded gather, every call is still
+    its own request. Calls submitted to the same batch share the session connection pool
+    and are dispatched concurrently, ``concurrency`` at a time (all at once if None).
+    """
+
+    def __init__(self, task_group: asyncio.TaskGroup, concurrency: int | None):
+        self.task_group = task_group
+        self.semaphore = asyncio.Semaphore(concurrency) if concurrency is not None else None
+
+    def submit[T](self, coro: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
+        if self.semaphore is None:
+            return self.task_group.create_task(coro)
+        return self.task_group.create_task(self._run(coro, self.semaphore))
+
+    @staticmethod
+    async def _run[T](coro: Coroutine[Any, Any, T], semaphore: asyncio.Semaphore) -> T:
+        async with semaphore:
+            return await coro
+
+
+@asynccontextmanager
+async def batch(concurrency: int | None = BATCH_CONCURRENCY):
+    """Runs every call submitted in the context, results are ready once it exits.
+
+    The default bound suits bulk writes; pass ``concurrency=None`` for the small read
+    fan-outs of a single command, which should not wait on each other.
+    """
+    async with asyncio.TaskGroup() as tg:
+        yield Batch(tg, concurrency)
 
 
 def check_invalid(r: ClientResponse):
@@ -25,42 +175,104 @@ def check_invalid(r: ClientResponse):
     )
 
 
-async def load_bearer_token():
+def should_retry(r: ClientResponse):
+    return check_invalid(r) and not _fail_fast.get() and retry_budget.acquire()
+
+
+session_backoff = backoff.on_predicate(
+    backoff.expo,
+    should_retry,
+    max_time=RETRY_MAX_TIME,
+    jitter=backoff.full_jitter,
+    max_value=RETRY_MAX_WAIT,
+)
+
+
+def token_expiry(token: str) -> float | None:
+    """Reads the ``exp`` claim of a JWT without verifying it"""
+    try:
+        _, payload, _ = token.split('.')
+        payload += '=' * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+@cache
+def get_login_session():
+    session = get_session(NANAPI_URL)
+    session._request = session_backoff(wrap_breaker(session._request))  # pyright: ignore[reportPrivateUsage]
+    return session
+
+
+async def load_bearer_token() -> str:
     global bearer_token
-    if load_lock.locked():
+
+    body = Body_client_login(
+        grant_type='password', username=NANAPI_CLIENT_USERNAME, password=NANAPI_CLIENT_PASSWORD
+    )
+    resp = await get_login_session().client.client_login(body)
+    resp = resp.raise_exc()
+
+    # in-flight requests keep the token they were sent with, new ones pick this one
+    bearer_token = resp.result.access_token
+    schedule_refresh(bearer_token)
+    return bearer_token
+
+
+def refresh_bearer_token() -> asyncio.Task[str]:
+    """Returns the running token refresh, starting one if needed.
+
+    Every caller shares the same task, so concurrent 401s only trigger a single login
+    and all of them wait for it.
+    """
+    global refresh_task
+    if refresh_task is None or refresh_task.done():
+        refresh_task = asyncio.create_task(load_bearer_token())
+    return refresh_task
+
+
+def schedule_refresh(token: str):
+    get_scheduler().cancel('nanapi_token_refresh')
+
+    expiry = token_expiry(token)
+    if expiry is None:
         return
-    async with load_lock:
-        bearer_ready.clear()
 
-        session = get_session(NANAPI_URL)
-        session_backoff = backoff.on_predicate(backoff.expo, check_invalid)
-        session._request = session_backoff(session._request)  # pyright: ignore[reportPrivateUsage]
+    get_scheduler().schedule(
+        expiry - TOKEN_REFRESH_MARGIN,
+        lambda: proactive_refresh(expiry),
+        'nanapi_token_refresh',
+    )
 
-        body = Body_client_login(
-            grant_type='password', username=NANAPI_CLIENT_USERNAME, password=NANAPI_CLIENT_PASSWORD
-        )
-        resp = await session.client.client_login(body)
-        resp = resp.raise_exc()
 
-        bearer_token = resp.result.access_token
-        bearer_ready.set()
+async def proactive_refresh(expiry: float):
+    try:
+        await refresh_bearer_token()
+    except Exception as e:
+        logger.warning(f'nanapi token refresh failed: {e!r}')
+        # keep trying while the current token is still usable, 401s take over afterwards
+        if time.time() + TOKEN_REFRESH_RETRY < expiry:
+            get_scheduler().schedule_in(
+                TOKEN_REFRESH_RETRY, lambda: proactive_refresh(expiry), 'nanapi_token_refresh'
+            )
 
 
 @cache
 def get_nanapi():
     session = get_session(NANAPI_URL)
 
-    session_backoff = backoff.on_predicate(backoff.expo, check_invalid)
-
     async def auth_on_backoff(details):
-        await load_bearer_token()
-        await bearer_ready.wait()
+        resp = cast(ClientResponse, details['value'])
+        # skip the login if the token was already replaced since this request was sent
+        if resp.request_info.headers.get('Authorization') == f'Bearer {bearer_token}':
+            await refresh_bearer_token()
 
     auth_backoff = backoff.on_predicate(
         backoff.expo, lambda r: r.status == 401, max_tries=2, on_backoff=auth_on_backoff
     )
 
-    session._request = auth_backoff(session_backoff(wrap_request(session._request)))  # pyright: ignore[reportPrivateUsage]
+    session._request = auth_backoff(session_backoff(wrap_request(wrap_breaker(session._request))))  # pyright: ignore[reportPrivateUsage]
 
     return session
 
@@ -80,16 +292,36 @@ def wrap_request[**P, T](
     """Adds bearer authorization token to requests"""
 
     async def _wrapped(*args: P.args, **kwargs: P.kwargs):
-        if not bearer_ready.is_set():
-            await load_bearer_token()
-        await bearer_ready.wait()
-        headers = {'Authorization': f'Bearer {bearer_token}'}
+        token = bearer_token
+        if token is None:
+            token = await refresh_bearer_token()
+        headers = {'Authorization': f'Bearer {token}'}
         cast(dict[str, Any], kwargs.setdefault('headers', {})).update(headers)
         return await _request(*args, **kwargs)
 
     return _wrapped
 
 
+def wrap_breaker[**P](
+    _request: Callable[P, CoroutineType[Any, Any, ClientResponse]],
+) -> Callable[P, CoroutineType[Any, Any, ClientResponse]]:
+    """Refuses requests to endpoint groups whose circuit is open"""
+
+    async def _wrapped(*args: P.args, **kwargs: P.kwargs):
+        _method, url, *_ = args
+        breaker = get_breaker(cast(str | URL, url))
+        breaker.check()
+        try:
+            resp = await _request(*args, **kwargs)
+        except (ClientError, asyncio.TimeoutError):
+            breaker.record(False)
+            raise
+        breaker.record(not check_invalid(resp))
+        return resp
+
+    return _wrapped
+
+
 def wrap_basic_auth[**P, T](
     _request: Callable[P, CoroutineType[Any, Any, T]], username: str, password: str
 ) -> Callable[P, CoroutineType[Any, Any, T]]:
@@ -89,41 +89,41 @@ class WaicolleRank(str, Enum):
 
 
 class AccountMergeResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class AccountSelectAllResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     service: 'AnilistService'
     user: 'AccountSelectAllResultUser'
     username: str
 
 
 class AccountSelectAllResultUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class AccountSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'AccountSelectResultUser'
     username: str
 
 
 class AccountSelectResultUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class AddPlayerCoinsBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     moecoins: int | None = None
     blood_shards: int | None = None
 
 
 class Body_client_login(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     username: str
     password: Any
     grant_type: str | None = None
@@ -133,13 +133,13 @@ class Body_client_login(BaseModel):
 
 
 class BulkUpdateMessageNoindexBodyItem(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     message_id: str
     noindex: str
 
 
 class BulkUpdateWaifusBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     ids: list[str]
     locked: bool | None = None
     blooded: bool | None = None
@@ -148,14 +148,14 @@ class BulkUpdateWaifusBody(BaseModel):
 
 
 class CEdgeSelectFilterCharaResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     character_role: 'AnilistCharacterRole'
     media: 'CEdgeSelectFilterCharaResultMedia'
     voice_actors: list['CEdgeSelectFilterCharaResultVoiceActors']
 
 
 class CEdgeSelectFilterCharaResultMedia(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     chapters: int | None
     cover_image_color: str | None
     cover_image_extra_large: str
@@ -180,7 +180,7 @@ class CEdgeSelectFilterCharaResultMedia(BaseModel):
 
 
 class CEdgeSelectFilterCharaResultVoiceActors(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age: int | None
     date_of_birth_day: int | None
     date_of_birth_month: int | None
@@ -200,14 +200,14 @@ class CEdgeSelectFilterCharaResultVoiceActors(BaseModel):
 
 
 class CEdgeSelectFilterMediaResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     character: 'CEdgeSelectFilterMediaResultCharacter'
     character_role: 'AnilistCharacterRole'
     voice_actors: list['CEdgeSelectFilterMediaResultVoiceActors']
 
 
 class CEdgeSelectFilterMediaResultCharacter(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age: str | None
     date_of_birth_day: int | None
     date_of_birth_month: int | None
@@ -227,7 +227,7 @@ class CEdgeSelectFilterMediaResultCharacter(BaseModel):
 
 
 class CEdgeSelectFilterMediaResultVoiceActors(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age: int | None
     date_of_birth_day: int | None
     date_of_birth_month: int | None
@@ -247,14 +247,14 @@ class CEdgeSelectFilterMediaResultVoiceActors(BaseModel):
 
 
 class CEdgeSelectFilterStaffResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     character: 'CEdgeSelectFilterStaffResultCharacter'
     character_role: 'AnilistCharacterRole'
     media: 'CEdgeSelectFilterStaffResultMedia'
 
 
 class CEdgeSelectFilterStaffResultCharacter(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age: str | None
     date_of_birth_day: int | None
     date_of_birth_month: int | None
@@ -274,7 +274,7 @@ class CEdgeSelectFilterStaffResultCharacter(BaseModel):
 
 
 class CEdgeSelectFilterStaffResultMedia(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     chapters: int | None
     cover_image_color: str | None
     cover_image_extra_large: str
@@ -299,14 +299,14 @@ class CEdgeSelectFilterStaffResultMedia(BaseModel):
 
 
 class CharaNameAutocompleteResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
     name_user_preferred: str
     name_native: str | None = None
 
 
 class CharaSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age: str | None
     date_of_birth_day: int | None
     date_of_birth_month: int | None
@@ -326,62 +326,62 @@ class CharaSelectResult(BaseModel):
 
 
 class ClientInsertResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class CollageResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     total: int
     url: str | None = None
 
 
 class CollectPotBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_username: str
     amount: float
 
 
 class CollectionAddMediaResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     collection: 'CollectionAddMediaResultCollection'
     media: 'CollectionAddMediaResultMedia'
 
 
 class CollectionAddMediaResultCollection(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
     name: str
 
 
 class CollectionAddMediaResultMedia(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
     title_user_preferred: str
     type: 'AnilistMediaType'
 
 
 class CollectionAddStaffResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     collection: 'CollectionAddStaffResultCollection'
     staff: 'CollectionAddStaffResultStaff'
 
 
 class CollectionAddStaffResultCollection(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
     name: str
 
 
 class CollectionAddStaffResultStaff(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
     name_native: str | None
     name_user_preferred: str
 
 
 class CollectionAlbumResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     total: int
     owned: int
     collection: 'CollectionGetByIdResult'
@@ -389,12 +389,12 @@ class CollectionAlbumResult(BaseModel):
 
 
 class CollectionDeleteResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class CollectionGetByIdResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     author: 'CollectionGetByIdResultAuthor'
     characters_ids_al: list[int]
     id: UUID
@@ -404,100 +404,100 @@ class CollectionGetByIdResult(BaseModel):
 
 
 class CollectionGetByIdResultAuthor(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'CollectionGetByIdResultAuthorUser'
 
 
 class CollectionGetByIdResultAuthorUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class CollectionInsertResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     author: 'CollectionInsertResultAuthor'
     id: UUID
     name: str
 
 
 class CollectionInsertResultAuthor(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'CollectionInsertResultAuthorUser'
 
 
 class CollectionInsertResultAuthorUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class CollectionNameAutocompleteResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
     name: str
     author_discord_id: str
 
 
 class CollectionRemoveMediaResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class CollectionRemoveStaffResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class CommitTradeResponse(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     received: list['WaifuSelectResult']
     offered: list['WaifuSelectResult']
 
 
 class CouponDeleteResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class CouponInsertResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     code: str
 
 
 class CouponSelectAllResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     claimed_by: list['CouponSelectAllResultClaimedBy']
     code: str
 
 
 class CouponSelectAllResultClaimedBy(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'CouponSelectAllResultClaimedByUser'
 
 
 class CouponSelectAllResultClaimedByUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class CustomizeWaifuBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     custom_image: str | None = None
     custom_name: str | None = None
 
 
 class DonatePlayerCoinsBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     moecoins: int
 
 
 class EndGameBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     winner_discord_id: str
     winner_discord_username: str
 
 
 class EntrySelectAllResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     account: 'EntrySelectAllResultAccount'
     media: 'EntrySelectAllResultMedia'
     progress: int
@@ -506,22 +506,22 @@ class EntrySelectAllResult(BaseModel):
 
 
 class EntrySelectAllResultAccount(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'EntrySelectAllResultAccountUser'
 
 
 class EntrySelectAllResultAccountUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class EntrySelectAllResultMedia(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
 
 
 class EntrySelectFilterMediaResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     account: 'EntrySelectFilterMediaResultAccount'
     progress: int
     score: float
@@ -529,22 +529,22 @@ class EntrySelectFilterMediaResult(BaseModel):
 
 
 class EntrySelectFilterMediaResultAccount(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'EntrySelectFilterMediaResultAccountUser'
 
 
 class EntrySelectFilterMediaResultAccountUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class GameDeleteByMessageIdResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class GameEndResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     ended_at: datetime | None
     id: UUID
     message_id: str
@@ -555,7 +555,7 @@ class GameEndResult(BaseModel):
 
 
 class GameEndResultQuizz(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     answer: str | None
     attachment_url: str | None
     author: 'GameEndResultQuizzAuthor'
@@ -567,17 +567,17 @@ class GameEndResultQuizz(BaseModel):
 
 
 class GameEndResultQuizzAuthor(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class GameEndResultWinner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class GameGetByIdResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     ended_at: datetime | None
     id: UUID
     message_id: str
@@ -588,7 +588,7 @@ class GameGetByIdResult(BaseModel):
 
 
 class GameGetByIdResultQuizz(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     answer: str | None
     attachment_url: str | None
     author: 'GameGetByIdResultQuizzAuthor'
@@ -600,17 +600,17 @@ class GameGetByIdResultQuizz(BaseModel):
 
 
 class GameGetByIdResultQuizzAuthor(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class GameGetByIdResultWinner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class GameGetCurrentResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     ended_at: datetime | None
     id: UUID
     message_id: str
@@ -621,7 +621,7 @@ class GameGetCurrentResult(BaseModel):
 
 
 class GameGetCurrentResultQuizz(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     answer: str | None
     attachment_url: str | None
     author: 'GameGetCurrentResultQuizzAuthor'
@@ -633,17 +633,17 @@ class GameGetCurrentResultQuizz(BaseModel):
 
 
 class GameGetCurrentResultQuizzAuthor(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class GameGetCurrentResultWinner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class GameGetLastResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     ended_at: datetime | None
     id: UUID
     message_id: str
@@ -654,7 +654,7 @@ class GameGetLastResult(BaseModel):
 
 
 class GameGetLastResultQuizz(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     answer: str | None
     attachment_url: str | None
     author: 'GameGetLastResultQuizzAuthor'
@@ -666,22 +666,22 @@ class GameGetLastResultQuizz(BaseModel):
 
 
 class GameGetLastResultQuizzAuthor(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class GameGetLastResultWinner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class GameNewResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class GameSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     ended_at: datetime | None
     id: UUID
     message_id: str
@@ -692,7 +692,7 @@ class GameSelectResult(BaseModel):
 
 
 class GameSelectResultQuizz(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     answer: str | None
     attachment_url: str | None
     author: 'GameSelectResultQuizzAuthor'
@@ -704,17 +704,17 @@ class GameSelectResultQuizz(BaseModel):
 
 
 class GameSelectResultQuizzAuthor(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class GameSelectResultWinner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class GuildEventDeleteResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     client: 'GuildEventDeleteResultClient'
     description: str | None
     discord_id: str
@@ -731,14 +731,14 @@ class GuildEventDeleteResult(BaseModel):
 
 
 class GuildEventDeleteResultClient(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
     password_hash: str
     username: str
 
 
 class GuildEventDeleteResultOrganizer(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age_verified: bool
     discord_id: str
     discord_username: str
@@ -746,7 +746,7 @@ class GuildEventDeleteResultOrganizer(BaseModel):
 
 
 class GuildEventDeleteResultParticipants(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age_verified: bool
     discord_id: str
     discord_username: str
@@ -754,7 +754,7 @@ class GuildEventDeleteResultParticipants(BaseModel):
 
 
 class GuildEventDeleteResultProjection(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     channel_id: str
     id: UUID
     message_id: str | None
@@ -763,7 +763,7 @@ class GuildEventDeleteResultProjection(BaseModel):
 
 
 class GuildEventMergeResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     client: 'GuildEventMergeResultClient'
     description: str | None
     discord_id: str
@@ -780,14 +780,14 @@ class GuildEventMergeResult(BaseModel):
 
 
 class GuildEventMergeResultClient(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
     password_hash: str
     username: str
 
 
 class GuildEventMergeResultOrganizer(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age_verified: bool
     discord_id: str
     discord_username: str
@@ -795,7 +795,7 @@ class GuildEventMergeResultOrganizer(BaseModel):
 
 
 class GuildEventMergeResultParticipants(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age_verified: bool
     discord_id: str
     discord_username: str
@@ -803,7 +803,7 @@ class GuildEventMergeResultParticipants(BaseModel):
 
 
 class GuildEventMergeResultProjection(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     channel_id: str
     id: UUID
     message_id: str | None
@@ -812,17 +812,17 @@ class GuildEventMergeResultProjection(BaseModel):
 
 
 class GuildEventParticipantAddResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class GuildEventParticipantRemoveResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class GuildEventSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     client: 'GuildEventSelectResultClient'
     description: str | None
     discord_id: str
@@ -839,14 +839,14 @@ class GuildEventSelectResult(BaseModel):
 
 
 class GuildEventSelectResultClient(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
     password_hash: str
     username: str
 
 
 class GuildEventSelectResultOrganizer(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age_verified: bool
     discord_id: str
     discord_username: str
@@ -854,7 +854,7 @@ class GuildEventSelectResultOrganizer(BaseModel):
 
 
 class GuildEventSelectResultParticipants(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age_verified: bool
     discord_id: str
     discord_username: str
@@ -862,7 +862,7 @@ class GuildEventSelectResultParticipants(BaseModel):
 
 
 class GuildEventSelectResultProjection(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     channel_id: str
     id: UUID
     message_id: str | None
@@ -871,22 +871,22 @@ class GuildEventSelectResultProjection(BaseModel):
 
 
 class HTTPExceptionModel(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     detail: str
 
 
 class HTTPValidationError(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     detail: list['ValidationError'] | None = None
 
 
 class HistoireDeleteByIdResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class HistoireGetByIdResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     formatted: bool
     id: UUID
     text: str
@@ -894,31 +894,31 @@ class HistoireGetByIdResult(BaseModel):
 
 
 class HistoireInsertResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class HistoireSelectIdTitleResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
     title: str
 
 
 class InsertSkillBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     name: str
     description: str
     content: str
 
 
 class LoginResponse(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     access_token: str
     token_type: str
 
 
 class MediaAlbumResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     total: int
     owned: int
     media: 'MediaSelectResult'
@@ -926,7 +926,7 @@ class MediaAlbumResult(BaseModel):
 
 
 class MediaSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     chapters: int | None
     cover_image_color: str | None
     cover_image_extra_large: str
@@ -951,101 +951,101 @@ class MediaSelectResult(BaseModel):
 
 
 class MediaTitleAutocompleteResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
     title_user_preferred: str
     type: 'MediaType'
 
 
 class MediasPoolExportResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     favourites: int
     id_al: int
     image: str
 
 
 class MessageBulkDeleteResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class MessageBulkInsertResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class MessageBulkUpdateNoindexResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class MessageMergeResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class MessagesRagResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     object: 'RagQueryResultObject'
     distance: float
 
 
 class NewClientBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     username: str
     password: str
 
 
 class NewCollectionBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
     name: str
 
 
 class NewCouponBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     code: str | None = None
 
 
 class NewGameBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     message_id: str
     quizz_id: UUID
 
 
 class NewHistoireBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     title: str
     text: str
 
 
 class NewLootBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     player_discord_id: str
     chara_id_al: int
 
 
 class NewOfferingBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     player_discord_id: str
     chara_id_al: int
     bot_discord_id: str
 
 
 class NewPresenceBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     type: Literal['PLAYING', 'LISTENING', 'WATCHING']
     name: str
 
 
 class NewProjectionBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     name: str
     channel_id: str
 
 
 class NewQuizzBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     channel_id: str
     author_discord_id: str
     author_discord_username: str
@@ -1056,7 +1056,7 @@ class NewQuizzBody(BaseModel):
 
 
 class NewReminderBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
     discord_username: str
     channel_id: str
@@ -1065,13 +1065,13 @@ class NewReminderBody(BaseModel):
 
 
 class NewRoleBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     role_id: str
     emoji: str
 
 
 class NewTradeBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     author_discord_id: str
     received_ids: list[str]
     offeree_discord_id: str
@@ -1080,12 +1080,12 @@ class NewTradeBody(BaseModel):
 
 
 class ParticipantAddBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     participant_username: str
 
 
 class PlayerAddCoinsResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     blood_shards: int
     frozen_at: datetime | None
     game_mode: 'WaicolleGameMode'
@@ -1095,72 +1095,72 @@ class PlayerAddCoinsResult(BaseModel):
 
 
 class PlayerAddCoinsResultUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class PlayerAddCollectionResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     collection: 'PlayerAddCollectionResultCollection'
     player: 'PlayerAddCollectionResultPlayer'
 
 
 class PlayerAddCollectionResultCollection(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
     name: str
 
 
 class PlayerAddCollectionResultPlayer(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class PlayerAddMediaResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     media: 'PlayerAddMediaResultMedia'
     player: 'PlayerAddMediaResultPlayer'
 
 
 class PlayerAddMediaResultMedia(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
     title_user_preferred: str
     type: 'AnilistMediaType'
 
 
 class PlayerAddMediaResultPlayer(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class PlayerAddStaffResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     player: 'PlayerAddStaffResultPlayer'
     staff: 'PlayerAddStaffResultStaff'
 
 
 class PlayerAddStaffResultPlayer(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class PlayerAddStaffResultStaff(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
     name_native: str | None
     name_user_preferred: str
 
 
 class PlayerCollectionStatsResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     collection: 'PlayerCollectionStatsResultCollection'
     nb_charas: int
     nb_owned: int
 
 
 class PlayerCollectionStatsResultCollection(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     author: 'PlayerCollectionStatsResultCollectionAuthor'
     id: UUID
     medias: list['PlayerCollectionStatsResultCollectionMedias']
@@ -1169,36 +1169,36 @@ class PlayerCollectionStatsResultCollection(BaseModel):
 
 
 class PlayerCollectionStatsResultCollectionAuthor(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'PlayerCollectionStatsResultCollectionAuthorUser'
 
 
 class PlayerCollectionStatsResultCollectionAuthorUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class PlayerCollectionStatsResultCollectionMedias(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
     title_user_preferred: str
     type: 'AnilistMediaType'
 
 
 class PlayerCollectionStatsResultCollectionStaffs(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
     name_native: str | None
     name_user_preferred: str
 
 
 class PlayerFreezeResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class PlayerGetByUserResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     blood_shards: int
     frozen_at: datetime | None
     game_mode: 'WaicolleGameMode'
@@ -1208,52 +1208,52 @@ class PlayerGetByUserResult(BaseModel):
 
 
 class PlayerGetByUserResultUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age_verified: bool
     discord_id: str
 
 
 class PlayerMediaStatsResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     media: 'PlayerMediaStatsResultMedia'
     nb_charas: int
     nb_owned: int
 
 
 class PlayerMediaStatsResultMedia(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
     title_user_preferred: str
     type: 'AnilistMediaType'
 
 
 class PlayerMergeResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class PlayerRemoveCollectionResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class PlayerRemoveMediaResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class PlayerRemoveStaffResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class PlayerSelectAllResultUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class PlayerSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     blood_shards: int
     frozen_at: datetime | None
     game_mode: 'WaicolleGameMode'
@@ -1263,90 +1263,90 @@ class PlayerSelectResult(BaseModel):
 
 
 class PlayerStaffStatsResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     nb_charas: int
     nb_owned: int
     staff: 'PlayerStaffStatsResultStaff'
 
 
 class PlayerStaffStatsResultStaff(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
     name_native: str | None
     name_user_preferred: str
 
 
 class PlayerTrackReversedResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     waifu: 'WaifuSelectResult'
     trackers_not_owners: list['PlayerSelectResult']
     locked: list['WaifuSelectResult']
 
 
 class PlayerTrackedItemsResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     tracked_collections: list['PlayerTrackedItemsResultTrackedCollections']
     tracked_medias: list['PlayerTrackedItemsResultTrackedMedias']
     tracked_staffs: list['PlayerTrackedItemsResultTrackedStaffs']
 
 
 class PlayerTrackedItemsResultTrackedCollections(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class PlayerTrackedItemsResultTrackedMedias(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
 
 
 class PlayerTrackedItemsResultTrackedStaffs(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
 
 
 class PotAddResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     amount: float
     count: int
 
 
 class PotGetByUserResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     amount: float
     count: int
 
 
 class PresenceDeleteByIdResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class PresenceInsertResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class PresenceSelectAllResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
     name: str
     type: 'PresencePresenceType'
 
 
 class ProfileGetByDiscordIdResultUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class ProfileSearchBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_ids: list[str] | None = None
     pattern: str | None = None
 
 
 class ProfileSearchResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     birthday: datetime | None
     full_name: str | None
     graduation_year: int | None
@@ -1358,62 +1358,62 @@ class ProfileSearchResult(BaseModel):
 
 
 class ProjoAddEventResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ProjoAddExternalMediaBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     title: str
 
 
 class ProjoAddExternalMediaResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ProjoAddMediaResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ProjoDeleteResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ProjoDeleteUpcomingEventsResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ProjoInsertResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ProjoParticipantAddResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ProjoParticipantRemoveResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ProjoRemoveExternalMediaResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ProjoRemoveMediaResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ProjoSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     channel_id: str
     external_medias: list['ProjoSelectResultExternalMedias']
     guild_events: list['ProjoSelectResultGuildEvents']
@@ -1427,14 +1427,14 @@ class ProjoSelectResult(BaseModel):
 
 
 class ProjoSelectResultExternalMedias(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
     added_alias: datetime | None = Field(validation_alias='@added', serialization_alias='@added')
     title: str
 
 
 class ProjoSelectResultGuildEvents(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     description: str | None
     discord_id: str
     end_time: datetime
@@ -1447,21 +1447,21 @@ class ProjoSelectResultGuildEvents(BaseModel):
 
 
 class ProjoSelectResultLegacyEvents(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     date: datetime
     description: str
     id: UUID
 
 
 class ProjoSelectResultMedias(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
     added_alias: datetime | None = Field(validation_alias='@added', serialization_alias='@added')
     title_user_preferred: str
 
 
 class ProjoSelectResultParticipants(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age_verified: bool
     discord_id: str
     discord_username: str
@@ -1469,27 +1469,27 @@ class ProjoSelectResultParticipants(BaseModel):
 
 
 class ProjoUpdateMessageIdResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ProjoUpdateNameResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ProjoUpdateStatusResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class QuizzDeleteByIdResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class QuizzGetByIdResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     answer: str | None
     attachment_url: str | None
     author: 'QuizzGetByIdResultAuthor'
@@ -1501,12 +1501,12 @@ class QuizzGetByIdResult(BaseModel):
 
 
 class QuizzGetByIdResultAuthor(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class QuizzGetOldestResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     answer: str | None
     attachment_url: str | None
     author: 'QuizzGetOldestResultAuthor'
@@ -1518,35 +1518,35 @@ class QuizzGetOldestResult(BaseModel):
 
 
 class QuizzGetOldestResultAuthor(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class QuizzInsertResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class QuizzSetAnswerResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class RagQueryResultObject(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     context: str
     messages: list['RagQueryResultObjectMessages']
 
 
 class RagQueryResultObjectMessages(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     data: Any
     channel_id: str
     timestamp: datetime
 
 
 class Rank(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     tier: int
     wc_rank: str
     min_favourites: int
@@ -1557,12 +1557,12 @@ class Rank(BaseModel):
 
 
 class ReminderDeleteByIdResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ReminderInsertSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     channel_id: str
     id: UUID
     message: str
@@ -1571,12 +1571,12 @@ class ReminderInsertSelectResult(BaseModel):
 
 
 class ReminderInsertSelectResultUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class ReminderSelectAllResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     channel_id: str
     id: UUID
     message: str
@@ -1585,60 +1585,60 @@ class ReminderSelectAllResult(BaseModel):
 
 
 class ReminderSelectAllResultUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class ReorderWaifuBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     custom_position: Literal['DEFAULT', 'LEFT_OF', 'RIGHT_OF'] | None = None
     other_waifu_id: UUID | None = None
 
 
 class RerollBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     player_discord_id: str
     waifus_ids: list[str]
     bot_discord_id: str
 
 
 class RerollResponse(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     obtained: list['WaifuSelectResult']
     nanascends: list['WaifuSelectResult']
 
 
 class RoleDeleteByRoleIdResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class RoleInsertSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     emoji: str
     role_id: str
 
 
 class RoleSelectAllResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     emoji: str
     role_id: str
 
 
 class RollData(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: str
     name: str
     price: int
 
 
 class SearchIdsALBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     ids_al: list[int]
 
 
 class SearchWaifusBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     ids: list[str] | None = None
     discord_id: str | None = None
     level: int | None = None
@@ -1656,49 +1656,49 @@ class SearchWaifusBody(BaseModel):
 
 
 class SetProjectionMessageIdBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     message_id: str
 
 
 class SetProjectionNameBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     name: str
 
 
 class SetProjectionStatusBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     status: Literal['ONGOING', 'COMPLETED']
 
 
 class SetQuizzAnswerBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     answer: str | None = None
     hints: list[str] | None = None
 
 
 class SettingsMergeResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class SettingsSelectAllResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     key: str
     value: str
 
 
 class SkillDeleteByIdResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class SkillInsertResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class SkillSelectAllResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     content: str
     description: str
     id: UUID
@@ -1706,7 +1706,7 @@ class SkillSelectAllResult(BaseModel):
 
 
 class StaffAlbumResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     total: int
     owned: int
     staff: 'StaffSelectResult'
@@ -1714,14 +1714,14 @@ class StaffAlbumResult(BaseModel):
 
 
 class StaffNameAutocompleteResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
     name_user_preferred: str
     name_native: str | None = None
 
 
 class StaffSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age: int | None
     date_of_birth_day: int | None
     date_of_birth_month: int | None
@@ -1741,12 +1741,12 @@ class StaffSelectResult(BaseModel):
 
 
 class TradeDeleteResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class TradeSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     author: 'TradeSelectResultAuthor'
     blood_shards: int
     completed_at: datetime | None
@@ -1758,17 +1758,17 @@ class TradeSelectResult(BaseModel):
 
 
 class TradeSelectResultAuthor(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'TradeSelectResultAuthorUser'
 
 
 class TradeSelectResultAuthorUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class TradeSelectResultOffered(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     blooded: bool
     character: 'TradeSelectResultOfferedCharacter'
     custom_collage: bool
@@ -1789,47 +1789,47 @@ class TradeSelectResultOffered(BaseModel):
 
 
 class TradeSelectResultOfferedCharacter(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
 
 
 class TradeSelectResultOfferedCustomPositionWaifu(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class TradeSelectResultOfferedOriginalOwner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'TradeSelectResultOfferedOriginalOwnerUser'
 
 
 class TradeSelectResultOfferedOriginalOwnerUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class TradeSelectResultOfferedOwner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'TradeSelectResultOfferedOwnerUser'
 
 
 class TradeSelectResultOfferedOwnerUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class TradeSelectResultOfferee(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'TradeSelectResultOffereeUser'
 
 
 class TradeSelectResultOffereeUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class TradeSelectResultReceived(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     blooded: bool
     character: 'TradeSelectResultReceivedCharacter'
     custom_collage: bool
@@ -1850,56 +1850,56 @@ class TradeSelectResultReceived(BaseModel):
 
 
 class TradeSelectResultReceivedCharacter(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
 
 
 class TradeSelectResultReceivedCustomPositionWaifu(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class TradeSelectResultReceivedOriginalOwner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'TradeSelectResultReceivedOriginalOwnerUser'
 
 
 class TradeSelectResultReceivedOriginalOwnerUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class TradeSelectResultReceivedOwner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'TradeSelectResultReceivedOwnerUser'
 
 
 class TradeSelectResultReceivedOwnerUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class UpsertAMQAccountBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_username: str
     username: str
 
 
 class UpsertAnilistAccountBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_username: str
     service: Literal['ANILIST', 'MYANIMELIST']
     username: str
 
 
 class UpsertDiscordAccountBodyItem(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
     discord_username: str
 
 
 class UpsertGuildEventBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     name: str
     start_time: datetime
     end_time: datetime
@@ -1912,13 +1912,13 @@ class UpsertGuildEventBody(BaseModel):
 
 
 class UpsertPlayerBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_username: str
     game_mode: Literal['WAIFU', 'HUSBANDO', 'ALL']
 
 
 class UpsertProfileBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_username: str
     birthday: datetime | None = None
     full_name: str | None = None
@@ -1930,42 +1930,42 @@ class UpsertProfileBody(BaseModel):
 
 
 class UpsertUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
     discord_username: str
     age_verified: bool
 
 
 class UpsertUserCalendarBody(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_username: str
     ics: str
 
 
 class UserBulkMergeResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class UserCalendarDeleteResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class UserCalendarMergeResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class UserCalendarSelectAllResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     ics: str
     id: UUID
     user: 'UserCalendarSelectAllResultUser'
 
 
 class UserCalendarSelectAllResultUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age_verified: bool
     discord_id: str
     discord_username: str
@@ -1973,14 +1973,14 @@ class UserCalendarSelectAllResultUser(BaseModel):
 
 
 class UserCalendarSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     ics: str
     id: UUID
     user: 'UserCalendarSelectResultUser'
 
 
 class UserCalendarSelectResultUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age_verified: bool
     discord_id: str
     discord_username: str
@@ -1988,19 +1988,19 @@ class UserCalendarSelectResultUser(BaseModel):
 
 
 class UserSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     age_verified: bool
     discord_id: str
     discord_username: str
 
 
 class UserUpsertResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class ValidationError(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     loc: list[str | int]
     msg: str
     type: str
@@ -2009,7 +2009,7 @@ class ValidationError(BaseModel):
 
 
 class WaifuBulkUpdateResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     blooded: bool
     character: 'WaifuBulkUpdateResultCharacter'
     custom_collage: bool
@@ -2030,58 +2030,58 @@ class WaifuBulkUpdateResult(BaseModel):
 
 
 class WaifuBulkUpdateResultCharacter(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
 
 
 class WaifuBulkUpdateResultCustomPositionWaifu(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class WaifuBulkUpdateResultOriginalOwner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'WaifuBulkUpdateResultOriginalOwnerUser'
 
 
 class WaifuBulkUpdateResultOriginalOwnerUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class WaifuBulkUpdateResultOwner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'WaifuBulkUpdateResultOwnerUser'
 
 
 class WaifuBulkUpdateResultOwnerUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class WaifuExportResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     charas: list['WaifuExportResultCharas']
     players: list['WaifuExportResultPlayers']
     waifus: list['WaifuExportResultWaifus']
 
 
 class WaifuExportResultCharas(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     favourites: int
     id_al: int
     image: str
 
 
 class WaifuExportResultPlayers(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
     discord_username: str
     tracked: list[int]
 
 
 class WaifuExportResultWaifus(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     blooded: bool
     character_id: int
     id: UUID
@@ -2095,12 +2095,12 @@ class WaifuExportResultWaifus(BaseModel):
 
 
 class WaifuReplaceCustomPositionResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class WaifuSelectResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     blooded: bool
     character: 'WaifuSelectResultCharacter'
     custom_collage: bool
@@ -2121,48 +2121,48 @@ class WaifuSelectResult(BaseModel):
 
 
 class WaifuSelectResultCharacter(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id_al: int
 
 
 class WaifuSelectResultCustomPositionWaifu(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class WaifuSelectResultOriginalOwner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'WaifuSelectResultOriginalOwnerUser'
 
 
 class WaifuSelectResultOriginalOwnerUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class WaifuSelectResultOwner(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     user: 'WaifuSelectResultOwnerUser'
 
 
 class WaifuSelectResultOwnerUser(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     discord_id: str
 
 
 class WaifuUpdateCustomImageNameResult(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
 
 
 class WhoamiResponse(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     id: UUID
     username: str
 
 
 class WrappedEmbed(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     title: str | None = None
     description: str | None = None
     color: int | None = None
@@ -2172,12 +2172,12 @@ class WrappedEmbed(BaseModel):
 
 
 class WrappedEmbedField(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     name: str
     value: str
     inline: bool | None = None
 
 
 class WrappedResponse(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     embeds: list['WrappedEmbed']
@@ -122,7 +122,7 @@ class BaseValkey[T](ABC):
         key = self.key if sub_key is None else f'{self.key}:{sub_key}'
         redis = await get_redis()
 
-        del self.values[sub_key]
+        self.values.pop(sub_key, None)
         if redis is not None:
             await redis.delete(key)
 
@@ -219,3 +219,48 @@ class JSONValue(BaseValkey[Any]):
 
     def decode(self, value: bytes) -> Any:
         return json.loads(value)
+
+
+class StringListValue:
+    """Valkey list of strings, only ever pushed to or popped from its tail.
+
+    Appending sends the new item alone, the list is never rewritten. Nothing is stored
+    when Valkey is not set up.
+    """
+
+    def __init__(self, key: str, global_key: bool = False):
+        if global_key:
+            self.key = key
+        else:
+            self.key = make_redis_key(key)
+
+    def _key(self, sub_key: SubKeyType) -> str:
+        return self.key if sub_key is None else f'{self.key}:{sub_key}'
+
+    async def get(self, sub_key: SubKeyType = None) -> list[str]:
+        redis = await get_redis()
+        if redis is None:
+            return []
+
+        coro = redis.lrange(self._key(sub_key), 0, -1)
+        assert asyncio.iscoroutine(coro)
+        return [value.decode() for value in await coro]
+
+    async def append(self, value: str, sub_key: SubKeyType = None):
+        redis = await get_redis()
+        if redis is not None:
+            coro = redis.rpush(self._key(sub_key), value.encode())
+            assert asyncio.iscoroutine(coro)
+            await coro
+
+    async def pop(self, sub_key: SubKeyType = None):
+        redis = await get_redis()
+        if redis is not None:
+            coro = redis.rpop(self._key(sub_key))
+            assert asyncio.iscoroutine(coro)
+            await coro
+
+    async def delete(self, sub_key: SubKeyType = None):
+        redis = await get_redis()
+        if redis is not None:
+            await redis.delete(self._key(sub_key))
@@ -0,0 +1,3 @@
+from nanachan.redis.base import StringValue
+
+event_fingerprint = StringValue('calendar_event_fingerprint')
@@ -0,0 +1,4 @@
+from nanachan.redis.base import StringValue
+
+# sub key: 'global' or the guild id
+commands_hash = StringValue('app_commands_hash')
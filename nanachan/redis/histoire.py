@@ -0,0 +1,5 @@
+from nanachan.redis.base import StringListValue, StringValue
+
+# sub key: {channel_id}-{user_id}
+draft_titles = StringValue('histoire_draft_title')
+draft_parts = StringListValue('histoire_draft_parts')
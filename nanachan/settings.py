@@ -77,6 +77,7 @@ for p in ('/usr/lib/libopus.so.0', '/usr/lib64/libopus.so.0'):
 ## Karaoke
 IGNORED_TIMERS = ['Toyunda Epitanime', '???', 'Extérieur', 'Joysound Exporter Japan7', 'Pititi-N']
 KARA_BASE: str | None = None
+KARA_INDEX = str(Path.home() / '.cache' / 'nanachan' / 'karaoke.sqlite3')
 
 ## AMQ
 AMQ_USERNAME: str | None = None
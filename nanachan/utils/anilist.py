@@ -16,7 +16,7 @@ from yarl import URL
 from nanachan.discord.bot import Bot
 from nanachan.discord.helpers import Embed, EmbedField
 from nanachan.discord.views import BaseView, NavigatorView
-from nanachan.nanapi.client import get_nanapi
+from nanachan.nanapi.client import fail_fast, get_nanapi
 from nanachan.nanapi.model import MediaSelectResult, MediaType, StaffSelectResult
 from nanachan.settings import NANAPI_PUBLIC_URL
 from nanachan.utils.misc import autocomplete_truncate
@@ -191,9 +191,10 @@ async def autocomplete_cast[T](
 
 def media_autocomplete(media_type: MediaType | None = None, id_al_as_value: bool = False):
     async def autocomplete(interaction: discord.Interaction, current: str):
-        resp = await get_nanapi().anilist.anilist_media_title_autocomplete(
-            current, media_type.value if media_type is not None else None
-        )
+        with fail_fast():
+            resp = await get_nanapi().anilist.anilist_media_title_autocomplete(
+                current, media_type.value if media_type is not None else None
+            )
         resp = resp.raise_exc()
         results = resp.result
 
@@ -282,7 +283,8 @@ async def staff_page(staff: StaffSelectResult) -> dict[str, Any]:
 
 def staff_autocomplete(id_al_as_value: bool = False):
     async def autocomplete(interaction: discord.Interaction, current: str):
-        resp = await get_nanapi().anilist.anilist_staff_name_autocomplete(current)
+        with fail_fast():
+            resp = await get_nanapi().anilist.anilist_staff_name_autocomplete(current)
         resp = resp.raise_exc()
         results = resp.result
         choices: list[Choice[str]] = []
@@ -1,21 +1,27 @@
+import hashlib
 import logging
+from collections.abc import Iterable
 from datetime import timedelta
 
-from discord import ScheduledEvent
+from discord import Member, ScheduledEvent, User
+from discord.utils import utcnow
 
 from nanachan.discord.bot import Bot
-from nanachan.nanapi.client import get_nanapi
+from nanachan.nanapi.client import batch, get_nanapi
 from nanachan.nanapi.model import (
     GuildEventMergeResult,
     GuildEventSelectResult,
     ParticipantAddBody,
     UpsertGuildEventBody,
 )
+from nanachan.redis.calendar import event_fingerprint
+from nanachan.utils.misc import json_dumps
 
 logger = logging.getLogger(__name__)
 
 
 async def upsert_event(bot: Bot, event: ScheduledEvent) -> GuildEventMergeResult:
+    """Writes the event to nanapi, forgetting its fingerprint first (see forget_event)"""
     if event.creator_id is None:
         # creator_id will be null and creator will not be included
         # for events created before October 25th, 2021
@@ -41,29 +47,91 @@ async def upsert_event(bot: Bot, event: ScheduledEvent) -> GuildEventMergeResult
         organizer_id=str(event.creator.id),
         organizer_username=str(event.creator),
     )
+    await forget_event(event.id)
     resp = await get_nanapi().calendar.calendar_upsert_guild_event(str(event.id), body)
     resp = resp.raise_exc()
 
     return resp.result
 
 
+async def add_participant(event_id: int, user: User | Member):
+    body = ParticipantAddBody(participant_username=str(user))
+    resp = await get_nanapi().calendar.calendar_add_guild_event_participant(
+        str(event_id), str(user.id), body
+    )
+    resp = resp.raise_exc()
+
+
+async def remove_participant(event_id: int, user_id: int):
+    resp = await get_nanapi().calendar.calendar_remove_guild_event_participant(
+        str(event_id), str(user_id)
+    )
+    resp = resp.raise_exc()
+
+
 async def reconcile_participants(
     event: ScheduledEvent,
     db_event: GuildEventSelectResult | None,
+    participants: Iterable[User | Member] | None = None,
 ):
     logger.debug(f'Reconciling participants for {event.name} ({event.id})')
+    if participants is None:
+        participants = [p async for p in event.users()]
+
     db_participants = {int(p.discord_id) for p in db_event.participants} if db_event else set()
-    async for participant in event.users():
-        if participant.id not in db_participants:
-            body = ParticipantAddBody(participant_username=str(participant))
-            resp = await get_nanapi().calendar.calendar_add_guild_event_participant(
-                str(event.id), str(participant.id), body
-            )
-            resp = resp.raise_exc()
-        else:
-            db_participants.remove(participant.id)
-    for discord_id in db_participants:
-        resp = await get_nanapi().calendar.calendar_remove_guild_event_participant(
-            str(event.id), str(discord_id)
-        )
-        resp = resp.raise_exc()
+    async with batch() as b:
+        for participant in participants:
+            if participant.id not in db_participants:
+                b.submit(add_participant(event.id, participant))
+            else:
+                db_participants.remove(participant.id)
+        for discord_id in db_participants:
+            b.submit(remove_participant(event.id, discord_id))
+
+
+def get_event_fingerprint(event: ScheduledEvent, participant_ids: Iterable[int]) -> str:
+    data = [
+        event.name,
+        event.description,
+        event.location,
+        event.channel_id,
+        event.start_time.isoformat(),
+        event.end_time.isoformat() if event.end_time else None,
+        event.cover_image.url if event.cover_image else None,
+        event.creator_id,
+        sorted(participant_ids),
+    ]
+    return hashlib.sha256(json_dumps(data).encode()).hexdigest()
+
+
+async def sync_event(bot: Bot, event: ScheduledEvent, db_event: GuildEventSelectResult | None):
+    """Upserts an event and its participants unless it is unchanged since the last sync.
+
+    The fingerprint is only stored once nanapi is up to date, so an interrupted sync
+    resumes from the first event that was not fully processed.
+    """
+    participants = [p async for p in event.users()]
+    fingerprint = get_event_fingerprint(event, (p.id for p in participants))
+    if await event_fingerprint.get(str(event.id)) == fingerprint:
+        logger.debug(f'Skipping unchanged event {event.name} ({event.id})')
+        return False
+
+    await upsert_event(bot, event)
+    await reconcile_participants(event, db_event, participants)
+
+    end_time = event.end_time or event.start_time
+    expire = max(end_time - utcnow(), timedelta()) + timedelta(days=1)
+    await event_fingerprint.set(
+        fingerprint, sub_key=str(event.id), expire=int(expire.total_seconds())
+    )
+    return True
+
+
+async def forget_event(event_id: int):
+    """Makes the next sync_event go through the event again.
+
+    To call on every write of the event or its participants outside of sync_event,
+    otherwise the stored fingerprint no longer describes what nanapi has. upsert_event
+    does it, so the writers that start with an upsert are covered.
+    """
+    await event_fingerprint.delete(str(event_id))
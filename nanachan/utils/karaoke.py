@@ -0,0 +1,469 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from io import BytesIO
+from pathlib import Path
+
+from matplotlib import dates, style, ticker
+from matplotlib.figure import Figure
+from watchfiles import Change, DefaultFilter, awatch
+
+logger = logging.getLogger(__name__)
+
+SUB_EXTENSIONS = ('.ass', '.ssa')
+
+SCHEMA = """
+PRAGMA journal_mode = WAL;
+PRAGMA foreign_keys = ON;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS karas (
+    path TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    lyrics TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS timers (
+    path TEXT NOT NULL REFERENCES karas (path) ON DELETE CASCADE,
+    timer TEXT NOT NULL,
+    PRIMARY KEY (path, timer)
+);
+CREATE INDEX IF NOT EXISTS timers_timer ON timers (timer);
+
+CREATE TABLE IF NOT EXISTS media (
+    path TEXT PRIMARY KEY,
+    name TEXT NOT NULL COLLATE NOCASE
+);
+CREATE INDEX IF NOT EXISTS media_name ON media (name);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS karas_fts USING fts5 (
+    name,
+    lyrics,
+    content = 'karas',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS karas_fts_insert AFTER INSERT ON karas BEGIN
+    INSERT INTO karas_fts (rowid, name, lyrics) VALUES (new.rowid, new.name, new.lyrics);
+END;
+
+CREATE TRIGGER IF NOT EXISTS karas_fts_delete AFTER DELETE ON karas BEGIN
+    INSERT INTO karas_fts (karas_fts, rowid, name, lyrics)
+    VALUES ('delete', old.rowid, old.name, old.lyrics);
+END;
+"""
+
+# a title match weighs as much as ten lyrics matches
+SEARCH_WEIGHTS = (10.0, 1.0)
+SEARCH_LIMIT = 25
+
+timing_reg = re.compile(r'^(?:Original Timing|Script Updated By): ([^,\n]*)(?:,.*)?$', re.M)
+lyrics_reg = re.compile(r'[^;].*{\\[kK].*}')
+tags_reg = re.compile(r'{[^}]*}')
+token_reg = re.compile(r'\w+')
+
+
+@dataclass
+class KaraSong:
+    name: str
+    path: str
+    lyrics: list[str]
+
+    def __str__(self) -> str:
+        return self.name
+
+
+def is_sub(file_name: str) -> bool:
+    return file_name.lower().endswith(SUB_EXTENSIONS)
+
+
+def parse_kara(file_path: str | Path) -> tuple[set[str], list[str]]:
+    """Timers and deduplicated lyrics lines of a subtitle file"""
+    with open(file_path, errors='replace') as file:
+        content = file.read()
+
+    timers = set(timing_reg.findall(content[:1024]))
+
+    lyrics: list[str] = []
+    seen: set[tuple[str, str, str]] = set()
+    for line in content.splitlines():
+        if lyrics_reg.match(line):
+            fields = line.split(',')
+            text = tags_reg.sub('', ','.join(fields[9:])).strip()
+            line_id = (fields[1], fields[2], text)
+            if line_id not in seen:
+                seen.add(line_id)
+                lyrics.append(text)
+
+    return timers, lyrics
+
+
+def render_timer_graph(mtimes: list[date], begin: date | None, end: date) -> bytes:
+    """PNG step chart of the number of karas timed over time.
+
+    Only uses the object-oriented Figure API, so that it can run in a worker thread
+    without touching the pyplot state machine.
+    """
+    score = 0
+    first = mtimes[0] - timedelta(weeks=1)
+    karas_over_time = {first: score}
+    for mtime in mtimes:
+        if mtime > end:
+            break
+        score += 1
+        karas_over_time[mtime] = score
+    karas_over_time[end] = score
+
+    if begin and begin > first:
+        last = 0
+        for mtime, score in karas_over_time.copy().items():
+            if mtime < begin:
+                last = score
+                del karas_over_time[mtime]
+        if begin not in karas_over_time:
+            karas_over_time[begin] = last
+    else:
+        begin = first
+
+    delta = end - begin
+    if delta < timedelta(weeks=5):
+        major = dates.MonthLocator()
+        major_fmt = dates.DateFormatter('\n%b')
+        minor = dates.DayLocator()
+        minor_fmt = dates.DateFormatter('%d')
+    elif delta < timedelta(weeks=10):
+        major = dates.MonthLocator()
+        major_fmt = dates.DateFormatter('\n%b')
+        minor = dates.DayLocator(bymonthday=range(1, 31, 5))
+        minor_fmt = dates.DateFormatter('%d')
+    elif delta < timedelta(weeks=104):
+        major = dates.YearLocator()
+        major_fmt = dates.DateFormatter('\n\n%Y')
+        minor = dates.MonthLocator()
+        minor_fmt = dates.DateFormatter('%b')
+    elif delta < timedelta(weeks=312):
+        major = dates.YearLocator()
+        major_fmt = dates.DateFormatter('%Y')
+        minor = dates.MonthLocator(bymonth=range(1, 13, 3))
+        minor_fmt = dates.DateFormatter('')
+    else:
+        major = dates.YearLocator()
+        major_fmt = dates.DateFormatter('%Y')
+        minor = None
+        minor_fmt = None
+
+    with style.context('dark_background'):
+        fig = Figure()
+        ax = fig.subplots()
+        score_date, scores = zip(*sorted(karas_over_time.items()))
+        ax.step(score_date, scores, where='post')
+
+        ax.xaxis.set_major_locator(major)
+        ax.xaxis.set_major_formatter(major_fmt)
+        if minor is not None:
+            ax.xaxis.set_minor_locator(minor)
+            assert minor_fmt is not None
+            ax.xaxis.set_minor_formatter(minor_fmt)
+
+        ax.yaxis.set_major_locator(ticker.MaxNLocator(integer=True, min_n_ticks=1))
+
+        ax.tick_params(axis='x', which='minor', labelrotation=270)
+        ax.autoscale_view()
+
+        ax.grid(True, which='both', linestyle=':')
+
+        file = BytesIO()
+        fig.savefig(file, transparent=True, bbox_inches='tight', format='png')
+
+    return file.getvalue()
+
+
+def like_escape(text: str) -> str:
+    """Escapes LIKE wildcards, for patterns using ESCAPE '\\'"""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class KaraIndex:
+    """SQLite index of the karaoke library.
+
+    ``scan`` only re-parses the subtitle files whose mtime or size changed since the
+    last run, then a watchfiles watcher applies the changes as they happen.
+    ``version`` is bumped on every change so that derived data can be cached on it.
+    The database is opened by ``start`` (or ``open`` for synchronous use).
+    """
+
+    def __init__(self, base: str | Path, db_path: str | Path):
+        self.base = Path(base)
+        self.db_path = Path(db_path)
+        self.conn: sqlite3.Connection
+        self.opened = False
+        self.version = 0
+        self.lock = asyncio.Lock()
+        self.ready = asyncio.Event()
+        self.task: asyncio.Task[None] | None = None
+        self.default_filter = DefaultFilter()
+
+    def open(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        has_fts = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'karas_fts'"
+        ).fetchone()
+        self.conn.executescript(SCHEMA)
+        if has_fts is None:
+            # karas indexed before the full-text table existed
+            with self.conn:
+                self.conn.execute("INSERT INTO karas_fts (karas_fts) VALUES ('rebuild')")
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        self.version = int(row[0]) if row is not None else 0
+        self.opened = True
+
+    def close(self):
+        if self.opened:
+            self.conn.close()
+            self.opened = False
+
+    async def run[**P, T](self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Runs a blocking index operation in a thread, one at a time"""
+        async with self.lock:
+            future = asyncio.ensure_future(asyncio.to_thread(func, *args, **kwargs))
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # the thread cannot be interrupted, keep the index locked until it is done
+                await asyncio.wait([future])
+                raise
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.wait([self.task])
+        # after any search or update still running in a worker thread
+        await self.run(self.close)
+
+    async def _watch(self):
+        try:
+            await self.run(self.open)
+        except Exception as e:
+            logger.exception(e)
+            self.ready.set()
+            return
+
+        try:
+            changed = await self.run(self.scan)
+            logger.info(f'karaoke index ready ({changed} change(s) since last run)')
+        except Exception as e:
+            # the watcher below still applies the changes from now on
+            logger.exception(e)
+        finally:
+            self.ready.set()
+
+        async for changes in awatch(self.base, watch_filter=self._watch_filter):
+            try:
+                await self.run(self.update, {path for _, path in changes})
+            except Exception as e:
+                logger.exception(e)
+
+    def _watch_filter(self, change: Change, path: str) -> bool:
+        # .git, editor swap files… on top of our own database
+        return self.default_filter(change, path) and not path.startswith(str(self.db_path))
+
+    def _bump_version(self):
+        self.version += 1
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (str(self.version),)
+        )
+
+    def _relpath(self, path: str | Path) -> str:
+        return os.path.relpath(path, self.base)
+
+    def _index_file(self, path: str, stat: os.stat_result):
+        rel = self._relpath(path)
+        file_name = os.path.basename(path)
+        if not is_sub(file_name):
+            self.conn.execute(
+                'INSERT OR REPLACE INTO media (path, name) VALUES (?, ?)',
+                (rel, os.path.splitext(file_name)[0]),
+            )
+            return
+
+        try:
+            timers, lyrics = parse_kara(path)
+        except OSError as e:
+            logger.warning(f'cannot index {rel}: {e}')
+            return
+
+        self.conn.execute('DELETE FROM karas WHERE path = ?', (rel,))
+        self.conn.execute(
+            'INSERT INTO karas (path, name, mtime, size, lyrics) VALUES (?, ?, ?, ?, ?)',
+            (
+                rel,
+                os.path.splitext(file_name)[0],
+                stat.st_mtime,
+                stat.st_size,
+                json.dumps(lyrics, ensure_ascii=False),
+            ),
+        )
+        self.conn.executemany(
+            'INSERT INTO timers (path, timer) VALUES (?, ?)', ((rel, t) for t in timers)
+        )
+
+    def _walk(self, root: str | Path) -> Iterable[str]:
+        for dir_path, _, file_names in os.walk(root):
+            for file_name in file_names:
+                path = os.path.join(dir_path, file_name)
+                if not path.startswith(str(self.db_path)):
+                    yield path
+
+    def scan(self) -> int:
+        """Brings the whole index up to date and returns the number of changed files"""
+        indexed = {
+            path: (mtime, size)
+            for path, mtime, size in self.conn.execute('SELECT path, mtime, size FROM karas')
+        }
+        indexed_media = {path for (path,) in self.conn.execute('SELECT path FROM media')}
+        seen: set[str] = set()
+        changed = 0
+
+        with self.conn:
+            for path in self._walk(self.base):
+                rel = self._relpath(path)
+                seen.add(rel)
+                if not is_sub(path) and rel in indexed_media:
+                    continue
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    # removed during the scan, the watcher will catch up
+                    continue
+                if indexed.get(rel) == (stat.st_mtime, stat.st_size):
+                    continue
+                self._index_file(path, stat)
+                changed += 1
+
+            removed = (indexed.keys() | indexed_media) - seen
+            self._delete(removed)
+            changed += len(removed)
+
+            if changed:
+                self._bump_version()
+
+        return changed
+
+    def update(self, paths: Iterable[str]) -> int:
+        """Reindexes the given paths (files or directories, existing or not)"""
+        changed = 0
+        with self.conn:
+            for path in paths:
+                if os.path.isdir(path):
+                    for file_path in self._walk(path):
+                        self._index_file(file_path, os.stat(file_path))
+                        changed += 1
+                elif os.path.isfile(path):
+                    self._index_file(path, os.stat(path))
+                    changed += 1
+                else:
+                    # deleted file or directory
+                    rel = self._relpath(path)
+                    prefix = f'{like_escape(rel + os.sep)}%'
+                    cursor = self.conn.execute(
+                        "SELECT path FROM karas WHERE path = ? OR path LIKE ? ESCAPE '\\' "
+                        "UNION SELECT path FROM media WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+                        (rel, prefix, rel, prefix),
+                    )
+                    removed = [p for (p,) in cursor]
+                    self._delete(removed)
+                    changed += len(removed)
+
+            if changed:
+                self._bump_version()
+
+        return changed
+
+    def _delete(self, paths: Iterable[str]):
+        params = [(p,) for p in paths]
+        self.conn.executemany('DELETE FROM karas WHERE path = ?', params)
+        self.conn.executemany('DELETE FROM media WHERE path = ?', params)
+
+    def karas_by_timers(self) -> tuple[dict[str, list[str]], list[str]]:
+        """Karas of each timer, and the karas without any timer"""
+        timers: dict[str, list[str]] = defaultdict(list)
+        for timer, path in self.conn.execute('SELECT timer, path FROM timers'):
+            timers[timer].append(path)
+
+        errors = [
+            path
+            for (path,) in self.conn.execute(
+                'SELECT path FROM karas WHERE path NOT IN (SELECT path FROM timers) ORDER BY path'
+            )
+        ]
+        return timers, errors
+
+    def timer_mtimes(self, timer: str) -> list[float]:
+        cursor = self.conn.execute(
+            'SELECT mtime FROM karas JOIN timers USING (path) WHERE timer = ? ORDER BY mtime',
+            (timer,),
+        )
+        return [mtime for (mtime,) in cursor]
+
+    def media_path(self, name: str) -> str | None:
+        row = self.conn.execute(
+            'SELECT path FROM media WHERE name = ? ORDER BY path LIMIT 1', (name,)
+        ).fetchone()
+        return None if row is None else str(self.base / row[0])
+
+    def find(self, regex: str) -> list[KaraSong]:
+        """Karas whose file name matches the space-separated ``regex`` parts in order"""
+        regex = re.sub(' ', '.*', regex)
+        file_name_reg = re.compile(rf'.*(?i:{regex}).*\.(ass|ssa)$')
+
+        karas: list[KaraSong] = []
+        for path, name, lyrics in self.conn.execute('SELECT path, name, lyrics FROM karas'):
+            if not file_name_reg.match(os.path.basename(path)):
+                continue
+            media = self.media_path(name)
+            if media is None:
+                continue
+            karas.append(KaraSong(name, media, json.loads(lyrics)))
+        return karas
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> list[KaraSong]:
+        """Karas whose title or lyrics contain every word of ``query``, best matches first.
+
+        Words are matched case and accent insensitively, the last one as a prefix so that
+        an unfinished lyric snippet still matches.
+        """
+        tokens = token_reg.findall(query)
+        if not tokens:
+            return []
+        match = ' '.join(f'"{token}"' for token in tokens) + '*'
+
+        cursor = self.conn.execute(
+            'SELECT karas.name, karas.lyrics FROM karas_fts '
+            'JOIN karas ON karas.rowid = karas_fts.rowid '
+            'WHERE karas_fts MATCH ? ORDER BY bm25(karas_fts, ?, ?) LIMIT ?',
+            (match, *SEARCH_WEIGHTS, limit),
+        )
+        karas: list[KaraSong] = []
+        for name, lyrics in cursor:
+            media = self.media_path(name)
+            if media is not None:
+                karas.append(KaraSong(name, media, json.loads(lyrics)))
+        return karas
@@ -0,0 +1,84 @@
+import time
+from collections.abc import Iterable
+from itertools import batched
+
+from nanachan.nanapi.client import Error, batch, get_nanapi
+from nanachan.nanapi.model import ProfileSearchBody, ProfileSearchResult, UpsertProfileBody
+
+PROFILE_CHUNK_SIZE = 200
+PROFILE_CACHE_TTL = 600
+
+# {discord_id: (fetched_at, profile)}, None for members without a profile
+_profiles: dict[int, tuple[float, ProfileSearchResult | None]] = {}
+
+
+def _cached(discord_id: int, now: float) -> tuple[float, ProfileSearchResult | None] | None:
+    entry = _profiles.get(discord_id)
+    if entry is None or now - entry[0] > PROFILE_CACHE_TTL:
+        return None
+    return entry
+
+
+def _store(profiles: Iterable[ProfileSearchResult], now: float):
+    for profile in profiles:
+        _profiles[int(profile.user.discord_id)] = (now, profile)
+
+
+async def _search(body: ProfileSearchBody) -> list[ProfileSearchResult]:
+    resp = await get_nanapi().user.user_profile_search_post(body)
+    resp = resp.raise_exc()
+    return resp.result
+
+
+async def get_profiles(discord_ids: Iterable[int]) -> dict[int, ProfileSearchResult]:
+    """Profiles of the given members, fetched by chunks in the request body"""
+    now = time.monotonic()
+    discord_ids = set(discord_ids)
+    missing = sorted(i for i in discord_ids if _cached(i, now) is None)
+
+    async with batch() as b:
+        tasks = [
+            (chunk, b.submit(_search(ProfileSearchBody(discord_ids=[str(i) for i in chunk]))))
+            for chunk in batched(missing, PROFILE_CHUNK_SIZE)
+        ]
+
+    for chunk, task in tasks:
+        for discord_id in chunk:
+            _profiles[discord_id] = (now, None)
+        _store(task.result(), now)
+
+    return {
+        discord_id: profile
+        for discord_id in discord_ids
+        if (profile := _profiles[discord_id][1]) is not None
+    }
+
+
+async def get_profile(discord_id: int) -> ProfileSearchResult | None:
+    now = time.monotonic()
+    if (entry := _cached(discord_id, now)) is not None:
+        return entry[1]
+
+    resp = await get_nanapi().user.user_get_profile(str(discord_id))
+    match resp:
+        case Error(code=404):
+            profile = None
+        case _:
+            profile = resp.raise_exc().result
+
+    _profiles[discord_id] = (now, profile)
+    return profile
+
+
+async def search_profiles(pattern: str) -> list[ProfileSearchResult]:
+    profiles = await _search(ProfileSearchBody(pattern=pattern))
+    _store(profiles, time.monotonic())
+    return profiles
+
+
+async def upsert_profile(discord_id: int, body: UpsertProfileBody) -> ProfileSearchResult:
+    resp = await get_nanapi().user.user_upsert_profile(str(discord_id), body)
+    resp = resp.raise_exc()
+    profile = resp.result
+    _profiles[discord_id] = (time.monotonic(), profile)
+    return profile
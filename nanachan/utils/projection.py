@@ -1,18 +1,58 @@
 import asyncio
+import logging
+import time
+from collections.abc import Iterable
 from datetime import datetime
 from functools import partial
+from typing import TYPE_CHECKING, cast
 from uuid import UUID
 
 import discord
+from discord import Thread
 from discord.ui import Button
 
 from nanachan.discord.bot import Bot
 from nanachan.discord.helpers import Embed
 from nanachan.discord.views import BaseView
-from nanachan.nanapi.client import get_nanapi
-from nanachan.nanapi.model import MediaSelectResult, ProjectionStatus, ProjoSelectResultMedias
-from nanachan.settings import NANAPI_PUBLIC_URL, TZ
+from nanachan.nanapi.client import batch, get_nanapi
+from nanachan.nanapi.model import (
+    MediaSelectResult,
+    ParticipantAddBody,
+    ProjectionStatus,
+    ProjoSelectResult,
+    ProjoSelectResultMedias,
+)
+from nanachan.settings import NANAPI_PUBLIC_URL, PROJO_THREADS_ROOM, TZ
 from nanachan.utils.anilist import MediaNavigator
+from nanachan.utils.scheduler import get_scheduler
+
+if TYPE_CHECKING:
+    from nanachan.extensions.projection import ProjectionCog
+
+logger = logging.getLogger(__name__)
+
+PROJO_EMBED_DELAY = 5
+PROJO_SYNC_CONCURRENCY = 4
+AL_MEDIA_CACHE_TTL = 3600
+
+# {id_al: (fetched_at, media)}
+_al_medias: dict[int, tuple[float, MediaSelectResult]] = {}
+
+
+async def get_al_medias(ids_al: Iterable[int]) -> dict[int, MediaSelectResult]:
+    """AniList medias by id, only the ones missing from the cache are fetched"""
+    now = time.monotonic()
+    ids_al = set(ids_al)
+    missing = sorted(
+        i for i in ids_al if i not in _al_medias or now - _al_medias[i][0] > AL_MEDIA_CACHE_TTL
+    )
+    if missing:
+        resp = await get_nanapi().anilist.anilist_get_medias(','.join(map(str, missing)))
+        resp = resp.raise_exc()
+        for media in resp.result:
+            _al_medias[media.id_al] = (now, media)
+
+    return {i: _al_medias[i][1] for i in ids_al if i in _al_medias}
 
 
 async def get_active_projo(channel_id: int):
@@ -24,27 +64,17 @@ async def get_active_projo(channel_id: int):
     return projos[0] if len(projos) > 0 else None
 
 
-async def get_projo_embed_view(bot: Bot, projo_id: UUID):
-    resp = await get_nanapi().projection.projection_get_projection(projo_id)
-    resp = resp.raise_exc()
-    projection = resp.result
-
-    thread = await bot.fetch_thread(int(projection.channel_id))
-
+async def render_projo_embed_view(
+    bot: Bot, projection: ProjoSelectResult, member_ids: Iterable[int]
+):
     description = []
     thumbnail_id = None
     duration = 0
 
-    al_medias_dict: dict[int, MediaSelectResult] = {}
+    al_medias_dict = await get_al_medias(media.id_al for media in projection.medias)
     ids_al_str = None
     if len(projection.medias) > 0:
-        ids_al = [media.id_al for media in projection.medias]
-        ids_al_str = ','.join(map(str, ids_al))
-        resp = await get_nanapi().anilist.anilist_get_medias(ids_al_str)
-        resp = resp.raise_exc()
-
-        al_medias = resp.result
-        al_medias_dict = {media.id_al: media for media in al_medias}
+        ids_al_str = ','.join(str(media.id_al) for media in projection.medias)
 
     all_medias = projection.medias + projection.external_medias
     for media in sorted(
@@ -75,10 +105,9 @@ async def get_projo_embed_view(bot: Bot, projo_id: UUID):
     if ids_al_str is not None:
         embed.set_thumbnail(url=f'{NANAPI_PUBLIC_URL}/anilist/medias/collages?ids_al={ids_al_str}')
 
-    embed.add_field(name='Thread', value=thread.mention)
+    embed.add_field(name='Thread', value=f'<#{projection.channel_id}>')
 
-    members = await thread.fetch_members()
-    users = [u for u in map(bot.get_user, (m.id for m in members)) if u is not None and not u.bot]
+    users = [u for u in map(bot.get_user, member_ids) if u is not None and not u.bot]
 
     names = [str(u) for u in users]
     footer = ' | '.join(sorted(names, key=str.casefold))
@@ -120,13 +149,7 @@ class ProjectionInfosButton(Button):
         resp = resp.raise_exc()
         projo = resp.result
 
-        ids_al = [media.id_al for media in projo.medias]
-        ids_al_str = ','.join(map(str, ids_al))
-        resp = await get_nanapi().anilist.anilist_get_medias(ids_al_str)
-        resp = resp.raise_exc()
-        al_medias = resp.result
-        al_medias_dict = {media.id_al: media for media in al_medias}
-
+        al_medias_dict = await get_al_medias(m.id_al for m in projo.medias)
         medias = [al_medias_dict[m.id_al] for m in projo.medias]
         send_func = partial(interaction.followup.send, ephemeral=True)
         await MediaNavigator.create(self.bot, send_func, medias=medias)
@@ -160,5 +183,158 @@ class ProjectionView(BaseView):
         assert thread is not None
 
         asyncio.create_task(thread.add_user(interaction.user))
-        embed, view = await get_projo_embed_view(self.bot, projo.id)
+        members = {m.id for m in await thread.fetch_members()} | {interaction.user.id}
+        projo_cog = cast('ProjectionCog | None', self.bot.get_cog('Projection'))
+        if projo_cog is not None and thread.id in projo_cog.state.active_projos:
+            projo_cog.state.members[thread.id] = members
+        embed, view = await render_projo_embed_view(self.bot, projo, members)
         await interaction.response.edit_message(embed=embed, view=view)
+
+
+class ProjectionState:
+    """Cached state of the ongoing projections.
+
+    Keeps the registry of active projection threads with their members, applies
+    participant diffs to nanapi and re-renders the info embeds from the cached data,
+    at most once every PROJO_EMBED_DELAY seconds per projection.
+    """
+
+    def __init__(self, bot: Bot):
+        self.bot = bot
+        # {thread_id: projection}, ongoing projections only
+        self.active_projos: dict[int, ProjoSelectResult] = {}
+        # {thread_id: member ids}, as last seen on discord
+        self.members: dict[int, set[int]] = {}
+        # threads whose projection must be refetched before their next render
+        self.stale: set[int] = set()
+
+    def load(self, projos: Iterable[ProjoSelectResult]):
+        self.active_projos = {int(projo.channel_id): projo for projo in projos}
+        for thread_id in self.members.keys() - self.active_projos.keys():
+            del self.members[thread_id]
+
+    def discard(self, thread_id: int):
+        self.active_projos.pop(thread_id, None)
+        self.members.pop(thread_id, None)
+        self.stale.discard(thread_id)
+        get_scheduler().cancel(('projo_embed', thread_id))
+
+    async def refresh(self, thread_id: int) -> ProjoSelectResult | None:
+        """Refetches the active projection of the thread"""
+        projo = await get_active_projo(thread_id)
+        if projo is None:
+            self.discard(thread_id)
+        else:
+            self.active_projos[thread_id] = projo
+            self.stale.discard(thread_id)
+        return projo
+
+    async def sync_participants(self, projo: ProjoSelectResult, thread: Thread):
+        """Makes the projection participants match the thread members"""
+        members = {m.id for m in await thread.fetch_members()}
+        self.members[thread.id] = members
+
+        participants = {int(p.discord_id) for p in projo.participants}
+        if members == participants:
+            return
+
+        nanapi = get_nanapi()
+        async with batch() as b:
+            tasks = [
+                b.submit(
+                    nanapi.projection.projection_add_projection_participant(
+                        projo.id,
+                        str(discord_id),
+                        ParticipantAddBody(
+                            participant_username=str(self.bot.get_user(discord_id))
+                        ),
+                    )
+                )
+                for discord_id in members - participants
+            ] + [
+                b.submit(
+                    nanapi.projection.projection_remove_projection_participant(
+                        projo.id, str(discord_id)
+                    )
+                )
+                for discord_id in participants - members
+            ]
+
+        self.stale.add(thread.id)
+        for task in tasks:
+            task.result().raise_exc()
+
+    async def sync_all_participants(self):
+        async def sync(projo: ProjoSelectResult, thread: Thread):
+            try:
+                await self.sync_participants(projo, thread)
+            except Exception as e:
+                logger.exception(e)
+
+        logger.info('Start syncing projo participants')
+        async with batch(PROJO_SYNC_CONCURRENCY) as b:
+            for thread_id, projo in list(self.active_projos.items()):
+                if isinstance(thread := self.bot.get_channel(thread_id), Thread):
+                    b.submit(sync(projo, thread))
+        logger.info('Done syncing projo participants')
+
+    def get_members(self, thread_id: int) -> set[int]:
+        """Member ids of the thread, seeded from the participants if it was never synced"""
+        if (members := self.members.get(thread_id)) is None:
+            projo = self.active_projos[thread_id]
+            members = self.members[thread_id] = {int(p.discord_id) for p in projo.participants}
+        return members
+
+    async def add_participant(self, thread_id: int, user: discord.User):
+        projo = self.active_projos[thread_id]
+        self.get_members(thread_id).add(user.id)
+        self.schedule_render(thread_id)
+        body = ParticipantAddBody(participant_username=str(user))
+        resp = await get_nanapi().projection.projection_add_projection_participant(
+            projo.id, str(user.id), body
+        )
+        resp = resp.raise_exc()
+
+    async def remove_participant(self, thread_id: int, user: discord.User):
+        projo = self.active_projos[thread_id]
+        self.get_members(thread_id).discard(user.id)
+        self.schedule_render(thread_id)
+        resp = await get_nanapi().projection.projection_remove_projection_participant(
+            projo.id, str(user.id)
+        )
+        resp = resp.raise_exc()
+
+    def schedule_render(self, thread_id: int, refresh: bool = False):
+        """Re-renders the info embed at the end of the current window"""
+        if refresh:
+            self.stale.add(thread_id)
+        key = ('projo_embed', thread_id)
+        if key not in get_scheduler():
+            get_scheduler().schedule_in(
+                PROJO_EMBED_DELAY, partial(self.render, thread_id), key=key
+            )
+
+    async def render(self, thread_id: int) -> discord.Embed | None:
+        """Renders the info embed of the thread projection and updates its message"""
+        get_scheduler().cancel(('projo_embed', thread_id))
+        if thread_id in self.stale:
+            projo = await self.refresh(thread_id)
+        else:
+            projo = self.active_projos.get(thread_id)
+        if projo is None or projo.message_id is None:
+            return None
+
+        if (members := self.members.get(thread_id)) is None:
+            members = {int(p.discord_id) for p in projo.participants}
+        embed, view = await render_projo_embed_view(self.bot, projo, members)
+        message = self.get_message(int(projo.message_id))
+        try:
+            await message.edit(embed=embed, view=view)
+        except discord.NotFound:
+            logger.warning(f'projo message not found: {message.id}')
+            self.bot.message_cache.invalidate(message.id)
+            raise
+        return embed
+
+    def get_message(self, message_id: int) -> discord.PartialMessage:
+        return self.bot.message_cache.get(PROJO_THREADS_ROOM, message_id)
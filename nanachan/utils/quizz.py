@@ -1,11 +1,12 @@
-import asyncio
 import io
+import logging
 import random
 import re
 import string
 import textwrap
 import unicodedata
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from contextlib import suppress
 from importlib import resources
 from typing import TYPE_CHECKING, cast
@@ -21,7 +22,7 @@ import nanachan.resources
 from nanachan.discord.bot import Bot
 from nanachan.discord.helpers import Embed, MultiplexingMessage, UserType
 from nanachan.extensions.waicolle import WaifuCollection
-from nanachan.nanapi.client import get_nanapi
+from nanachan.nanapi.client import fail_fast, get_nanapi, success
 from nanachan.nanapi.model import NewQuizzBody, QuizzStatus
 from nanachan.settings import GLOBAL_COIN_MULTIPLIER, PREFIX, SAUCENAO_API_KEY, RequiresAI
 from nanachan.utils.ai import Agent, get_model_config, to_binary_content, web_toolset
@@ -30,8 +31,77 @@ from nanachan.utils.misc import saucenao_lookup, to_producer
 if TYPE_CHECKING:
     from discord.abc import MessageableChannel
 
+logger = logging.getLogger(__name__)
+
 COLOR_BANANA = 0xF6D68D
 
+# alternate titles are only taken from the first AniList results
+ALTERNATE_TITLES_SEARCH_DEPTH = 5
+# shorter alternate titles ("AoT", "SnK"…) are abbreviations, too easy to hit by accident
+ALTERNATE_TITLE_MIN_LENGTH = 4
+
+PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+SUBMISSION_TABLE = str.maketrans('', '', string.punctuation + ' ')
+
+ROMAJI_TABLE = [
+    (re.compile(i), j)
+    for i, j in [
+        ('aa', 'aa?'),
+        ('ei', 'ei?'),
+        ('ii', 'ii?'),
+        ('ou', 'ou?'),
+        ('oo', 'oo?'),
+        ('uu', 'uu?'),
+        (r'\bo\b', 'w?o'),
+        ('wo', 'w?o'),
+        (r'\bwa\b', '[wh]a'),
+        ('he', 'h?e'),
+        ('mu', 'mu?'),
+        (r'\?\?', '?'),
+    ]
+]
+
+
+def to_ascii(text: str) -> str:
+    text = unicodedata.normalize('NFKD', text.casefold())
+    return text.encode('ascii', 'ignore').decode()
+
+
+class AnswerMatcher:
+    """Checks submissions against the answer of a game.
+
+    Everything that only depends on the answer (normalization, regexes, alternate
+    titles) is done once when the game starts, so that a submission is checked inline.
+    """
+
+    def __init__(
+        self,
+        answer: str,
+        patterns: Iterable[re.Pattern[str]] = (),
+        alternates: Iterable[re.Pattern[str]] = (),
+    ):
+        self.answer = answer
+        self.casefolded = answer.casefold()
+        # found anywhere in a submission
+        self.patterns = list(patterns)
+        # must be the whole submission
+        self.alternates = list(alternates)
+
+    def match(self, submission: str) -> bool:
+        submission = submission.casefold()
+        if submission == self.casefolded:
+            return True
+        if not self.patterns and not self.alternates:
+            return False
+
+        normalized = to_ascii(submission).translate(SUBMISSION_TABLE)
+        return any(pattern.search(normalized) for pattern in self.patterns) or any(
+            pattern.fullmatch(normalized) for pattern in self.alternates
+        )
+
+    def match_many(self, submissions: Iterable[str]) -> list[bool]:
+        return [self.match(submission) for submission in submissions]
+
 
 class QuizzBase(ABC):
     DEFAULT_QUESTION = 'Unknown'
@@ -166,15 +236,14 @@ class QuizzBase(ABC):
 
         return embed
 
-    @classmethod
-    async def try_validate(cls, question: str | None, answer: str | None, submission: str) -> bool:
-        return False
+    async def compile_matcher(self, answer: str) -> AnswerMatcher:
+        return AnswerMatcher(answer)
 
     async def post_end(self, game_id: UUID, message: discord.Message | MultiplexingMessage):
         resp = await get_nanapi().quizz.quizz_get_game(game_id)
         resp = resp.raise_exc()
         game = resp.result
-        game_msg = await message.channel.fetch_message(int(game.message_id))
+        game_msg = self.bot.message_cache.get(message.channel.id, int(game.message_id))
 
         if message.author.id == int(game.quizz.author.discord_id):
             return
@@ -250,52 +319,53 @@ class AnimeMangaQuizz(QuizzBase):
             if sauce.similarity > 60 and sauce.mal_id is not None:
                 return sauce.title
 
-    @classmethod
-    async def try_validate(cls, question: str | None, answer: str | None, submission: str):
-        fuzzy = (
-            await asyncio.to_thread(cls.fuzzy_jp_match, answer, submission)
-            if answer is not None
-            else False
+    async def compile_matcher(self, answer: str) -> AnswerMatcher:
+        pattern = self.romaji_pattern(answer)
+        alternates = {
+            self.romaji_pattern(title)
+            for title in await self.alternate_titles(answer)
+            if len(to_ascii(title).translate(SUBMISSION_TABLE)) >= ALTERNATE_TITLE_MIN_LENGTH
+        }
+        alternates.discard(pattern)
+        # a title without any latin character would match everything
+        return AnswerMatcher(
+            answer,
+            [re.compile(pattern)] if pattern else [],
+            [re.compile(p) for p in alternates if p],
         )
-        return fuzzy or await super().try_validate(question, answer, submission)
 
     @staticmethod
-    def fuzzy_jp_match(reference: str, answer: str) -> bool:
+    async def alternate_titles(answer: str) -> list[str]:
+        """Other titles of the AniList media named ``answer``, if there is one"""
+        try:
+            with fail_fast():
+                resp = await get_nanapi().anilist.anilist_media_search(answer)
+        except Exception as e:
+            # the answer alone is still good enough to play
+            logger.warning(f'cannot fetch alternate titles of {answer!r}: {e}')
+            return []
+        if not success(resp):
+            return []
+
+        key = to_ascii(answer).translate(SUBMISSION_TABLE)
+        for media in resp.result[:ALTERNATE_TITLES_SEARCH_DEPTH]:
+            titles = [media.title_user_preferred, media.title_english, *media.synonyms]
+            titles = [t for t in titles if t is not None]
+            if key in {to_ascii(t).translate(SUBMISSION_TABLE) for t in titles}:
+                return titles
+        return []
+
+    @staticmethod
+    def romaji_pattern(reference: str) -> str:
         """Black magic, I don't remember how it worked"""
         reference = re.sub(r'\(\d+\)', '', reference)
-        reference = reference.translate(str.maketrans('', '', string.punctuation))
-        reference = reference.casefold()
-        reference = unicodedata.normalize('NFKD', reference)
-        reference = reference.encode('ascii', 'ignore').decode()
-
-        reference_reg = AnimeMangaQuizz.romaji_regex(reference)
-        reference_reg = reference_reg.replace(' ', '')
-
-        answer = answer.translate(str.maketrans('', '', string.punctuation + ' '))
-        answer = answer.casefold()
-        answer = unicodedata.normalize('NFKD', answer)
-        answer = answer.encode('ascii', 'ignore').decode()
-
-        return bool(re.search(reference_reg, answer))
+        reference = to_ascii(reference).translate(PUNCTUATION_TABLE)
+        return AnimeMangaQuizz.romaji_regex(reference).replace(' ', '')
 
     @staticmethod
     def romaji_regex(title: str) -> str:
-        table = [
-            ('aa', 'aa?'),
-            ('ei', 'ei?'),
-            ('ii', 'ii?'),
-            ('ou', 'ou?'),
-            ('oo', 'oo?'),
-            ('uu', 'uu?'),
-            (r'\bo\b', 'w?o'),
-            ('wo', 'w?o'),
-            (r'\bwa\b', '[wh]a'),
-            ('he', 'h?e'),
-            ('mu', 'mu?'),
-            (r'\?\?', '?'),
-        ]
-        for i, j in table:
-            title = re.sub(i, j, title)
+        for i, j in ROMAJI_TABLE:
+            title = i.sub(j, title)
         return title
 
     async def post_end(self, game_id: UUID, message: discord.Message | MultiplexingMessage):
@@ -0,0 +1,81 @@
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from discord import HTTPException, Member, Role
+
+logger = logging.getLogger(__name__)
+
+ROLE_SYNC_PROGRESS_INTERVAL = 5
+
+
+@dataclass
+class RoleChange:
+    member: Member
+    added: list[Role]
+    removed: list[Role]
+
+    @property
+    def roles(self) -> list[Role]:
+        """Full role list of the member once the change is applied"""
+        removed = set(self.removed)
+        kept = [r for r in self.member.roles if not r.is_default() and r not in removed]
+        return kept + [r for r in self.added if r not in kept]
+
+    def __str__(self) -> str:
+        diff = [f'+{r}' for r in self.added] + [f'-{r}' for r in self.removed]
+        return f'**{self.member}** • {" ".join(diff)}'
+
+
+def diff_roles(
+    targets: Mapping[Member, Iterable[Role]], managed: Iterable[Role]
+) -> list[RoleChange]:
+    """Changes needed for each member to have exactly its target roles among ``managed``.
+
+    Members that already have the right roles are left out.
+    """
+    managed = set(managed)
+    changes: list[RoleChange] = []
+    for member, wanted in targets.items():
+        wanted = set(wanted)
+        current = {r for r in member.roles if r in managed}
+        if current != wanted:
+            changes.append(RoleChange(member, sorted(wanted - current), sorted(current - wanted)))
+    return changes
+
+
+async def sync_roles(
+    changes: list[RoleChange],
+    *,
+    reason: str | None = None,
+    on_progress: Callable[[int], Awaitable[Any]] | None = None,
+) -> list[RoleChange]:
+    """Applies the changes with a single edit per member and returns the ones that failed.
+
+    Edits are sent one after the other, discord.py holds them back on the rate limit
+    headers of the member bucket. ``on_progress`` gets the number of processed changes
+    every ROLE_SYNC_PROGRESS_INTERVAL seconds and at the end, its errors are only logged.
+    """
+    failed: list[RoleChange] = []
+    last_report = time.monotonic()
+    for done, change in enumerate(changes, 1):
+        try:
+            await change.member.edit(roles=change.roles, reason=reason)
+        except HTTPException as e:
+            logger.warning(f'failed to update roles of {change.member}: {e}')
+            failed.append(change)
+
+        now = time.monotonic()
+        if on_progress is not None and (
+            now - last_report >= ROLE_SYNC_PROGRESS_INTERVAL or done == len(changes)
+        ):
+            last_report = now
+            try:
+                await on_progress(done)
+            except Exception as e:
+                # reporting must never abort the sync halfway
+                logger.exception(e)
+
+    return failed
@@ -0,0 +1,134 @@
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(order=True)
+class ScheduledJob:
+    when: float
+    seq: int
+    callback: Callable[[], Awaitable[Any] | Any] = field(compare=False)
+    key: Hashable | None = field(compare=False, default=None)
+    cancelled: bool = field(compare=False, default=False)
+
+
+class Scheduler:
+    """Runs callbacks at a given wall-clock time from a single task.
+
+    Jobs live in a heap: scheduling is O(log n), cancelling marks the job and leaves it
+    to be dropped when it reaches the top (or when cancelled jobs make up half the heap).
+    Every job due at wakeup is fired at once, each in its own task.
+    """
+
+    def __init__(self):
+        self.heap: list[ScheduledJob] = []
+        self.jobs: dict[Hashable, ScheduledJob] = {}
+        self.seq = itertools.count()
+        self.cancelled = 0
+        self.wakeup = asyncio.Event()
+        self.runner: asyncio.Task[None] | None = None
+        self.running: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self.heap) - self.cancelled
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.jobs
+
+    def schedule(
+        self,
+        when: datetime | float,
+        callback: Callable[[], Awaitable[Any] | Any],
+        key: Hashable | None = None,
+    ) -> ScheduledJob:
+        """Schedules ``callback`` at ``when``, replacing any job with the same ``key``"""
+        if key is not None:
+            self.cancel(key)
+
+        timestamp = when.timestamp() if isinstance(when, datetime) else when
+        job = ScheduledJob(timestamp, next(self.seq), callback, key)
+        heapq.heappush(self.heap, job)
+        if key is not None:
+            self.jobs[key] = job
+
+        if self.heap[0] is job:
+            self.wakeup.set()
+        if self.runner is None or self.runner.done():
+            self.runner = asyncio.create_task(self.run())
+
+        return job
+
+    def schedule_in(
+        self,
+        delay: float,
+        callback: Callable[[], Awaitable[Any] | Any],
+        key: Hashable | None = None,
+    ) -> ScheduledJob:
+        return self.schedule(time.time() + delay, callback, key)
+
+    def cancel(self, job: ScheduledJob | Hashable) -> bool:
+        if not isinstance(job, ScheduledJob):
+            job = self.jobs.get(job)
+        if job is None or job.cancelled:
+            return False
+
+        job.cancelled = True
+        self.cancelled += 1
+        if job.key is not None and self.jobs.get(job.key) is job:
+            del self.jobs[job.key]
+
+        if self.cancelled > len(self.heap) // 2:
+            self.heap = [j for j in self.heap if not j.cancelled]
+            heapq.heapify(self.heap)
+            self.cancelled = 0
+
+        return True
+
+    def pop_due(self, now: float) -> list[ScheduledJob]:
+        due: list[ScheduledJob] = []
+        while self.heap and (self.heap[0].cancelled or self.heap[0].when <= now):
+            job = heapq.heappop(self.heap)
+            if job.cancelled:
+                self.cancelled -= 1
+                continue
+            if job.key is not None and self.jobs.get(job.key) is job:
+                del self.jobs[job.key]
+            due.append(job)
+        return due
+
+    async def run(self):
+        while True:
+            self.wakeup.clear()
+            now = time.time()
+            for job in self.pop_due(now):
+                task = asyncio.create_task(self.fire(job))
+                self.running.add(task)
+                task.add_done_callback(self.running.discard)
+
+            timeout = self.heap[0].when - now if self.heap else None
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self.wakeup.wait(), timeout)
+
+    async def fire(self, job: ScheduledJob):
+        try:
+            result = job.callback()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.exception(e)
+
+
+@cache
+def get_scheduler() -> Scheduler:
+    return Scheduler()
@@ -34,7 +34,7 @@ from nanachan.discord.views import (
     RefreshableButton,
     RefreshableSelect,
 )
-from nanachan.nanapi.client import Error, get_nanapi
+from nanachan.nanapi.client import Error, batch, fail_fast, get_nanapi
 from nanachan.nanapi.model import (
     BulkUpdateWaifusBody,
     CEdgeSelectFilterCharaResult,
@@ -77,7 +77,6 @@ class WaifuDropReactionListener(ReactionListener):
     async def add_reactions(self):
         await super().add_reactions()
         logger.info(f'starting drop {self}')
-        asyncio.get_running_loop().call_later(WaifuDropReactionListener.timeout, self.unregister)
 
     def unregister(self):
         logger.info(f'unregistering {self}')
@@ -124,12 +123,12 @@ class WaifuSelectorView(CompositeNavigatorView):
             PER_PAGE_SELECTOR * displayed_page : PER_PAGE_SELECTOR * (displayed_page + 1)
         ]
 
-        async with asyncio.TaskGroup() as tg:
+        async with batch(concurrency=None) as b:
             chara_ids = [w.character.id_al for w in displayed_waifus]
-            resp_task = tg.create_task(
+            resp_task = b.submit(
                 get_nanapi().anilist.anilist_get_charas(','.join(map(str, chara_ids)))
             )
-            edge_tasks = [(cid, tg.create_task(WaifuHelper.get_edges(cid))) for cid in chara_ids]
+            edge_tasks = [(cid, b.submit(WaifuHelper.get_edges(cid))) for cid in chara_ids]
 
         resp = await resp_task
         resp = resp.raise_exc()
@@ -670,7 +669,8 @@ async def chara_page(bot: Bot, chara: CharaSelectResult) -> dict[str, Embed]:
 
 def chara_autocomplete(id_al_as_value: bool = False):
     async def autocomplete(interaction: discord.Interaction, current: str):
-        resp = await get_nanapi().anilist.anilist_chara_name_autocomplete(current)
+        with fail_fast():
+            resp = await get_nanapi().anilist.anilist_chara_name_autocomplete(current)
         resp = resp.raise_exc()
         results = resp.result
         choices: list[Choice[str]] = []
@@ -694,7 +694,8 @@ def chara_autocomplete(id_al_as_value: bool = False):
 def collection_autocomplete():
     async def autocomplete(interaction: discord.Interaction, current: str):
         bot = interaction.client
-        resp = await get_nanapi().waicolle.waicolle_collection_name_autocomplete(current)
+        with fail_fast():
+            resp = await get_nanapi().waicolle.waicolle_collection_name_autocomplete(current)
         resp = resp.raise_exc()
         results = resp.result
         return [
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
+import ast
 import asyncio
+import subprocess
 from pathlib import Path
 
 from mahou.parsers.openapi import OpenAPIParser
@@ -10,6 +12,138 @@ import nanachan.nanapi
 from nanachan.settings import NANAPI_URL
 from nanachan.utils.misc import get_session
 
+MODEL_CONFIG = 'model_config = ConfigDict(populate_by_name=True)'
+DEFERRED_MODEL_CONFIG = 'model_config = ConfigDict(populate_by_name=True, defer_build=True)'
+
+
+def defer_models(source: str) -> str:
+    """Models build their validators on first use instead of at import time"""
+    return source.replace(MODEL_CONFIG, DEFERRED_MODEL_CONFIG)
+
+
+def used_names(nodes: list[ast.stmt]) -> set[str]:
+    return {n.id for node in nodes for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def filter_imports(imports: list[ast.Import | ast.ImportFrom], names: set[str]) -> list[str]:
+    lines: list[str] = []
+    for node in imports:
+        aliases = [a for a in node.names if (a.asname or a.name).split('.')[0] in names]
+        if not aliases:
+            continue
+        if isinstance(node, ast.ImportFrom):
+            filtered = ast.ImportFrom(module=node.module, names=aliases, level=node.level)
+        else:
+            filtered = ast.Import(names=aliases)
+        lines.append(ast.unparse(filtered))
+    return lines
+
+
+def split_client(source: str) -> dict[str, str]:
+    """Splits the generated client into one module per API group.
+
+    ``_client.py`` keeps the shared helpers and a ``ClientSession`` whose group
+    attributes import their ``_client_<group>.py`` module on first access.
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines()
+
+    def segment(node: ast.stmt) -> str:
+        start = node.lineno
+        if (
+            isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef)
+            and node.decorator_list
+        ):
+            start = node.decorator_list[0].lineno
+        start -= 1
+        assert node.end_lineno is not None
+        return '\n'.join(lines[start : node.end_lineno])
+
+    imports: list[ast.Import | ast.ImportFrom] = [
+        n for n in tree.body if isinstance(n, ast.Import | ast.ImportFrom)
+    ]
+    groups = [n for n in tree.body if isinstance(n, ast.ClassDef) and n.name.endswith('Module')]
+    helpers = [
+        n
+        for n in tree.body
+        if n not in imports
+        and n not in groups
+        and not (isinstance(n, ast.ClassDef) and n.name == 'ClientSession')
+        and not (isinstance(n, ast.FunctionDef) and n.name == 'get_session')
+    ]
+    helper_names = {n.name for n in helpers if isinstance(n, (ast.ClassDef, ast.FunctionDef))}
+
+    files: dict[str, str] = {}
+    attrs: list[tuple[str, str]] = []
+    for cls in groups:
+        group = cls.name.removesuffix('Module').lower()
+        attrs.append((group, cls.name))
+        names = used_names([cls])
+        shared = sorted(names & helper_names)
+        parts = [
+            '\n'.join(filter_imports(imports, names | {'TYPE_CHECKING'})),
+            '\n'.join(
+                [
+                    f'from ._client import {", ".join(shared)}',
+                    'if TYPE_CHECKING:',
+                    '    from ._client import ClientSession',
+                ]
+            ),
+            segment(cls),
+        ]
+        files[f'_client_{group}.py'] = 'from typing import TYPE_CHECKING\n' + '\n\n\n'.join(parts)
+
+    properties = '\n\n'.join(
+        f"""    @cached_property
+    def {group}(self) -> '{name}':
+        from ._client_{group} import {name}
+
+        return {name}(self, self.server_url)"""
+        for group, name in attrs
+    )
+    type_imports = '\n'.join(f'    from ._client_{g} import {n}' for g, n in attrs)
+    lazy_classes = '\n'.join(f"    '{n}': '_client_{g}'," for g, n in attrs)
+    tail = f"""_GROUP_MODULES = {{
+{lazy_classes}
+}}
+
+
+def __getattr__(name: str):
+    if name in _GROUP_MODULES:
+        module = importlib.import_module(f'.{{_GROUP_MODULES[name]}}', __package__)
+        return getattr(module, name)
+    raise AttributeError(f'module {{__name__!r}} has no attribute {{name!r}}')
+
+
+class ClientSession(aiohttp.ClientSession):
+    def __init__(self, server_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.server_url = server_url
+
+{properties}
+
+
+def get_session(
+    server_url: str, *, json_serialize: Callable[[Any], str] = default_json_serializer, **kwargs
+) -> ClientSession:
+    return ClientSession(server_url, json_serialize=json_serialize, **kwargs)
+"""
+    body = '\n\n\n'.join(segment(n) for n in helpers)
+    names = used_names(helpers) | {'aiohttp', 'Any', 'Callable'}
+    header = '\n'.join(
+        [
+            'import importlib',
+            'from functools import cached_property',
+            'from typing import TYPE_CHECKING',
+            *filter_imports(imports, names),
+            '',
+            'if TYPE_CHECKING:',
+            type_imports,
+        ]
+    )
+    files['_client.py'] = f'{header}\n\n\n{body}\n\n\n{tail}'
+    return files
+
 
 async def main():
     module = Path(nanachan.nanapi.__file__).parent
@@ -24,12 +158,18 @@ async def main():
     model_serializer = OpenAPIModelSerializer()
     data = model_serializer.serialize(list(server.schemas.values()))
     with open(module / 'model.py', 'w') as f:
-        f.write(data)
+        f.write(defer_models(data))
 
     client_serializer = OpenAPIaiohttpClientSerializer()
-    model = client_serializer.serialize(server)
-    with open(module / '_client.py', 'w') as f:
-        f.write(model)
+    client = client_serializer.serialize(server)
+    for old in module.glob('_client_*.py'):
+        old.unlink()
+    for filename, source in split_client(client).items():
+        with open(module / filename, 'w') as f:
+            f.write(source)
+
+    subprocess.run(['ruff', 'check', '--select', 'I', '--fix', '-q', str(module)], check=True)
+    subprocess.run(['ruff', 'format', '-q', str(module)], check=True)
 
 
 if __name__ == '__main__':
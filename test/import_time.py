@@ -0,0 +1,66 @@
+"""Cold import time of the nanapi client and of each extension.
+
+Every measurement runs in a fresh interpreter, so nothing is shared between targets.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+main_dir = Path(__file__).parent.parent.absolute()
+
+SNIPPET = """
+import time
+import aiohttp, pydantic
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+TARGETS = {
+    'nanapi.model': 'import nanachan.nanapi.model',
+    'nanapi.client': 'import nanachan.nanapi.client',
+    # what the first get_nanapi().<group> access adds on top of the client
+    'nanapi.client + waicolle': 'import nanachan.nanapi.client, nanachan.nanapi._client_waicolle',
+    'nanapi.client + all groups': (
+        'import importlib, nanachan.nanapi.client\n'
+        'from nanachan.nanapi._client import _GROUP_MODULES\n'
+        'for m in _GROUP_MODULES.values(): importlib.import_module(f"nanachan.nanapi.{m}")'
+    ),
+    'discord.bot': 'import nanachan.discord.bot',
+}
+TARGETS.update(
+    (f'extensions.{p.stem}', f'import nanachan.extensions.{p.stem}')
+    for p in sorted((main_dir / 'nanachan' / 'extensions').glob('[!_]*.py'))
+)
+
+
+def measure(code: str) -> float:
+    out = subprocess.run(
+        [sys.executable, '-c', SNIPPET.format(code=code)],
+        cwd=main_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('targets', nargs='*', default=list(TARGETS))
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'{"target":<30} {"best (ms)":>10} {"median (ms)":>12}')
+    for name in args.targets:
+        timings = [measure(TARGETS[name]) for _ in range(args.runs)]
+        best = min(timings) * 1000
+        median = statistics.median(timings) * 1000
+        print(f'{name:<30} {best:>10.1f} {median:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
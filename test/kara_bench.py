@@ -0,0 +1,117 @@
+"""Karaoke index benchmark on a synthetic library.
+
+Generates ``--karas`` subtitle files (with their media) under a temporary directory, then
+times the cold index build, an unchanged rescan, a single-file update and a few searches.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+main_dir = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(main_dir))
+
+from nanachan.utils.karaoke import KaraIndex  # noqa: E402
+
+TIMERS = ['Alice', 'Bob', 'Chloé', 'Dominique', 'Eiji', 'Fumiko', 'Gaspard']
+SYLLABLES = ['ka', 'ra', 'o', 'ke', 'a', 'i', 'shi', 'te', 'ru', 'yo', 'mi', 'na', 'to', 'ko']
+
+ASS_HEADER = """[Script Info]
+; Script generated by kara_bench.py
+Original Timing: {timer}
+ScriptType: v4.00+
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+"""
+ASS_LINE = 'Dialogue: 0,0:{m:02d}:{s:02d}.00,0:{m:02d}:{s2:02d}.00,Default,,0,0,0,karaoke,{text}\n'
+
+
+def word(rng: random.Random) -> str:
+    return ''.join(rng.choices(SYLLABLES, k=rng.randint(1, 4)))
+
+
+def karaoke_line(rng: random.Random, words: list[str]) -> str:
+    # {\k} tags around every syllable, as in real karaoke timings
+    return ' '.join(f'{{\\k{rng.randint(5, 60)}}}{w}' for w in words)
+
+
+def generate_library(base: Path, count: int, seed: int = 7) -> list[tuple[str, str]]:
+    """Writes the synthetic karas and returns (name, lyric line) samples"""
+    rng = random.Random(seed)
+    samples: list[tuple[str, str]] = []
+    for i in range(count):
+        directory = base / rng.choice(['Anime', 'Cartoon', 'Game', 'Live']) / f'{i // 100:03d}'
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f'{" ".join(word(rng) for _ in range(3))} - OP{i}'
+
+        lines: list[str] = []
+        for n in range(rng.randint(20, 60)):
+            words = [word(rng) for _ in range(rng.randint(3, 8))]
+            text = karaoke_line(rng, words)
+            m, s = divmod(n * 4, 60)
+            lines.append(ASS_LINE.format(m=m, s=s, s2=min(s + 3, 59), text=text))
+            if n == 10:
+                samples.append((name, ' '.join(words)))
+        # karaoke files repeat their lines for the fx layer
+        content = ASS_HEADER.format(timer=rng.choice(TIMERS)) + ''.join(lines) * 2
+
+        (directory / f'{name}.ass').write_text(content)
+        (directory / f'{name}.mkv').write_bytes(b'')
+    return samples
+
+
+def timed(label: str, func, *args, runs: int = 1):
+    timings: list[float] = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    print(f'{label:<40} {min(timings) * 1000:>10.1f} {statistics.median(timings) * 1000:>12.1f}')
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--karas', type=int, default=3000)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp) / 'karas'
+        start = time.perf_counter()
+        samples = generate_library(base, args.karas)
+        print(f'generated {args.karas} karas in {time.perf_counter() - start:.1f}s')
+
+        index = KaraIndex(base, Path(tmp) / 'index.sqlite3')
+        index.open()
+        print(f'{"operation":<40} {"best (ms)":>10} {"median (ms)":>12}')
+        timed('cold build', index.scan)
+        timed('unchanged rescan', index.scan)
+
+        touched = next(base.rglob('*.ass'))
+        touched.write_text(touched.read_text() + ASS_LINE.format(m=0, s=0, s2=1, text='x'))
+        timed('single file update', index.update, [str(touched)])
+
+        timed('leaderboard', index.karas_by_timers, runs=args.runs)
+        timed('timer mtimes', index.timer_mtimes, TIMERS[0], runs=args.runs)
+
+        name, lyric = samples[len(samples) // 2]
+        snippet = ' '.join(lyric.split()[1:4])
+        found = timed('lyrics search', index.search, snippet, runs=args.runs)
+        assert found is not None and name in [k.name for k in found], 'snippet not found'
+        timed('title search', index.search, name.split(' - ')[0], runs=args.runs)
+        timed('unfinished snippet search', index.search, snippet[:-1], runs=args.runs)
+        timed('no match search', index.search, 'zzzzzz', runs=args.runs)
+        timed('file name regex', index.find, 'OP1.*', runs=args.runs)
+
+        index.close()
+
+
+if __name__ == '__main__':
+    main()
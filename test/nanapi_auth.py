@@ -0,0 +1,101 @@
+import asyncio
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from aiohttp import web
+
+main_dir = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(main_dir))
+
+from nanachan.nanapi import client  # noqa: E402
+from nanachan.utils.scheduler import get_scheduler  # noqa: E402
+
+TOKEN_LIFETIME = 4
+
+
+def make_token(lifetime: float) -> str:
+    def b64(d: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(d).encode()).decode().rstrip('=')
+
+    header = b64({'alg': 'none', 'typ': 'JWT'})
+    payload = b64({'sub': 'nanachan', 'exp': time.time() + lifetime, 'jti': str(uuid4())})
+    return f'{header}.{payload}.'
+
+
+class StubNanapi:
+    def __init__(self):
+        self.valid_tokens: set[str] = set()
+        self.logins = 0
+        self.unauthorized = 0
+        self.requests = 0
+
+    async def login(self, request: web.Request):
+        self.logins += 1
+        await asyncio.sleep(0.2)
+        token = make_token(TOKEN_LIFETIME)
+        self.valid_tokens.add(token)
+        return web.json_response({'access_token': token, 'token_type': 'bearer'}, status=201)
+
+    async def whoami(self, request: web.Request):
+        self.requests += 1
+        token = request.headers.get('Authorization', '').removeprefix('Bearer ')
+        expiry = client.token_expiry(token)
+        if token not in self.valid_tokens or expiry is None or expiry < time.time():
+            self.unauthorized += 1
+            return web.json_response({'detail': 'Not authenticated'}, status=401)
+        return web.json_response({'id': str(uuid4()), 'username': 'nanachan'})
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post('/clients/token', self.login)
+        app.router.add_get('/clients/', self.whoami)
+        return app
+
+
+async def burst(n: int):
+    results = await asyncio.gather(*(client.get_nanapi().client.client_whoami() for _ in range(n)))
+    return sum(client.success(r) for r in results)
+
+
+async def main():
+    stub = StubNanapi()
+    runner = web.AppRunner(stub.app())
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    client.NANAPI_URL = f'http://127.0.0.1:{port}'
+    client.TOKEN_REFRESH_MARGIN = 1
+
+    try:
+        ok = await burst(20)
+        print(f'cold start: {ok}/20 ok, {stub.logins} login(s), {stub.unauthorized} 401(s)')
+        assert stub.logins == 1
+
+        # outlive the first token, the proactive refresh should have replaced it
+        await asyncio.sleep(TOKEN_LIFETIME + 1)
+        ok = await burst(20)
+        print(f'after expiry: {ok}/20 ok, {stub.logins} login(s), {stub.unauthorized} 401(s)')
+        assert stub.unauthorized == 0
+
+        # revoked token, concurrent 401s must share a single login
+        logins = stub.logins
+        stub.valid_tokens.clear()
+        ok = await burst(20)
+        print(f'revoked: {ok}/20 ok, {stub.logins - logins} login(s), {stub.unauthorized} 401(s)')
+        assert ok == 20
+        assert stub.logins - logins == 1
+    finally:
+        get_scheduler().cancel('nanapi_token_refresh')
+        await client.get_nanapi().close()
+        await client.get_login_session().close()
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,192 @@
+"""Offline benchmarks of nanapi-heavy code paths.
+
+Drives real cog code against the stub nanapi with fake Discord objects, and reports the
+number of requests and the wall-clock latency of each scenario. A jump in request count
+is usually an N+1 regression.
+"""
+
+import argparse
+import asyncio
+import itertools
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+from discord.utils import utcnow
+
+main_dir = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(main_dir))
+sys.path.insert(0, str(main_dir / 'test'))
+
+from nanapi_stub import StubNanapi  # noqa: E402
+
+from nanachan.nanapi import client  # noqa: E402
+
+# fresh authors so that nanachan.settings.is_spam never kicks in between runs
+author_ids = itertools.count(1000)
+
+
+def fake_user(user_id: int = 1) -> MagicMock:
+    user = MagicMock(spec=discord.Member, name=f'user{user_id}')
+    user.id = user_id
+    user.bot = False
+    user.mention = f'<@{user_id}>'
+    user.display_name = f'user{user_id}'
+    user.configure_mock(**{'__str__.return_value': f'user{user_id}'})
+    return user
+
+
+def fake_emoji_str(name: str) -> str:
+    return f':{name}:'
+
+
+def fake_bot() -> MagicMock:
+    bot = MagicMock(name='bot')
+    bot.get_emoji_str.side_effect = fake_emoji_str
+    bot.get_nana_emoji.return_value = None
+    bot.get_user.side_effect = fake_user
+    # keeps background loops (purge_task, ...) parked instead of hitting nanapi
+    bot.wait_until_ready = AsyncMock(side_effect=asyncio.Event().wait)
+    return bot
+
+
+def fake_channel() -> MagicMock:
+    channel = MagicMock(spec=discord.TextChannel, name='channel')
+    channel.id = 1
+    channel.nsfw = False
+    channel.send = AsyncMock(return_value=fake_message())
+    return channel
+
+
+def fake_reply(*args: Any, **kwargs: Any) -> MagicMock:
+    return fake_message()
+
+
+def fake_message() -> MagicMock:
+    message = MagicMock(spec=discord.Message, name='message')
+    message.id = 1
+    message.created_at = utcnow()
+    message.content = 'hello'
+    message.reply = AsyncMock(side_effect=fake_reply)
+    message.add_reaction = AsyncMock()
+    return message
+
+
+def fake_context(author: MagicMock) -> MagicMock:
+    ctx = MagicMock(name='ctx')
+    ctx.author = author
+    ctx.channel = fake_channel()
+    ctx.guild.id = 1
+    ctx.command = None
+    ctx.will_delete = False
+    ctx.bananased = False
+    ctx.message = fake_message()
+    ctx.reply = AsyncMock(return_value=fake_message())
+    ctx.send = ctx.reply
+    return ctx
+
+
+async def scenario_on_user_message(bot: MagicMock):
+    from nanachan.extensions.waicolle import WaifuCollection
+
+    cog = WaifuCollection(bot)
+    cog.next_drop[1] = 10**9
+    try:
+        for _ in range(10):
+            await cog.on_user_message(fake_context(fake_user(next(author_ids))))
+    finally:
+        cog.purge_task.cancel()
+
+
+async def scenario_waifu_list(bot: MagicMock):
+    from nanachan.extensions.waicolle import WaifuCollection
+
+    cog = WaifuCollection(bot)
+    try:
+        slash_list = WaifuCollection.slash_list.callback.__wrapped__  # pyright: ignore
+        await slash_list(cog, fake_context(fake_user()), WaifuCollection.ListChoice.full)
+    finally:
+        cog.purge_task.cancel()
+
+
+async def scenario_drop_alert(bot: MagicMock):
+    from nanachan.extensions.waicolle import WaifuCollection
+
+    cog = WaifuCollection(bot)
+    try:
+        resp = await client.get_nanapi().waicolle.waicolle_get_waifus()
+        waifus = resp.raise_exc().result
+        await cog.drop_alert(fake_user(), waifus, 'Benchmark', messageable=fake_channel())
+    finally:
+        cog.purge_task.cancel()
+
+
+async def scenario_slash_track_list(bot: MagicMock):
+    from nanachan.extensions.waicolle import WaifuCollection
+
+    cog = WaifuCollection(bot)
+    try:
+        track_list = WaifuCollection.slash_track_list.callback.__wrapped__  # pyright: ignore
+        await track_list(cog, fake_context(fake_user()))
+    finally:
+        cog.purge_task.cancel()
+
+
+SCENARIOS: dict[str, Callable[[MagicMock], Awaitable[None]]] = {
+    'on_user_message': scenario_on_user_message,
+    'waifu_list': scenario_waifu_list,
+    'drop_alert': scenario_drop_alert,
+    'slash_track_list': scenario_slash_track_list,
+}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('scenarios', nargs='*', default=list(SCENARIOS))
+    parser.add_argument('--fixtures', type=Path, default=main_dir / 'test' / 'fixtures')
+    parser.add_argument('--latency', type=float, default=0.005)
+    parser.add_argument('--jitter', type=float, default=0.005)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    stub = StubNanapi(
+        fixtures=args.fixtures,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+    )
+    client.NANAPI_URL = await stub.start()
+
+    try:
+        # warm up the login and the connection pool
+        await client.get_nanapi().client.client_whoami()
+        await stub.settle()
+
+        print(f'{"scenario":<20} {"requests":>8} {"best (ms)":>10} {"mean (ms)":>10}')
+        for name in args.scenarios:
+            timings: list[float] = []
+            for _ in range(args.runs):
+                stub.reset()
+                start = time.perf_counter()
+                await SCENARIOS[name](fake_bot())
+                await stub.settle()
+                # settle() returns once the stub has been idle for its quiet window
+                timings.append(time.perf_counter() - start - 0.05)
+            best = min(timings) * 1000
+            mean = sum(timings) / len(timings) * 1000
+            print(f'{name:<20} {stub.total:>8} {best:>10.1f} {mean:>10.1f}')
+            for operation, count in stub.counts.most_common():
+                print(f'    {operation:<56} {count:>4}')
+    finally:
+        await client.get_nanapi().close()
+        await client.get_login_session().close()
+        await stub.stop()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
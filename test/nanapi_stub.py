@@ -0,0 +1,301 @@
+"""Local stand-in for nanapi.
+
+Routes are read from the generated client modules, every operation answers with its recorded
+fixture when there is one and with a body synthesized from its pydantic return type
+otherwise. Run it standalone and point ``NANAPI_URL`` at it, or start it from a script
+(see ``nanapi_bench.py``).
+"""
+
+import argparse
+import ast
+import asyncio
+import importlib
+import json
+import random
+import sys
+import time
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from datetime import date, datetime
+from datetime import time as dt_time
+from enum import Enum
+from pathlib import Path
+from types import NoneType, UnionType
+from typing import Any, Literal, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+from aiohttp import ClientSession, web
+from pydantic import BaseModel
+
+main_dir = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(main_dir))
+
+from nanachan.nanapi import _client  # noqa: E402
+
+CLIENT_DIR = Path(_client.__file__).parent
+HTTP_VERBS = {'get', 'post', 'put', 'patch', 'delete'}
+SYNTH_UUID = UUID(int=1)
+SYNTH_LIST_SIZE = 3
+
+
+class Operation:
+    def __init__(self, name: str, method: str, path: str, status: int, result_type: Any):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.status = status
+        self.result_type = result_type
+
+
+def load_operations() -> list[Operation]:
+    operations: list[Operation] = []
+    for source in sorted(CLIENT_DIR.glob('_client_*.py')):
+        operations.extend(load_group_operations(source))
+
+    # static segments must win over placeholders when both match
+    operations.sort(key=lambda op: op.path.count('{'))
+    return operations
+
+
+def load_group_operations(source: Path) -> list[Operation]:
+    tree = ast.parse(source.read_text())
+    group = importlib.import_module(f'{_client.__package__}.{source.stem}')
+    operations: list[Operation] = []
+
+    for cls in tree.body:
+        if not isinstance(cls, ast.ClassDef) or not cls.name.endswith('Module'):
+            continue
+
+        module = getattr(group, cls.name)
+        for func in cls.body:
+            if not isinstance(func, ast.AsyncFunctionDef):
+                continue
+
+            path = method = None
+            for node in ast.walk(func):
+                if (
+                    isinstance(node, ast.Assign)
+                    and isinstance(node.targets[0], ast.Name)
+                    and node.targets[0].id == 'url'
+                    and isinstance(node.value, ast.JoinedStr)
+                ):
+                    path = ''
+                    for part in node.value.values:
+                        if isinstance(part, ast.Constant) and isinstance(part.value, str):
+                            path += part.value
+                        elif (
+                            isinstance(part, ast.FormattedValue)
+                            and ast.unparse(part.value) != 'self.server_url'
+                        ):
+                            path += f'{{{ast.unparse(part.value)}}}'
+                elif (
+                    isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Attribute)
+                    and node.func.attr in HTTP_VERBS
+                    and ast.unparse(node.func.value) == 'self.session'
+                ):
+                    method = node.func.attr.upper()
+
+            if path is None or method is None:
+                continue
+
+            status, result_type = success_type(getattr(module, func.name))
+            operations.append(Operation(func.name, method, path, status, result_type))
+
+    return operations
+
+
+def success_type(method: Any) -> tuple[int, Any]:
+    hint = get_type_hints(method)['return']
+    successes: list[tuple[int, Any]] = []
+    for variant in get_args(hint):
+        if get_origin(variant) is _client.Success:
+            code, result_type = get_args(variant)
+            successes.append((get_args(code)[0], result_type))
+    return min(successes, key=lambda s: s[0])
+
+
+def synthesize(tp: Any, name: str = '') -> Any:
+    origin = get_origin(tp)
+    args = get_args(tp)
+
+    if tp is NoneType or tp is None:
+        return None
+    if origin in (Union, UnionType):
+        non_none = [a for a in args if a is not NoneType]
+        return synthesize(non_none[0], name) if non_none else None
+    if origin is Literal:
+        return args[0]
+    if origin in (dict, Mapping):
+        return {}
+    if origin in (list, set, tuple, Sequence):
+        return [synthesize(args[0], name) for _ in range(SYNTH_LIST_SIZE)] if args else []
+    if tp is Any:
+        return None
+    if isinstance(tp, type):
+        if issubclass(tp, BaseModel):
+            # resolves the quoted forward references of the generated models
+            hints = get_type_hints(tp)
+            return {
+                field.alias or field_name: synthesize(hints[field_name], field_name)
+                for field_name, field in tp.model_fields.items()
+            }
+        if issubclass(tp, Enum):
+            return next(iter(tp)).value
+        if issubclass(tp, bool):
+            return False
+        if issubclass(tp, int):
+            return 1
+        if issubclass(tp, float):
+            return 1.0
+        if issubclass(tp, str):
+            # most string fields are snowflakes the bot casts back to int
+            return '1' if name.endswith('id') else name or 'nanachan'
+        if issubclass(tp, UUID):
+            return str(SYNTH_UUID)
+        if issubclass(tp, datetime):
+            return datetime.now().astimezone().isoformat()
+        if issubclass(tp, date):
+            return date.today().isoformat()
+        if issubclass(tp, dt_time):
+            return dt_time().isoformat()
+    return None
+
+
+class StubNanapi:
+    def __init__(
+        self,
+        fixtures: Path | None = None,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        record_from: str | None = None,
+    ):
+        self.fixtures = fixtures
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.record_from = record_from
+        self.operations = load_operations()
+        self.counts: Counter[str] = Counter()
+        self.inflight = 0
+        self.last_activity = time.monotonic()
+        self._runner: web.AppRunner | None = None
+        self._upstream: ClientSession | None = None
+
+    @property
+    def total(self) -> int:
+        return self.counts.total()
+
+    def reset(self):
+        self.counts.clear()
+
+    def fixture_path(self, operation: Operation) -> Path | None:
+        if self.fixtures is None:
+            return None
+        return self.fixtures / f'{operation.name}.json'
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        for operation in self.operations:
+            app.router.add_route(operation.method, operation.path, self.handler(operation))
+        return app
+
+    def handler(self, operation: Operation):
+        async def handle(request: web.Request) -> web.StreamResponse:
+            self.counts[operation.name] += 1
+            self.inflight += 1
+            try:
+                if self.latency or self.jitter:
+                    await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+
+                if random.random() < self.error_rate:
+                    return web.Response(status=502, text='Bad Gateway')
+
+                if self.record_from is not None:
+                    return await self.record(operation, request)
+
+                path = self.fixture_path(operation)
+                if path is not None and path.exists():
+                    fixture = json.loads(path.read_text())
+                    return web.json_response(fixture['body'], status=fixture['status'])
+
+                if operation.result_type is NoneType:
+                    return web.Response(status=operation.status)
+                return web.json_response(
+                    synthesize(operation.result_type), status=operation.status
+                )
+            finally:
+                self.inflight -= 1
+                self.last_activity = time.monotonic()
+
+        return handle
+
+    async def record(self, operation: Operation, request: web.Request) -> web.StreamResponse:
+        assert self.record_from is not None
+        if self._upstream is None:
+            self._upstream = ClientSession()
+
+        headers = {k: v for k, v in request.headers.items() if k.lower() != 'host'}
+        async with self._upstream.request(
+            request.method,
+            f'{self.record_from}{request.rel_url}',
+            headers=headers,
+            data=await request.read(),
+        ) as resp:
+            raw = await resp.read()
+            content_type = resp.headers.get('Content-Type', '')
+
+        path = self.fixture_path(operation)
+        if path is not None and 'json' in content_type and resp.status < 300:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({'status': resp.status, 'body': json.loads(raw)}))
+
+        return web.Response(status=resp.status, body=raw, content_type=content_type or None)
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        host, port, *_ = self._runner.addresses[0]
+        return f'http://{host}:{port}'
+
+    async def stop(self):
+        if self._upstream is not None:
+            await self._upstream.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def settle(self, quiet: float = 0.05):
+        """Waits until no request has been in flight for ``quiet`` seconds"""
+        while self.inflight or time.monotonic() - self.last_activity < quiet:
+            await asyncio.sleep(quiet / 5)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--port', type=int, default=8042)
+    parser.add_argument('--fixtures', type=Path)
+    parser.add_argument('--latency', type=float, default=0)
+    parser.add_argument('--jitter', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--record-from', help='upstream nanapi to proxy and record from')
+    args = parser.parse_args()
+
+    stub = StubNanapi(
+        fixtures=args.fixtures,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        record_from=args.record_from,
+    )
+    url = await stub.start(port=args.port)
+    print(f'stub nanapi listening on {url} ({len(stub.operations)} operations)')
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await stub.stop()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
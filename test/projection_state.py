@@ -0,0 +1,60 @@
+"""Participant tracking of ProjectionState, against a mocked nanapi"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+main_dir = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(main_dir))
+
+from nanachan.nanapi.model import ProjoSelectResult  # noqa: E402
+from nanachan.utils import projection  # noqa: E402
+from nanachan.utils.projection import ProjectionState  # noqa: E402
+from nanachan.utils.scheduler import get_scheduler  # noqa: E402
+
+THREAD_ID = 1
+
+
+def fake_projo(participant_ids: list[int]) -> ProjoSelectResult:
+    participants = [MagicMock(discord_id=str(i)) for i in participant_ids]
+    return ProjoSelectResult.model_construct(
+        id=uuid4(), channel_id=str(THREAD_ID), message_id='2', participants=participants
+    )
+
+
+def fake_user(user_id: int) -> MagicMock:
+    user = MagicMock(name=f'user{user_id}')
+    user.id = user_id
+    return user
+
+
+async def join_on_unsynced_thread():
+    state = ProjectionState(MagicMock(name='bot'))
+    state.load([fake_projo([10, 11])])
+    await state.add_participant(THREAD_ID, fake_user(12))
+    assert state.members[THREAD_ID] == {10, 11, 12}, state.members
+
+
+async def leave_on_unsynced_thread():
+    state = ProjectionState(MagicMock(name='bot'))
+    state.load([fake_projo([10, 11])])
+    await state.remove_participant(THREAD_ID, fake_user(11))
+    assert state.members[THREAD_ID] == {10}, state.members
+
+
+async def main():
+    nanapi = MagicMock(name='nanapi')
+    endpoints = nanapi.projection
+    endpoints.projection_add_projection_participant = AsyncMock(return_value=MagicMock())
+    endpoints.projection_remove_projection_participant = AsyncMock(return_value=MagicMock())
+    with patch.object(projection, 'get_nanapi', return_value=nanapi):
+        for test in (join_on_unsynced_thread, leave_on_unsynced_thread):
+            await test()
+            get_scheduler().cancel(('projo_embed', THREAD_ID))
+            print(f'{test.__name__}: ok')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())